@@ -0,0 +1,95 @@
+"""
+Compares the naive enemy x fireball loop against the SpatialHash broadphase,
+bucketed and over a plain rect list, and against what `rebuild` picks.
+
+Run from the repository root:
+    python -m benchmarks.broadphase
+"""
+
+import random
+import time
+
+import pygame
+
+from devex.spatial import SpatialHash
+
+WORLD_SIZE = 4000, 3000
+N_ENEMIES = 15, 42, 60, 200, 400
+FRAMES = 60
+
+
+class Body:
+    def __init__(self, size: int) -> None:
+        self.rect = pygame.Rect(
+            random.randrange(WORLD_SIZE[0]), random.randrange(WORLD_SIZE[1]), size, size
+        )
+
+
+def naive(enemies, fireballs) -> int:
+    hits = 0
+    for enemy in enemies:
+        for fireball in fireballs:
+            if fireball.rect.colliderect(enemy.rect):
+                hits += 1
+    return hits
+
+
+def broadphase(grid: SpatialHash, enemies, fireballs) -> int:
+    grid.rebuild(fireballs)
+    hits = 0
+    for enemy in enemies:
+        for fireball in grid.query(enemy.rect):
+            if fireball.rect.colliderect(enemy.rect):
+                hits += 1
+    return hits
+
+
+def rect_list(enemies, fireballs) -> int:
+    rects = [fireball.rect for fireball in fireballs]
+    hits = 0
+    for enemy in enemies:
+        hits += len(enemy.rect.collidelistall(rects))
+    return hits
+
+
+def picked(grid: SpatialHash, enemies, fireballs) -> int:
+    grid.rebuild(fireballs, n_queries=len(enemies))
+    hits = 0
+    for enemy in enemies:
+        hits += len(grid.colliding(enemy.rect))
+    return hits
+
+
+def measure(func, *args) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        hits = func(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000, hits
+
+
+def main():
+    random.seed(0)
+    grid = SpatialHash()
+
+    print(f"ms per frame averaged over {FRAMES} frames")
+    print(
+        f"{'enemies':>8} {'fireballs':>10} {'naive':>8} {'grid':>8} "
+        f"{'list':>8} {'picked':>8} {'speedup':>8}"
+    )
+    for n_enemies in N_ENEMIES:
+        enemies = [Body(48) for _ in range(n_enemies)]
+        for n_fireballs in (10, 50, 100, 250, 500, 1000):
+            fireballs = [Body(48) for _ in range(n_fireballs)]
+            naive_ms, naive_hits = measure(naive, enemies, fireballs)
+            grid_ms, grid_hits = measure(broadphase, grid, enemies, fireballs)
+            list_ms, list_hits = measure(rect_list, enemies, fireballs)
+            picked_ms, picked_hits = measure(picked, grid, enemies, fireballs)
+            assert naive_hits == grid_hits == list_hits == picked_hits
+            print(
+                f"{n_enemies:>8} {n_fireballs:>10} {naive_ms:>8.3f} {grid_ms:>8.3f} "
+                f"{list_ms:>8.3f} {picked_ms:>8.3f} {naive_ms / picked_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Frame-time benchmarks over canned game scenarios, run headless.
+
+Run from the repository root:
+    python -m benchmarks.scenarios --out results.json
+    python -m benchmarks.scenarios --baseline results.json
+
+Update and draw are timed separately for every tick and reported as
+p50/p95/p99 in milliseconds. With --baseline, the run is compared against a
+previous --out file and exits with status 1 if any p95 regressed by more than
+--threshold percent.
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import typing as t
+
+import pygame
+
+from devex.headless import HeadlessGame
+from devex.state_enums import State
+from devex.utils import rng
+
+WARMUP_TICKS = 60
+SETTLE_TICKS = 3000
+
+
+def settle(game: HeadlessGame):
+    """Steps without drawing until every platform has landed"""
+
+    for _ in range(SETTLE_TICKS):
+        if game.shared.plat.done:
+            return
+        game.advance(1, draw=False)
+    raise RuntimeError("platforms did not settle")
+
+
+def grow_platforms(game: HeadlessGame, n_platforms: int):
+    """Lights torches until there are n platforms, all of them settled"""
+
+    plat = game.shared.plat
+    while len(plat.platforms) < n_platforms:
+        settle(game)
+        torch = next(
+            torch for platform in reversed(plat.platforms) for torch in platform.torches
+        )
+        torch.used = True
+        game.advance(1, draw=False)
+    settle(game)
+
+
+def focus_on(game: HeadlessGame, pos: t.Sequence):
+    player = game.shared.player
+    player.pos.update(pos)
+    player.prev_pos.update(pos)
+    player.rect.midbottom = player.pos
+    game.shared.camera.offset.update(
+        pos[0] - game.shared.SCREEN_WIDTH // 2,
+        pos[1] - game.shared.SCREEN_HEIGHT // 2,
+    )
+
+
+def keep_alive(game: HeadlessGame):
+    player = game.shared.player
+    player.health_target_vector.x = player.MAX_HEALTH
+    player.health_vector.x = player.MAX_HEALTH
+    player.health = player.MAX_HEALTH
+
+
+def setup_fresh_platform(game: HeadlessGame):
+    pass
+
+
+def setup_settled_platforms(game: HeadlessGame):
+    grow_platforms(game, game.shared.plat.platforms[0].MAX_PLATFORMS)
+
+
+def setup_final_boss(game: HeadlessGame):
+    grow_platforms(game, game.shared.plat.platforms[0].MAX_PLATFORMS + 1)
+    boss = game.shared.final_boss
+    boss.current_attacks = [boss.spread_fireballs, boss.heavenly_swords]
+    focus_on(game, boss.pos + (150, 0))
+
+
+def tick_final_boss(game: HeadlessGame):
+    boss = game.shared.final_boss
+    boss.healing = False
+    boss.attack_timer.reset()
+
+
+def tick_boss_bullet_hell(game: HeadlessGame):
+    tick_final_boss(game)
+    fireballs = game.shared.final_boss.fireballs
+    # Rings spawned away from the player, who the boss walks into, keep
+    # thousands of fireballs alive
+    center = game.shared.player.pos - (400, 0)
+    for n in range(36):
+        fireballs.add(2 * math.pi * n / 36, center, damage=0, speed=600)
+
+
+def setup_e_attack_ring(game: HeadlessGame):
+    settle(game)
+    attack_info = game.shared.player.e_attack.attack_info
+    attack_info.level = attack_info.max_level
+
+
+def tick_e_attack_ring(game: HeadlessGame):
+    e_attack = game.shared.player.e_attack
+    if not e_attack.active:
+        e_attack.attack_info.used = True
+    elif len(e_attack.fireballs) < e_attack.n_balls:
+        # Keep the ring full, fireballs burn out on the enemies they hit
+        e_attack.fireballs.clear()
+        e_attack.gen_fireballs()
+
+
+def setup_inventory_program(game: HeadlessGame):
+    # Imported late, module level fonts need `pygame.init` from the game
+    from devex.program import Code
+
+    settle(game)
+    shared = game.shared
+    shared.collected_programs.extend(Code(shared.player.pos) for _ in range(6))
+    shared.current_program = shared.collected_programs[0]
+    for enemy_t, values in shared.values.items():
+        values.extend(rng.randrange(100) for _ in range(8))
+    shared.widgets.preview_widgets(pygame.K_i)
+    shared.widgets.preview_widgets(pygame.K_p)
+
+
+# name: (setup, called before every tick)
+SCENARIOS: dict[str, tuple[t.Callable, t.Callable | None]] = {
+    "fresh_platform": (setup_fresh_platform, None),
+    "settled_platforms": (setup_settled_platforms, None),
+    "final_boss": (setup_final_boss, tick_final_boss),
+    "boss_bullet_hell": (setup_final_boss, tick_boss_bullet_hell),
+    "e_attack_ring": (setup_e_attack_ring, tick_e_attack_ring),
+    "inventory_program": (setup_inventory_program, None),
+}
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def run_scenario(game: HeadlessGame, name: str, ticks: int, seed: int) -> dict:
+    setup, on_tick = SCENARIOS[name]
+    rng.seed(seed)
+    game.start(State.GAME)
+    setup(game)
+
+    update_ms, draw_ms = [], []
+    for n in range(WARMUP_TICKS + ticks):
+        if on_tick is not None:
+            on_tick(game)
+        keep_alive(game)
+        game.events.extend(pygame.event.get())
+
+        start = time.perf_counter()
+        game._update()
+        mid = time.perf_counter()
+        game._draw()
+        end = time.perf_counter()
+
+        if n >= WARMUP_TICKS:
+            update_ms.append((mid - start) * 1000)
+            draw_ms.append((end - mid) * 1000)
+
+    if game.state_manager.state_enum != State.GAME:
+        raise RuntimeError(f"{name} left the game state")
+
+    return {
+        "update": percentiles(update_ms),
+        "draw": percentiles(draw_ms),
+        "entities": {
+            "platforms": len(game.shared.plat.platforms),
+            "enemies": len(game.shared.plat.enemy_index),
+        },
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Prints the change against the baseline, False if anything regressed"""
+
+    ok = True
+    print(
+        f"\n{'scenario':<20} {'phase':<7} {'p95 base':>9} {'p95 now':>9} {'change':>8}"
+    )
+    for name, phases in results["scenarios"].items():
+        base_phases = baseline["scenarios"].get(name)
+        if base_phases is None:
+            print(f"{name:<20} (not in baseline)")
+            continue
+        for phase in ("update", "draw"):
+            base = base_phases[phase]["p95"]
+            now = phases[phase]["p95"]
+            change = (now - base) / base * 100 if base else 0.0
+            flag = ""
+            if change > threshold:
+                ok = False
+                flag = " REGRESSED"
+            print(
+                f"{name:<20} {phase:<7} {base:>9.3f} {now:>9.3f} "
+                f"{change:>+7.1f}%{flag}"
+            )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS, help="repeatable"
+    )
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the results as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    game = HeadlessGame(args.seed)
+    results = {
+        "meta": {
+            "ticks": args.ticks,
+            "seed": args.seed,
+            "screen": list(game.shared.SCRECT.size),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+        },
+        "scenarios": {},
+    }
+
+    print(f"ms per tick over {args.ticks} ticks")
+    print(f"{'scenario':<20} {'phase':<7} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name in args.scenario or SCENARIOS:
+        result = run_scenario(game, name, args.ticks, args.seed)
+        results["scenarios"][name] = result
+        for phase in ("update", "draw"):
+            stats = result[phase]
+            print(
+                f"{name:<20} {phase:<7} {stats['p50']:>8.3f} "
+                f"{stats['p95']:>8.3f} {stats['p99']:>8.3f}"
+            )
+
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Central registry for images and sounds.
+
+Assets are declared as class attributes with `assets.lazy(...)` and only
+decoded on first access, so importing a module costs nothing. Every
+(path, transform) pair is loaded once and shared. A named group can be
+prefetched on a thread pool, e.g. the game's sprites while the menu is open.
+Small sprites can be declared on a named atlas, which is packed as a whole the
+first time one of them is used.
+"""
+
+import concurrent.futures
+import threading
+import typing as t
+
+import pygame
+
+from .atlas import TextureAtlas
+from .sprite_pack import SpritePack
+from .utils import scale_by
+
+
+def aura(img: pygame.Surface, opacity: int) -> pygame.Surface:
+    img = scale_by(img, 2)
+    img.set_alpha(opacity)
+    return img
+
+
+# Transforms applied after decoding, by the name used in asset keys
+TRANSFORMS: dict[str, t.Callable[..., pygame.Surface]] = {
+    "scale_by": scale_by,
+    "aura": aura,
+    "scale_to": lambda img, width, height: pygame.transform.scale(img, (width, height)),
+}
+
+AssetKey = tuple[str, bool, tuple]
+
+
+class Lazy:
+    """Class attribute loaded on first access, then stored in place of itself"""
+
+    def __init__(self, load: t.Callable[[], t.Any]) -> None:
+        self.load = load
+
+    def __set_name__(self, owner, name: str):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        value = self.load()
+        setattr(self.owner, self.name, value)
+        return value
+
+
+class AssetRegistry:
+    def __init__(self) -> None:
+        self.surfaces: dict[AssetKey, pygame.Surface] = {}
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.groups: dict[str, set[AssetKey]] = {}
+        self.pending: dict[AssetKey, concurrent.futures.Future] = {}
+        self.lock = threading.Lock()
+        self.pack: SpritePack | None = None
+        self.atlas_keys: dict[AssetKey, str] = {}
+        self.atlases: dict[str, TextureAtlas] = {}
+        self.regions: dict[pygame.Surface, tuple[pygame.Surface, pygame.Rect]] = {}
+
+    @staticmethod
+    def make_key(path: str, transform: tuple, alpha: bool) -> AssetKey:
+        return path, alpha, transform
+
+    def open_pack(self, path: str) -> bool:
+        """Serves sprites from a baked pack from now on, if there is one"""
+
+        try:
+            self.pack = SpritePack(path)
+        except (FileNotFoundError, ValueError):
+            return False
+        if self.pack.n_stale:
+            print(
+                f"{self.pack.n_stale} sprites in {path} are out of date,"
+                " run `python -m devex.bake` to rebuild it"
+            )
+        return True
+
+    def all_keys(self) -> set[AssetKey]:
+        return set().union(*self.groups.values())
+
+    def decode(self, key: AssetKey) -> pygame.Surface:
+        if self.pack is not None:
+            surf = self.pack.surface(key)
+            if surf is not None:
+                return surf
+
+        path, alpha, transform = key
+        img = pygame.image.load(path)
+        img = img.convert_alpha() if alpha else img.convert()
+        if transform:
+            name, *args = transform
+            img = TRANSFORMS[name](img, *args)
+        return img
+
+    def load(self, key: AssetKey) -> dict[AssetKey, pygame.Surface]:
+        """Decodes the key, along with its whole atlas if it's on one"""
+
+        name = self.atlas_keys.get(key)
+        if name is None:
+            return {key: self.decode(key)}
+
+        atlas = TextureAtlas.build(
+            {
+                member: self.decode(member)
+                for member, member_atlas in self.atlas_keys.items()
+                if member_atlas == name
+            }
+        )
+        with self.lock:
+            self.atlases[name] = atlas
+            self.regions.update(atlas.regions)
+        return atlas.frames
+
+    def region(self, surf: pygame.Surface) -> tuple[pygame.Surface, pygame.Rect | None]:
+        """Source and area to blit the surface with, its atlas page if it has one"""
+
+        return self.regions.get(surf, (surf, None))
+
+    def get(self, path: str, *transform, alpha: bool = True) -> pygame.Surface:
+        """
+        Loads the image once per transform, e.g. `get(path, "scale_by", 3)`.
+        alpha: `convert_alpha` the image, `convert` it otherwise.
+        """
+
+        key = self.make_key(path, transform, alpha)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            return surf
+
+        with self.lock:
+            surf = self.surfaces.get(key)
+            future = self.pending.get(key)
+        if surf is not None:
+            return surf
+        # Being prefetched, waiting is cheaper than decoding it twice
+        if future is not None:
+            future.result()
+            return self.surfaces[key]
+
+        surfaces = self.load(key)
+        with self.lock:
+            self.surfaces.update(surfaces)
+        return surfaces[key]
+
+    def register(self, key: AssetKey, group: str, atlas: str | None = None):
+        self.groups.setdefault(group, set()).add(key)
+        if atlas is not None:
+            self.atlas_keys[key] = atlas
+
+    def lazy(
+        self,
+        path: str,
+        *transform,
+        alpha: bool = True,
+        group: str = "game",
+        atlas: str | None = None,
+    ) -> Lazy:
+        self.register(self.make_key(path, transform, alpha), group, atlas)
+        return Lazy(lambda: self.get(path, *transform, alpha=alpha))
+
+    def lazy_frames(
+        self,
+        paths: t.Iterable[str],
+        *transform,
+        alpha: bool = True,
+        group: str = "game",
+        atlas: str | None = None,
+    ) -> Lazy:
+        paths = tuple(paths)
+        for path in paths:
+            self.register(self.make_key(path, transform, alpha), group, atlas)
+        return Lazy(
+            lambda: tuple(self.get(path, *transform, alpha=alpha) for path in paths)
+        )
+
+    def lazy_map(
+        self,
+        paths: dict[t.Any, t.Sequence[str]],
+        *transform,
+        alpha: bool = True,
+        group: str = "game",
+    ) -> Lazy:
+        """Mapping of keys to frames, e.g. an icon and its cooldown variant"""
+
+        frames = {
+            key: self.lazy_frames(value, *transform, alpha=alpha, group=group)
+            for key, value in paths.items()
+        }
+        return Lazy(lambda: {key: lazy.load() for key, lazy in frames.items()})
+
+    def sound(self, path: str) -> pygame.mixer.Sound:
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            self.sounds[path] = sound
+        return sound
+
+    def lazy_sound(self, path: str) -> Lazy:
+        return Lazy(lambda: self.sound(path))
+
+    def load_into(self, key: AssetKey):
+        surfaces = self.load(key)
+        with self.lock:
+            self.surfaces.update(surfaces)
+            for loaded in surfaces:
+                self.pending.pop(loaded, None)
+
+    def prefetch(
+        self,
+        group: str,
+        progress: t.Callable[[int, int], None] | None = None,
+        workers: int = 4,
+    ) -> list[concurrent.futures.Future]:
+        """
+        Loads a group in the background, returning a future per asset.
+        progress: Called with (loaded, total) as each asset finishes.
+        """
+
+        with self.lock:
+            keys = [
+                key
+                for key in self.groups.get(group, ())
+                if key not in self.surfaces and key not in self.pending
+            ]
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"prefetch-{group}"
+            )
+            futures = []
+            for key in keys:
+                if key in self.pending:
+                    continue
+                future = executor.submit(self.load_into, key)
+                futures.append(future)
+                # An atlas is loaded by a single job for all of its sprites
+                name = self.atlas_keys.get(key)
+                if name is None:
+                    self.pending[key] = future
+                    continue
+                for member, member_atlas in self.atlas_keys.items():
+                    if member_atlas == name:
+                        self.pending[member] = future
+        executor.shutdown(wait=False)
+
+        if progress is not None:
+            done = 0
+            done_lock = threading.Lock()
+
+            def on_done(_):
+                nonlocal done
+                with done_lock:
+                    done += 1
+                    progress(done, len(futures))
+
+            for future in futures:
+                future.add_done_callback(on_done)
+
+        return futures
+
+
+assets = AssetRegistry()
@@ -0,0 +1,66 @@
+"""
+Packs small sprites into a few large textures.
+
+Each sprite becomes a subsurface of its page, so it can still be used as a
+plain surface, while draw code that batches can blit the page with an area
+rect instead, see `TextureAtlas.regions`.
+"""
+
+import typing as t
+
+import pygame
+
+
+class TextureAtlas:
+    PAGE_SIZE = 1024
+    # Keeps neighbours from bleeding in when a region is scaled or rotated
+    PADDING = 1
+
+    def __init__(self) -> None:
+        self.pages: list[pygame.Surface] = []
+        self.frames: dict[t.Hashable, pygame.Surface] = {}
+        # Frame subsurface to the page it lives on and its area there
+        self.regions: dict[pygame.Surface, tuple[pygame.Surface, pygame.Rect]] = {}
+
+    @classmethod
+    def build(cls, surfaces: dict[t.Hashable, pygame.Surface]) -> "TextureAtlas":
+        """Shelf packs the surfaces, tallest first, into as few pages as fit"""
+
+        atlas = cls()
+        placements: list[list[tuple[t.Hashable, pygame.Rect]]] = []
+        page_heights: list[int] = []
+        x = y = shelf_height = 0
+        by_height = sorted(
+            surfaces.items(), key=lambda item: item[1].get_height(), reverse=True
+        )
+        for key, surf in by_height:
+            width, height = surf.get_size()
+            if x + width > cls.PAGE_SIZE:
+                x, y = 0, y + shelf_height + cls.PADDING
+                shelf_height = 0
+            if not placements or y + height > cls.PAGE_SIZE:
+                placements.append([])
+                page_heights.append(0)
+                x = y = shelf_height = 0
+            placements[-1].append((key, pygame.Rect(x, y, width, height)))
+            page_heights[-1] = max(page_heights[-1], y + height)
+            x += width + cls.PADDING
+            shelf_height = max(shelf_height, height)
+
+        for placed, page_height in zip(placements, page_heights):
+            page_width = max(rect.right for _, rect in placed)
+            page = pygame.Surface((page_width, page_height), pygame.SRCALPHA)
+            for key, rect in placed:
+                surf = surfaces[key]
+                # Added onto a transparent page, so pixels are copied exactly
+                page.blit(surf, rect, special_flags=pygame.BLEND_RGBA_ADD)
+                frame = page.subsurface(rect)
+                atlas.frames[key] = frame
+                # Surface alpha can't be drawn from the page, it stays a frame
+                if surf.get_alpha() != 255:
+                    frame.set_alpha(surf.get_alpha())
+                    continue
+                atlas.regions[frame] = page, rect
+            atlas.pages.append(page)
+
+        return atlas
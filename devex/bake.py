@@ -0,0 +1,44 @@
+"""
+Bakes every sprite declared through the asset registry into a sprite pack.
+
+    python -m devex.bake
+
+Rerun it after changing anything in assets/, stale sprites are decoded from
+their PNGs until then.
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from .sprite_pack import PACK_PATH, SpritePack
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=PACK_PATH)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    # Importing the states imports every module that declares assets
+    from . import states
+    from .assets import assets
+
+    start = time.perf_counter()
+    n_sprites = SpritePack.bake(assets.all_keys(), assets.decode, args.out)
+    print(
+        f"{n_sprites} sprites baked into {args.out}"
+        f" in {time.perf_counter() - start:.2f}s"
+        f" ({os.path.getsize(args.out) / 1e6:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
 import pygame
 
+from .assets import assets
+from .hud import Bar
 from .shared import Shared
-from .utils import render_at, scale_by
+from .utils import render_at
 
 
 class HealthBar:
-    LOGO = pygame.image.load("assets/heart.png").convert_alpha()
-    LOGO = scale_by(LOGO, 0.05)
+    LOGO = assets.lazy("assets/heart.png", "scale_by", 0.05)
     BAR_SIZE = 500, 15
 
     def __init__(self) -> None:
@@ -18,22 +19,12 @@ class HealthBar:
             pygame.Rect(0, 0, *self.BAR_SIZE),
             border_radius=7,
         )
-        self.original_foreground_surf = pygame.Surface(self.BAR_SIZE)
-        self.original_foreground_surf.fill("red")
-        self.foreground_surf = self.original_foreground_surf.copy()
-        self.size = self.BAR_SIZE
+        self.bar = Bar(self.BAR_SIZE, "red")
+        self.foreground_surf = self.bar.render(1.0)
 
     def update(self):
-        self.size = (
+        self.foreground_surf = self.bar.render(
             self.shared.player.health / self.shared.player.MAX_HEALTH
-        ) * self.BAR_SIZE[0], self.BAR_SIZE[1]
-
-        self.foreground_surf = pygame.Surface(self.BAR_SIZE, pygame.SRCALPHA)
-        pygame.draw.rect(
-            self.foreground_surf,
-            "red",
-            pygame.Rect(0, 0, *self.size),
-            border_radius=7,
         )
 
     def draw(self):
@@ -49,8 +40,7 @@ class HealthBar:
 
 
 class EnergyBar:
-    LOGO = pygame.image.load("assets/energy.png").convert_alpha()
-    LOGO = scale_by(LOGO, 1.5)
+    LOGO = assets.lazy("assets/energy.png", "scale_by", 1.5)
     BAR_SIZE = 500, 15
 
     def __init__(self) -> None:
@@ -62,24 +52,14 @@ class EnergyBar:
             pygame.Rect(0, 0, *self.BAR_SIZE),
             border_radius=7,
         )
-        self.original_foreground_surf = pygame.Surface(self.BAR_SIZE)
-        self.original_foreground_surf.fill("cyan")
-        self.foreground_surf = self.original_foreground_surf.copy()
-        self.size = self.BAR_SIZE
+        self.bar = Bar(self.BAR_SIZE, "cyan")
+        self.foreground_surf = self.bar.render(1.0)
 
         self.mana_boost = 3
 
     def update(self):
-        self.size = (
+        self.foreground_surf = self.bar.render(
             self.shared.player.mana / self.shared.player.MAX_ENERGY
-        ) * self.BAR_SIZE[0], self.BAR_SIZE[1]
-
-        self.foreground_surf = pygame.Surface(self.BAR_SIZE, pygame.SRCALPHA)
-        pygame.draw.rect(
-            self.foreground_surf,
-            "cyan",
-            pygame.Rect(0, 0, *self.size),
-            border_radius=7,
         )
         self.shared.player.modify_mana(self.mana_boost * self.shared.dt)
 
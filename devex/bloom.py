@@ -1,5 +1,8 @@
 import pygame
-from .utils import scale_by, scale_add, SinWave
+
+from .assets import assets
+from .lighting import LightMap
+from .utils import SinWave
 
 
 def process_bloom(img: pygame.Surface) -> pygame.Surface:
@@ -11,8 +14,8 @@ def process_bloom(img: pygame.Surface) -> pygame.Surface:
 
 
 class Bloom:
-    IMAGE = pygame.image.load("assets/light.png").convert_alpha()
-    IMAGE_V2 = pygame.image.load("assets/light_v2.png").convert_alpha()
+    IMAGE = assets.lazy("assets/light.png")
+    IMAGE_V2 = assets.lazy("assets/light_v2.png")
     # IMAGE = process_bloom(IMAGE)
 
     def __init__(
@@ -23,18 +26,19 @@ class Bloom:
         v2: bool = True,
     ) -> None:
         self.size_factor = size_factor
-        self.original_surf = scale_by((self.IMAGE, self.IMAGE_V2)[v2], size_factor)
-        self.surf = self.original_surf.copy()
-        self.rect = self.surf.get_rect()
+        self.image = (self.IMAGE, self.IMAGE_V2)[v2]
+        self.original_size = pygame.Vector2(self.image.get_size()) * size_factor
+        self.rect = pygame.Rect((0, 0), self.original_size)
         self.wave = SinWave(wave_speed)
         self.expansion_factor = expansion_factor
 
+    def reset(self):
+        self.wave.rad = 0.0
+
     def update(self, pos):
-        self.surf = scale_add(
-            self.original_surf, self.wave.val() * self.expansion_factor
-        )
-        self.rect = self.surf.get_rect()
+        term = self.wave.val() * self.expansion_factor
+        self.rect.size = self.original_size.x + term, self.original_size.y + term
         self.rect.center = pos
 
-    def draw(self, surface: pygame.Surface):
-        surface.blit(self.surf, self.rect)
+    def draw(self, lightmap: LightMap):
+        lightmap.add(self.image, self.rect)
@@ -8,10 +8,43 @@ class Camera:
 
     def __init__(self) -> None:
         self.offset = pygame.Vector2()
+        self.prev_offset = pygame.Vector2()
+        self.render_offset = pygame.Vector2()
         self.shared = Shared()
+        self.viewport = self.shared.SCRECT.copy()
+        self.culled = 0
+
+    def update_viewport(self):
+        """Called once per frame before any world-space drawing.
+
+        The render offset is interpolated between the last two simulation ticks
+        and snapped to whole pixels, so a settling camera stops shifting the
+        world by fractions of a pixel.
+        """
+
+        offset = self.prev_offset.lerp(self.offset, self.shared.alpha)
+        self.render_offset = pygame.Vector2(round(offset.x), round(offset.y))
+        self.viewport.topleft = self.render_offset
+        self.culled = 0
+
+    def visible(self, rect) -> bool:
+        """Checks a world-space rect against the viewport"""
+
+        if self.viewport.colliderect(rect):
+            return True
+        self.culled += 1
+        return False
+
+    def visible_on_screen(self, rect) -> bool:
+        """Checks an already transformed rect against the screen"""
+
+        if self.shared.SCRECT.colliderect(rect):
+            return True
+        self.culled += 1
+        return False
 
     def transform(self, coord):
-        return coord[0] - self.offset.x, coord[1] - self.offset.y
+        return coord[0] - self.render_offset.x, coord[1] - self.render_offset.y
 
     def transform_mini(self, coord):
         return coord[0] - self.offset.x, coord[1] - self.offset.y
@@ -29,6 +62,7 @@ class Camera:
         ) * self.DRAG
 
     def attach_to_player(self):
+        self.prev_offset.update(self.offset)
         self.offset.x += (
             self.shared.player.pos.x - self.offset.x - (self.shared.SCREEN_WIDTH // 2)
         ) * self.DRAG
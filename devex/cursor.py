@@ -4,8 +4,9 @@ from enum import Enum, auto
 
 import pygame
 
+from .assets import assets
 from .shared import Shared
-from .utils import scale_by
+from .utils import alpha_cache, scale_cache, set_cursor
 
 
 class CursorState(Enum):
@@ -16,12 +17,11 @@ class CursorState(Enum):
 
 
 class CursorAnimation:
+    IMAGE = assets.lazy("assets/cursor-anim.png", "scale_by", 0.5, atlas="sprites")
+
     def __init__(self, target_pos) -> None:
-        self.original_image = pygame.image.load(
-            "assets/cursor-anim.png"
-        ).convert_alpha()
-        self.original_image = scale_by(self.original_image, 0.5)
-        self.image = self.original_image.copy()
+        self.original_image = self.IMAGE
+        self.image = self.original_image
         self.rect = self.image.get_rect()
         self.pos = target_pos
         self.size = self.original_image.get_width()
@@ -32,8 +32,10 @@ class CursorAnimation:
         self.alive = True
 
     def update(self):
-        self.image = pygame.transform.scale(self.original_image, (self.size, self.size))
-        self.image.set_alpha(self.alpha)
+        self.image = alpha_cache.with_alpha(
+            scale_cache.scale(self.original_image, (self.size, self.size)),
+            self.alpha,
+        )
         self.rect = self.image.get_rect(center=self.pos)
 
         if self.size > self.min_size:
@@ -51,28 +53,26 @@ class CursorAnimation:
 
 
 class Cursor:
+    TOUCHABLE_IMAGE = assets.lazy(
+        "assets/cursor-touchable.png", "scale_to", 25, 25, atlas="sprites"
+    )
+    ATTACK_IMAGE = assets.lazy(
+        "assets/cursor-attack.png", "scale_to", 25, 25, atlas="sprites"
+    )
+    FORBIDDEN_IMAGE = assets.lazy("assets/cursor-forbidden.png", atlas="sprites")
+    UI_IMAGE = assets.lazy("assets/cursor-ui.png", "scale_to", 25, 25, atlas="sprites")
+
     def __init__(self) -> None:
         self.shared = Shared()
         self.pos = pygame.Vector2()
         self.__state: CursorState = CursorState.TOUCHABLE
         self.images = {
-            CursorState.TOUCHABLE: pygame.transform.scale(
-                pygame.image.load("assets/cursor-touchable.png").convert_alpha(),
-                (25, 25),
-            ),
-            CursorState.ATTACK: pygame.transform.scale(
-                pygame.image.load("assets/cursor-attack.png").convert_alpha(), (25, 25)
-            ),
-            CursorState.FORBIDDEN: pygame.image.load(
-                "assets/cursor-forbidden.png"
-            ).convert_alpha(),
-            CursorState.USER_INTERFACE: pygame.transform.scale(
-                pygame.image.load("assets/cursor-ui.png").convert_alpha(), (25, 25)
-            ),
+            CursorState.TOUCHABLE: self.TOUCHABLE_IMAGE,
+            CursorState.ATTACK: self.ATTACK_IMAGE,
+            CursorState.FORBIDDEN: self.FORBIDDEN_IMAGE,
+            CursorState.USER_INTERFACE: self.UI_IMAGE,
         }
-        pygame.mouse.set_cursor(
-            pygame.cursors.Cursor((0, 0), self.images.get(self.state))
-        )
+        set_cursor(pygame.cursors.Cursor((0, 0), self.images.get(self.state)))
         self.surface_color = pygame.Color((50, 83, 95))
         self.player_target = None
         self.anim: CursorAnimation | None = None
@@ -96,27 +96,15 @@ class Cursor:
         )
 
     def on_forbidden(self):
-        try:
-            if (
-                self.shared.provisional_chunk.get_at(self.pos) != self.surface_color
-                and self.state != CursorState.USER_INTERFACE
-            ):
-                self.state = CursorState.FORBIDDEN
-            elif self.state != CursorState.USER_INTERFACE:
-                self.state = CursorState.TOUCHABLE
-        except IndexError:
-            pass
+        if self.state == CursorState.USER_INTERFACE:
+            return
+        if self.shared.plat.tile_map.walkable(self.trans_pos):
+            self.state = CursorState.TOUCHABLE
+        else:
+            self.state = CursorState.FORBIDDEN
 
     def on_attack(self):
-        for chunk in self.shared.current_chunks:
-            for enemy in chunk.enemies:
-                if enemy.rect.collidepoint(self.trans_pos):
-                    self.state = CursorState.ATTACK
-
-        if (
-            self.shared.final_boss is not None
-            and self.shared.final_boss.rect.collidepoint(self.trans_pos)
-        ):
+        if self.shared.plat.enemy_index.query_point(self.trans_pos):
             self.state = CursorState.ATTACK
 
     def on_click(self):
@@ -134,9 +122,7 @@ class Cursor:
                 self.anim = CursorAnimation(self.trans_pos)
 
     def set_cursor(self):
-        pygame.mouse.set_cursor(
-            pygame.cursors.Cursor((0, 0), self.images.get(self.state))
-        )
+        set_cursor(pygame.cursors.Cursor((0, 0), self.images.get(self.state)))
 
     def on_anim(self):
         if self.anim is not None:
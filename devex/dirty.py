@@ -0,0 +1,258 @@
+"""
+Dirty-rectangle presentation.
+
+Frames are drawn into a canvas that records the area touched by every blit,
+fill and `pygame.draw` call. Only the areas drawn this frame or the previous
+one are copied to the display and passed to `pygame.display.update`. When the
+camera moves or too much of the screen changed, the whole frame is flipped.
+
+Full-screen layers that rarely change, like backgrounds, baked floors and the
+lightmap, are drawn inside `presenter.untracked(key)`. They are redrawn every
+frame but only dirty the screen when their key changes, or through the rects
+passed to `presenter.mark`. Panels that are redrawn every frame but seldom
+change go through `presenter.blit_retained`, which compares their pixels.
+"""
+
+import contextlib
+import functools
+import math
+import typing as t
+import zlib
+
+import numpy as np
+import pygame
+
+BaseSurface = pygame.Surface
+
+DRAW_FUNCTIONS = (
+    "rect",
+    "polygon",
+    "circle",
+    "ellipse",
+    "arc",
+    "line",
+    "lines",
+    "aaline",
+    "aalines",
+)
+
+
+class DirtySurface(BaseSurface):
+    """Canvas keeping the clipped rect of everything drawn onto it"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.dirty: list[pygame.Rect] = []
+        self.tracking = True
+
+    def blit(self, *args, **kwargs):
+        rect = super().blit(*args, **kwargs)
+        if self.tracking:
+            self.dirty.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True, *args, **kwargs):
+        rects = super().blits(blit_sequence, True, *args, **kwargs)
+        if self.tracking:
+            self.dirty.extend(rects)
+        return rects if doreturn else None
+
+    def fblits(self, blit_sequence, *args, **kwargs):
+        if not self.tracking:
+            return super().fblits(blit_sequence, *args, **kwargs)
+        blit_sequence = list(blit_sequence)
+        super().fblits(blit_sequence, *args, **kwargs)
+        clip = self.get_clip()
+        self.dirty.extend(
+            clip.clip(pygame.Rect(dest, source.get_size()))
+            for source, dest in blit_sequence
+        )
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = super().fill(color, rect, special_flags)
+        if self.tracking:
+            self.dirty.append(rect)
+        return rect
+
+    def clear(self, color="black"):
+        """Fills the whole canvas without marking it dirty"""
+
+        super().fill(color)
+        self.dirty.clear()
+
+
+class DirtyPresenter:
+    # Past this fraction of the screen, a full flip is cheaper than many rects
+    MAX_DIRTY_FRACTION = 0.4
+    # Side in pixels of the cells the dirty area is measured in, rects drawn
+    # this frame and the previous one overlap a lot
+    COVER_CELL = 8
+    # Camera movement in pixels that shifts the whole world
+    CAMERA_THRESHOLD = 0.5
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.patched: list[tuple[str, object]] = []
+        self.previous: list[pygame.Rect] = []
+        self.camera_pos: pygame.Vector2 | None = None
+        self.camera = None
+        self.full_next = True
+        # Keys of the untracked layers drawn this frame and the previous one
+        self.keys: list = []
+        self.previous_keys: list = []
+        # Keys and rects of the untracked regions, only their area is presented
+        # when they change
+        self.regions: set = set()
+        self.previous_regions: set = set()
+        self.n_full = 0
+        self.n_partial = 0
+
+    def enable(self, shared):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.shared = shared
+        self.display = shared.screen
+        self.canvas = DirtySurface(self.display.get_size())
+        shared.screen = self.canvas
+
+        for name in DRAW_FUNCTIONS:
+            func = getattr(pygame.draw, name)
+            self.patched.append((name, func))
+            setattr(pygame.draw, name, self.tracked(func))
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for name, func in self.patched:
+            setattr(pygame.draw, name, func)
+        self.patched.clear()
+        self.shared.screen = self.display
+
+    def tracked(self, func):
+        @functools.wraps(func)
+        def wrapper(surface, *args, **kwargs):
+            rect = func(surface, *args, **kwargs)
+            if surface is self.canvas and self.canvas.tracking:
+                self.canvas.dirty.append(rect)
+            return rect
+
+        return wrapper
+
+    @contextlib.contextmanager
+    def untracked(self, key: t.Hashable, rect: pygame.Rect | None = None):
+        """
+        Draws onto the canvas without dirtying it. What is drawn must look the
+        same every frame the key is the same. When the keys drawn differ from
+        the previous frame, the whole frame is presented, or only `rect` when
+        the drawing is confined to it.
+        """
+
+        if not self.enabled:
+            yield
+            return
+        if rect is None:
+            self.keys.append(key)
+        else:
+            self.regions.add((key, tuple(rect)))
+        self.canvas.tracking = False
+        try:
+            yield
+        finally:
+            self.canvas.tracking = True
+
+    def blit_retained(self, target: pygame.Surface, surf: pygame.Surface, pos):
+        """
+        Blits onto `target`, dirtying the canvas only when the pixels, alpha or
+        place of `surf` changed since the previous frame
+        """
+
+        if not self.enabled or target is not self.canvas:
+            return target.blit(surf, pos)
+        rect = pygame.Rect(pos, surf.get_size())
+        key = (surf.get_alpha(), zlib.crc32(surf.get_buffer()))
+        with self.untracked(key, rect):
+            return self.canvas.blit(surf, rect)
+
+    def mark(self, rects: t.Iterable[pygame.Rect]):
+        """Dirties parts of an untracked layer that changed"""
+
+        if self.enabled:
+            clip = self.canvas.get_clip()
+            self.canvas.dirty.extend(clip.clip(rect) for rect in rects)
+
+    def begin(self):
+        """Clears the canvas, call instead of filling the screen"""
+
+        self.canvas.clear()
+        self.keys = []
+        self.regions = set()
+
+    def camera_moved(self) -> bool:
+        camera = getattr(self.shared, "camera", None)
+        if camera is None:
+            return False
+
+        pos = camera.render_offset
+        moved = (
+            camera is not self.camera
+            or self.camera_pos is None
+            or pos.distance_to(self.camera_pos) > self.CAMERA_THRESHOLD
+        )
+        self.camera = camera
+        self.camera_pos = pos.copy()
+        return moved
+
+    def covered_area(self, rects: list[pygame.Rect]) -> int:
+        """Area of the union of the rects, rounded out to whole cells"""
+
+        cell = self.COVER_CELL
+        width, height = self.canvas.get_size()
+        covered = np.zeros((math.ceil(height / cell), math.ceil(width / cell)), bool)
+        for rect in rects:
+            covered[
+                rect.top // cell : -(-rect.bottom // cell),
+                rect.left // cell : -(-rect.right // cell),
+            ] = True
+        return int(np.count_nonzero(covered)) * cell * cell
+
+    def present(self):
+        """Copies the changed parts of the canvas to the display and shows them"""
+
+        drawn = [rect for rect in self.canvas.dirty if rect.width and rect.height]
+        # Whatever was drawn last frame has to be cleared off the display too
+        rects = drawn + self.previous
+        self.previous = drawn
+        # Regions drawn differently from last frame, or not drawn anymore
+        screen_rect = self.canvas.get_rect()
+        for _, rect in self.regions.symmetric_difference(self.previous_regions):
+            rect = screen_rect.clip(rect)
+            if rect.width and rect.height:
+                rects.append(rect)
+        self.previous_regions = self.regions
+
+        dirty_area = self.covered_area(rects)
+        screen_area = self.canvas.get_width() * self.canvas.get_height()
+        full = (
+            self.camera_moved()
+            or self.full_next
+            or self.keys != self.previous_keys
+            or dirty_area > screen_area * self.MAX_DIRTY_FRACTION
+        )
+        self.full_next = False
+        self.previous_keys = self.keys
+
+        if full:
+            self.n_full += 1
+            self.display.blit(self.canvas, (0, 0))
+            pygame.display.flip()
+            return
+
+        self.n_partial += 1
+        for rect in rects:
+            self.display.blit(self.canvas, rect, rect)
+        pygame.display.update(rects)
+
+
+presenter = DirtyPresenter()
@@ -3,6 +3,7 @@ from devex.enemies.bee_list import BeeList
 from devex.enemies.centi_set import CentiSet
 from devex.enemies.final_tuple import FinalBoss
 from devex.enemies.human_str import HumanStr
+from devex.enemies.patrol import Patrol
 from devex.enemies.poopy_bytes import PoopyBytes
 from devex.enemies.potato_int import PotatoInt
 from devex.enemies.shroom_dict import ShroomDict
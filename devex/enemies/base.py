@@ -1,43 +1,77 @@
 import itertools
-import random
-from abc import ABC
+from abc import ABC, abstractmethod
 
 import pygame
 
+from devex.assets import assets
+from devex.pool import pools
+from devex.render import Layer
 from devex.shared import Shared
-from devex.utils import PlayItOnceAnimation, SinWave, TimeOnce, get_font, iso_to_screen
+from devex.text import text_cache
+from devex.utils import (
+    PlayItOnceAnimation,
+    SinWave,
+    TimeOnce,
+    get_font,
+    iso_to_screen,
+    render_offset,
+    rng,
+    scale_cache,
+)
 
 
 class Enemy(ABC):
     font = get_font("assets/Hack/Hack Bold Nerd Font Complete.ttf", 16)
     KILL_TIME_TO_PASS = 3.0
     KILL_BOOST = 5
-    ON_DAMAGE_SFX = pygame.mixer.Sound("assets/fireball.wav")
+    ON_DAMAGE_SFX = assets.lazy_sound("assets/fireball.wav")
 
     def __init__(
         self,
         data_type: type,
         data_font_color,
         image: pygame.Surface,
-        iso_pos: tuple[int, int],
-        broken_platform_size: int,
-        tile_rect: pygame.Rect,
         enemy_speed: float,
-        origin: tuple[int, int],
         health: int = 100,
         bouncy_direction: str = "vertical",
     ) -> None:
+        """Sets up what an enemy keeps between lives, `spawn` starts one"""
+
         self.shared = Shared()
         self.data_type = data_type
         self.data_font_color = data_font_color
-        self.original_image = image.copy()
-        self.image = self.original_image.copy()
+        self.original_image = image
+        self.image = self.original_image
         self.rect = self.image.get_rect()
-        self.broken_platform_size = broken_platform_size
-        self.origin = origin
         self.bouncy_direction = bouncy_direction
-        self.health = health
         self.max_health = health
+        self.speed = enemy_speed
+        self.pos = pygame.Vector2()
+        self.prev_pos = pygame.Vector2()
+
+        """Image morphing"""
+        if bouncy_direction == "vertical":
+            self.original_size = self.image.get_height()
+        else:
+            self.original_size = self.image.get_width()
+        self.bouncy_wave = SinWave(0.06)
+        self.highlight_reduction_speed = 100
+        # Set while a platform's `Patrol` moves and bounces the enemy
+        self.patrol = None
+
+    def spawn(
+        self,
+        iso_pos: tuple[int, int],
+        broken_platform_size: int,
+        tile_rect: pygame.Rect,
+        origin: tuple[int, int],
+    ):
+        """Rolls a new path and restores the enemy's health"""
+
+        self.broken_platform_size = broken_platform_size
+        self.origin = origin
+        self.image = self.original_image
+        self.health = self.max_health
         self.alive = True
 
         """
@@ -51,27 +85,29 @@ class Enemy(ABC):
         self.final_screen_pos = iso_to_screen(self.iso_path_range[-1], tile_rect)
         self.targets = itertools.cycle((self.initial_screen_pos, self.final_screen_pos))
         self.current_target = self.initial_screen_pos
-        self.pos = pygame.Vector2(self.initial_screen_pos)
-        self.speed = enemy_speed
+        self.pos.update(self.initial_screen_pos)
+        self.rect.midbottom = self.pos
+        self.prev_pos.update(self.pos)
 
-        """Image morphing"""
-        if bouncy_direction == "vertical":
-            self.size = self.image.get_height()
-        else:
-            self.size = self.image.get_width()
-        self.original_size = self.size
-        self.bouncy_wave = SinWave(0.06)
+        self.size = self.original_size
+        self.bouncy_wave.rad = 0.0
         self.taking_damage = False
         self.higlight_alpha = 200
-        self.highlight_reduction_speed = 100
         self.boost_timer: TimeOnce = None
 
+    @abstractmethod
+    def reset(self, broken_platform_size: int, tile_rect: pygame.Rect, origin):
+        """
+        Brings a pooled enemy back as a new one. Subclasses roll their spawn
+        position, value and attacks here, reusing their projectiles and timers.
+        """
+
     def calc_path_range(self) -> None:
         """Calculates the path range for the enemy."""
 
         # Random parameters
-        n_steps: int = random.randrange(3, self.broken_platform_size - 2)
-        x_or_y: int = random.randint(0, 1)
+        n_steps: int = rng.randrange(3, self.broken_platform_size - 2)
+        x_or_y: int = rng.randint(0, 1)
 
         # Applies the parameters
         axis_range_x = range(1 + self.origin[0], n_steps + self.origin[0])
@@ -83,24 +119,36 @@ class Enemy(ABC):
 
         return [(axis, self.iso_pos[1]) for axis in axis_range_x]
 
-    def highlight_red(self):
+    def fade_highlight(self):
         if not self.taking_damage:
             return
 
-        surf = pygame.Surface(self.image.get_size())
-        surf.fill("red")
-        surf.set_alpha(self.higlight_alpha)
         self.higlight_alpha -= self.highlight_reduction_speed * self.shared.dt
         if self.higlight_alpha <= 120:
             self.taking_damage = False
             self.higlight_alpha = 200
+
+    def highlight_red(self):
+        if not self.taking_damage:
+            return
+
+        surf = pygame.Surface(self.image.get_size())
+        surf.fill("red")
+        surf.set_alpha(self.higlight_alpha)
+        # The morphed image may be shared through the scale cache
+        self.image = self.image.copy()
         self.image.blit(surf, (0, 0))
 
     def on_damage(self, fireball):
         self.ON_DAMAGE_SFX.play()
         fireball.alive = False
-        self.shared.play_it_once_anims.append(
-            PlayItOnceAnimation(fireball.EXPLOSION_FRAMES, 0.08, self.pos - (64, 64))
+        self.shared.play_it_once_anims.add(
+            pools.acquire(
+                PlayItOnceAnimation,
+                fireball.EXPLOSION_FRAMES,
+                0.08,
+                self.pos - (64, 64),
+            )
         )
         self.health -= fireball.damage
         self.taking_damage = True
@@ -114,13 +162,8 @@ class Enemy(ABC):
         self.shared.player.on_boost = True
 
     def take_damage(self):
-        for fireball in self.shared.player.fireball_manager.fireballs:
-            if fireball.rect.colliderect(self.rect):
-                self.on_damage(fireball)
-
-        for fireball in self.shared.player.e_attack.fireballs:
-            if fireball.rect.colliderect(self.rect):
-                self.on_damage(fireball)
+        for fireball in self.shared.player.fireball_grid.colliding(self.rect):
+            self.on_damage(fireball)
 
         if self.health <= 0:
             self.give_mana_boost()
@@ -134,8 +177,13 @@ class Enemy(ABC):
             if self.shared.inv_widget is not None:
                 self.shared.inv_widget.construct()
 
+    def player_in_range(self, radius: float) -> bool:
+        return self in self.shared.plat.enemy_index.near(self.shared.player.pos, radius)
+
     def set_font_surf(self):
-        self.font_surf = self.font.render(str(self.value), True, self.data_font_color)
+        self.font_surf = text_cache.render(
+            self.font, str(self.value), True, self.data_font_color
+        )
         self.font_rect = self.font_surf.get_rect()
 
     def move(self):
@@ -144,28 +192,42 @@ class Enemy(ABC):
             self.current_target = next(self.targets)
 
         self.rect.midbottom = self.pos
-        self.font_rect.midtop = self.pos
+
+    def bounce(self):
+        self.size = self.original_size + (self.bouncy_wave.val() * 5)
 
     def morph_image(self):
         """Create a bouncy animation for the enemy"""
 
-        self.size = self.original_size + (self.bouncy_wave.val() * 5)
         if self.bouncy_direction == "vertical":
             new_size = self.original_image.get_width(), self.size
         elif self.bouncy_direction == "horizontal":
             new_size = self.size, self.original_image.get_height()
         else:
+            self.image = self.original_image
             return
-        self.image = pygame.transform.scale(self.original_image, new_size)
+        self.image = scale_cache.scale(self.original_image, new_size)
+
+    def leave_patrol(self):
+        if self.patrol is not None:
+            self.patrol.remove(self)
 
     def update(self):
-        self.move()
-        self.morph_image()
+        if self.patrol is None:
+            self.prev_pos.update(self.pos)
+            self.move()
+            self.bounce()
+            # Patrolling enemies are reindexed by the patrol step
+            self.shared.plat.enemy_index.update(self)
         self.take_damage()
-        self.highlight_red()
+        self.fade_highlight()
 
     def draw(self):
-        self.shared.screen.blit(self.image, self.shared.camera.transform(self.rect))
-        self.shared.screen.blit(
-            self.font_surf, self.shared.camera.transform(self.font_rect)
+        self.morph_image()
+        self.highlight_red()
+        self.font_rect.midtop = self.pos
+        offset = render_offset(self.prev_pos, self.pos, self.shared.alpha)
+        self.shared.render.submit(Layer.ENEMIES, self.image, self.rect.topleft + offset)
+        self.shared.render.submit(
+            Layer.LABELS, self.font_surf, self.font_rect.topleft + offset
         )
@@ -1,45 +1,40 @@
-import random
 import string
 
 import pygame
 
+from devex.assets import assets
 from devex.enemies.base import Enemy
 from devex.enemies.falling_sword import Sword
-from devex.utils import load_scale_3
+from devex.utils import rng
 
 
 class BeeList(Enemy):
-    IMAGE = load_scale_3("assets/list.png")
+    IMAGE = assets.lazy("assets/list.png", "scale_by", 3)
     SPEED = 15
     SENSE_RANGE = 500
 
     def __init__(
         self, broken_platform_size: int, tile_rect: pygame.Rect, origin: tuple[int, int]
     ) -> None:
+        super().__init__(int, "orange", BeeList.IMAGE, BeeList.SPEED, health=300)
+        self.reset(broken_platform_size, tile_rect, origin)
+
+    def reset(
+        self, broken_platform_size: int, tile_rect: pygame.Rect, origin: tuple[int, int]
+    ):
         iso_pos = (
-            random.randrange(2, broken_platform_size - 2) + origin[0],
-            random.randrange(2, broken_platform_size - 2) + origin[1],
+            rng.randrange(2, broken_platform_size - 2) + origin[0],
+            rng.randrange(2, broken_platform_size - 2) + origin[1],
         )
-        super().__init__(
-            int,
-            "orange",
-            BeeList.IMAGE,
-            iso_pos,
-            broken_platform_size,
-            tile_rect,
-            BeeList.SPEED,
-            origin,
-            health=300,
-        )
-
-        self.value = [random.randrange(1, 10) for _ in range(random.randrange(2, 5))]
+        self.spawn(iso_pos, broken_platform_size, tile_rect, origin)
+        self.value = [rng.randrange(1, 10) for _ in range(rng.randrange(2, 5))]
         self.set_font_surf()
         self.sword = None
 
     def start_condition(self):
         if self.sword is not None:
             return False
-        return self.pos.distance_to(self.shared.player.pos) < self.SENSE_RANGE
+        return self.player_in_range(self.SENSE_RANGE)
 
     def update(self):
         super().update()
@@ -48,8 +43,7 @@ class BeeList(Enemy):
             self.sword = Sword(
                 0,
                 30,
-                self.shared.player.pos
-                + (random.uniform(-30, 30), random.uniform(-30, 30)),
+                self.shared.player.pos + (rng.uniform(-30, 30), rng.uniform(-30, 30)),
             )
 
         if self.sword is None:
@@ -1,46 +1,47 @@
-import random
 import string
 
 import pygame
 
+from devex.assets import assets
 from devex.enemies.base import Enemy
 from devex.enemies.falling_sword import Sword
-from devex.utils import Time, load_scale_3
+from devex.utils import Time, rng
 
 
 class CentiSet(Enemy):
-    IMAGE = load_scale_3("assets/set.png")
+    IMAGE = assets.lazy("assets/set.png", "scale_by", 3)
     SPEED = 25
     SENSE_RANGE = 1_000
 
     def __init__(
         self, broken_platform_size: int, tile_rect: pygame.Rect, origin: tuple[int, int]
     ) -> None:
-        iso_pos = (
-            random.randrange(2, broken_platform_size - 2) + origin[0],
-            random.randrange(2, broken_platform_size - 2) + origin[1],
-        )
         super().__init__(
             int,
             "red",
             CentiSet.IMAGE,
-            iso_pos,
-            broken_platform_size,
-            tile_rect,
             CentiSet.SPEED,
-            origin,
-            bouncy_direction="horizontal",
             health=400,
+            bouncy_direction="horizontal",
         )
+        self.reset(broken_platform_size, tile_rect, origin)
 
-        self.value = {random.randrange(1, 10) for _ in range(random.randrange(2, 5))}
+    def reset(
+        self, broken_platform_size: int, tile_rect: pygame.Rect, origin: tuple[int, int]
+    ):
+        iso_pos = (
+            rng.randrange(2, broken_platform_size - 2) + origin[0],
+            rng.randrange(2, broken_platform_size - 2) + origin[1],
+        )
+        self.spawn(iso_pos, broken_platform_size, tile_rect, origin)
+        self.value = {rng.randrange(1, 10) for _ in range(rng.randrange(2, 5))}
         self.set_font_surf()
         self.sword = None
 
     def start_condition(self):
         if self.sword is not None:
             return False
-        return self.pos.distance_to(self.shared.player.pos) < self.SENSE_RANGE
+        return self.player_in_range(self.SENSE_RANGE)
 
     def update(self):
         super().update()
@@ -49,8 +50,7 @@ class CentiSet(Enemy):
             self.sword = Sword(
                 1,
                 60,
-                self.shared.player.pos
-                + (random.uniform(-30, 30), random.uniform(-30, 30)),
+                self.shared.player.pos + (rng.uniform(-30, 30), rng.uniform(-30, 30)),
             )
 
         if self.sword is None:
@@ -1,12 +1,14 @@
 import pygame
 
+from devex.assets import assets
+from devex.pool import pools
+from devex.render import Layer
 from devex.shared import Shared
-from devex.utils import SinWave, Time, load_scale_3, scale_by
+from devex.utils import SinWave, Time, scale_cache
 
 
 class DeathAnimation:
-    BROKEN_FLOOR_IMAGE = pygame.image.load("assets/broken-floor.png").convert_alpha()
-    BROKEN_FLOOR_IMAGE = scale_by(BROKEN_FLOOR_IMAGE, 0.4)
+    BROKEN_FLOOR_IMAGE = assets.lazy("assets/broken-floor.png", "scale_by", 0.4)
 
     current_frame: pygame.Surface
     pos: pygame.Vector2
@@ -19,6 +21,15 @@ class DeathAnimation:
         self.shared = Shared()
         self.done = False
 
+    def reset(self, pos: pygame.Vector2):
+        """Plays a pooled animation again, reusing its copy of the image"""
+
+        self.current_frame.set_alpha(self.BROKEN_FLOOR_IMAGE.get_alpha())
+        self.rect.center = pos
+        self.pos = self.rect.topleft
+        self.alpha = 255
+        self.done = False
+
     def update(self):
         self.alpha -= 100 * self.shared.dt
         self.current_frame.set_alpha(self.alpha)
@@ -27,13 +38,12 @@ class DeathAnimation:
 
 
 class Sword:
-    IMAGES = load_scale_3("assets/bee_sword.png"), load_scale_3(
-        "assets/centi_sword.png"
+    IMAGES = assets.lazy_frames(
+        ("assets/bee_sword.png", "assets/centi_sword.png"), "scale_by", 3
     )
     INITIAL_SPEED = 100
-    ORIGINAL_AIM_IMAGE = pygame.image.load("assets/attack_area.png").convert_alpha()
-    ORIGINAL_AIM_IMAGE = scale_by(ORIGINAL_AIM_IMAGE, 0.3)
-    BOOM_SFX = pygame.mixer.Sound("assets/explosion.wav")
+    ORIGINAL_AIM_IMAGE = assets.lazy("assets/attack_area.png", "scale_by", 0.3)
+    BOOM_SFX = assets.lazy_sound("assets/explosion.wav")
 
     def __init__(
         self, image_index: int, damage: int, target_pos: pygame.Vector2
@@ -57,7 +67,14 @@ class Sword:
         self.aim_time = Time(2.5)
 
     def aim(self):
-        self.aim_image = scale_by(self.ORIGINAL_AIM_IMAGE, 1 + (self.wave.val() * 0.12))
+        factor = 1 + (self.wave.val() * 0.12)
+        self.aim_image = scale_cache.scale(
+            self.ORIGINAL_AIM_IMAGE,
+            (
+                self.ORIGINAL_AIM_IMAGE.get_width() * factor,
+                self.ORIGINAL_AIM_IMAGE.get_height() * factor,
+            ),
+        )
         self.aim_rect = self.aim_image.get_rect(center=self.target)
 
         if self.aim_time.tick():
@@ -83,7 +100,7 @@ class Sword:
     def on_done(self):
         self.BOOM_SFX.play()
         self.shared.ss.add(1.5, 3.0)
-        self.shared.play_it_once_anims.append(DeathAnimation(self.target))
+        self.shared.play_it_once_anims.add(pools.acquire(DeathAnimation, self.target))
         self.alive = False
 
     def update(self):
@@ -95,7 +112,5 @@ class Sword:
             self.on_done()
 
     def draw(self):
-        self.shared.screen.blit(
-            self.aim_image, self.shared.camera.transform(self.aim_rect)
-        )
-        self.shared.screen.blit(self.image, self.shared.camera.transform(self.rect))
+        self.shared.render.submit(Layer.FLOOR, self.aim_image, self.aim_rect)
+        self.shared.render.submit(Layer.ENEMY_PROJECTILES, self.image, self.rect)
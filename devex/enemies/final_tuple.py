@@ -1,13 +1,68 @@
 import math
-import random
 
+import numpy as np
 import pygame
 
+from devex.assets import assets
+from devex.bloom import Bloom
 from devex.enemies.base import Enemy
 from devex.enemies.falling_sword import Sword
+from devex.hud import Bar
 from devex.player_attacks import Fireball
+from devex.projectiles import ProjectileBatch
+from devex.render import Layer
 from devex.shared import Shared
-from devex.utils import Time, load_scale_3
+from devex.utils import Time, rng, rotation_cache
+
+
+class BossFireballs(ProjectileBatch):
+    """The boss's fireballs, which look like the player's but hit the player"""
+
+    LAYER = Layer.PLAYER_PROJECTILES
+    DECELERATION = 200
+    MIN_SPEED = 100
+    FRAME_TIME = 0.2
+    # Matches the `Bloom` of a player fireball
+    BLOOM_SIZE_FACTOR = 0.3
+    BLOOM_WAVE_SPEED = 0.01
+    BLOOM_EXPANSION = 10
+
+    def add(self, radians: float, pos, damage: float, speed: float):
+        frames = tuple(
+            rotation_cache.rotate(frame, math.degrees(-radians))
+            for frame in Fireball.FRAMES
+        )
+        self.spawn(pos, radians, speed, damage, frames, Fireball.FRAMES[0].get_size())
+
+    def sprites_at(self, indices) -> list[pygame.Surface]:
+        n_frames = len(Fireball.FRAMES)
+        frames = (self.age[indices] / self.FRAME_TIME).astype(int).tolist()
+        return [
+            self.sprites[i][frame % n_frames]
+            for i, frame in zip(indices.tolist(), frames)
+        ]
+
+    def draw_blooms(self):
+        n = self.n
+        width, height = Bloom.IMAGE_V2.get_size()
+        terms = np.sin(self.ticks[:n] * self.BLOOM_WAVE_SPEED) * self.BLOOM_EXPANSION
+        # Truncated like the rect of a `Bloom`
+        widths = (width * self.BLOOM_SIZE_FACTOR + terms).astype(int)
+        heights = (height * self.BLOOM_SIZE_FACTOR + terms).astype(int)
+        self.shared.lightmap.add_many(
+            Bloom.IMAGE_V2,
+            self.x[:n] - widths // 2,
+            self.y[:n] - heights // 2,
+            widths,
+            heights,
+        )
+
+    def draw(self):
+        if not self.n:
+            return
+        # Lights reach further than the sprites, they are culled separately
+        self.draw_blooms()
+        self.draw_sprites(self.on_screen())
 
 
 class HealthBar:
@@ -23,89 +78,86 @@ class HealthBar:
             pygame.Rect(0, 0, *self.BAR_SIZE),
             border_radius=7,
         )
-        self.original_foreground_surf = pygame.Surface(self.BAR_SIZE)
-        self.original_foreground_surf.fill((80, 20, 20))
-        self.foreground_surf = self.original_foreground_surf.copy()
-        self.size = self.BAR_SIZE
+        self.bar = Bar(self.BAR_SIZE, (80, 20, 20))
+        self.foreground_surf = self.bar.render(1.0)
 
     def update(self, health):
-        self.size = (health / self.max_health) * self.BAR_SIZE[0], self.BAR_SIZE[1]
-
-        self.foreground_surf = pygame.Surface(self.BAR_SIZE, pygame.SRCALPHA)
-        pygame.draw.rect(
-            self.foreground_surf,
-            (80, 20, 20),
-            pygame.Rect(0, 0, *self.size),
-            border_radius=7,
-        )
+        self.foreground_surf = self.bar.render(health / self.max_health)
         self.foreground_rect = self.foreground_surf.get_rect(
             midbottom=self.shared.final_boss.rect.midtop
         )
 
     def draw(self):
-        self.shared.screen.blit(
-            self.background_surf, self.shared.camera.transform(self.foreground_rect)
+        self.shared.render.submit(
+            Layer.LABELS, self.background_surf, self.foreground_rect
         )
-        self.shared.screen.blit(
-            self.foreground_surf, self.shared.camera.transform(self.foreground_rect)
+        self.shared.render.submit(
+            Layer.LABELS, self.foreground_surf, self.foreground_rect
         )
 
 
 class FinalBoss(Enemy):
-    IMAGE = load_scale_3("assets/tuple.png")
+    IMAGE = assets.lazy("assets/tuple.png", "scale_by", 3)
     SENSE_RANGE = 1_500
 
     def __init__(self, side, tile_rect, origin) -> None:
-        iso_pos = (
-            side // 2,
-            side // 2,
-        )
         super().__init__(
             tuple,
             "black",
             self.IMAGE.copy(),
-            iso_pos=iso_pos,
-            broken_platform_size=side,
-            tile_rect=tile_rect,
             enemy_speed=100,
-            origin=origin,
             health=1_500,
             bouncy_direction=None,
         )
-
-        self.value = tuple(random.randrange(1, 256) for _ in range(4))
-        self.set_font_surf()
-        self.health_bar = HealthBar(self.health)
+        self.health_bar = HealthBar(self.max_health)
         self.heal_timer = Time(10.0)
         self.attack_timer = Time(20.0)
-        self.healing = False
-        self.current_attacks = [self.throw_fireballs, self.heavenly_swords]
-
         self.fb_timer = Time(4.0)
         self.spread_timer = Time(2.0)
-        self.fireballs: list[Fireball] = []
+        self.fireballs = BossFireballs()
+        self.reset(side, tile_rect, origin)
+
+    def reset(self, side, tile_rect, origin):
+        iso_pos = (
+            side // 2,
+            side // 2,
+        )
+        self.spawn(iso_pos, side, tile_rect, origin)
+
+        self.value = tuple(rng.randrange(1, 256) for _ in range(4))
+        self.set_font_surf()
+        self.healing = False
+        self.current_attacks = [self.throw_fireballs, self.heavenly_swords]
+        for timer in (
+            self.heal_timer,
+            self.attack_timer,
+            self.fb_timer,
+            self.spread_timer,
+        ):
+            timer.reset()
+        self.fireballs.clear()
 
         self.sword = None
 
     def _create_fireball(self):
-        offset_x = random.uniform(-30, 30)
-        offset_y = random.uniform(-30, 30)
+        offset_x = rng.uniform(-30, 30)
+        offset_y = rng.uniform(-30, 30)
         radians = math.atan2(
             self.shared.player.pos.y - self.pos.y, self.shared.player.pos.x - self.pos.x
         )
-        self.fireballs.append(
-            Fireball(radians, self.pos + (offset_x, offset_y), damage=3, speed=500)
+        self.fireballs.add(
+            radians, self.pos + (offset_x, offset_y), damage=3, speed=500
         )
 
     def throw_fireballs(self):
         if self.fb_timer.tick():
-            n_fireballs = random.randrange(2, 5)
+            n_fireballs = rng.randrange(2, 5)
             for _ in range(n_fireballs):
                 self._create_fireball()
 
     def _create_spread_ball(self, n):
         radians = 2 * math.pi * n / 6
-        self.fireballs.append(Fireball(radians, self.pos, damage=3))
+        self.fireballs.add(radians, self.pos, damage=3, speed=Fireball.INITIAL_SPEED)
 
     def spread_fireballs(self):
         if self.spread_timer.tick():
@@ -114,28 +166,19 @@ class FinalBoss(Enemy):
                 self._create_spread_ball(n)
 
     def update_fb(self):
-        for fb in self.fireballs[:]:
-            fb.update()
-
-            if not fb.alive:
-                self.fireballs.remove(fb)
-                continue
-            if fb.rect.colliderect(self.shared.player.rect):
-                self.shared.player.modify_health(-fb.damage)
-                self.fireballs.remove(fb)
+        self.fireballs.update()
 
     def start_condition(self):
         if self.sword is not None:
             return False
-        return self.pos.distance_to(self.shared.player.pos) < self.SENSE_RANGE
+        return self.player_in_range(self.SENSE_RANGE)
 
     def heavenly_swords(self):
         if self.start_condition():
             self.sword = Sword(
-                random.randint(0, 1),
+                rng.randint(0, 1),
                 10,
-                self.shared.player.pos
-                + (random.uniform(-30, 30), random.uniform(-30, 30)),
+                self.shared.player.pos + (rng.uniform(-30, 30), rng.uniform(-30, 30)),
             )
 
         if self.sword is None:
@@ -148,7 +191,7 @@ class FinalBoss(Enemy):
     def heal(self):
         if self.heal_timer.tick():
             self.healing = False
-            self.current_attacks = random.choices(
+            self.current_attacks = rng.choices(
                 (self.throw_fireballs, self.spread_fireballs, self.heavenly_swords), k=2
             )
             self.attack_timer.reset()
@@ -179,7 +222,6 @@ class FinalBoss(Enemy):
         self.font_rect.midtop = self.pos
 
     def update(self):
-        self.image = self.original_image.copy()
         super().update()
         self.health_bar.update(self.health)
         self.update_behaviour()
@@ -187,8 +229,7 @@ class FinalBoss(Enemy):
     def draw(self):
         super().draw()
         self.health_bar.draw()
-        for fb in self.fireballs:
-            fb.draw()
+        self.fireballs.draw()
 
         if self.sword is None:
             return
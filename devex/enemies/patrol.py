@@ -0,0 +1,135 @@
+import itertools
+import math
+
+import numpy as np
+
+
+class Patrol:
+    """
+    Patrol movement and bounce of many enemies, kept in arrays.
+
+    Enemies walk back and forth between the two ends of their path while their
+    size bounces on a sine wave. Both are advanced for all enemies at once, then
+    only what update code reads, positions, rects and sizes, is written back to
+    the enemies. Their images are morphed when they are drawn.
+    """
+
+    # Matches the `SinWave` and amplitude enemies bounce with on their own
+    WAVE_SPEED = 0.06
+    BOUNCE = 5
+
+    def __init__(self, index=None, capacity: int = 8) -> None:
+        # `SpatialIndex` kept in step with the enemies as they move
+        self.index = index
+        self.n = 0
+        self.pos = np.zeros((capacity, 2))
+        # The end of the path each enemy walks to and the one it came from
+        self.target = np.zeros((capacity, 2))
+        self.other = np.zeros((capacity, 2))
+        self.speed = np.zeros(capacity)
+        self.rad = np.zeros(capacity)
+        self.original_size = np.zeros(capacity)
+        self.enemies: list = []
+        self.indices: dict = {}
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def arrays(self) -> tuple[np.ndarray, ...]:
+        return (
+            self.pos,
+            self.target,
+            self.other,
+            self.speed,
+            self.rad,
+            self.original_size,
+        )
+
+    def grow(self):
+        (
+            self.pos,
+            self.target,
+            self.other,
+            self.speed,
+            self.rad,
+            self.original_size,
+        ) = (np.concatenate((array, np.zeros_like(array))) for array in self.arrays)
+
+    def add(self, enemy):
+        if self.n == len(self.speed):
+            self.grow()
+        i = self.n
+        self.pos[i] = enemy.pos
+        self.target[i] = enemy.final_screen_pos
+        self.other[i] = enemy.initial_screen_pos
+        self.speed[i] = enemy.speed
+        self.rad[i] = enemy.bouncy_wave.rad
+        self.original_size[i] = enemy.original_size
+        self.enemies.append(enemy)
+        self.indices[enemy] = i
+        self.n += 1
+        enemy.patrol = self
+
+    def remove(self, enemy):
+        """Hands the enemy back its own movement, in O(1)"""
+
+        i = self.indices.pop(enemy)
+        enemy.patrol = None
+        enemy.bouncy_wave.rad = float(self.rad[i])
+        target = tuple(self.target[i].tolist())
+        other = tuple(self.other[i].tolist())
+        enemy.current_target = target
+        enemy.targets = itertools.cycle((other, target))
+
+        # The last enemy takes the freed slot
+        last = self.n - 1
+        if i != last:
+            for array in self.arrays:
+                array[i] = array[last]
+            moved = self.enemies[last]
+            self.enemies[i] = moved
+            self.indices[moved] = i
+        self.enemies.pop()
+        self.n = last
+
+    def clear(self):
+        for enemy in self.enemies:
+            enemy.patrol = None
+        self.enemies.clear()
+        self.indices.clear()
+        self.n = 0
+
+    def step(self, dt: float):
+        n = self.n
+        if not n:
+            return
+        pos, target = self.pos[:n], self.target[:n]
+
+        # `Vector2.move_towards_ip`, snapping onto targets within reach
+        delta = target - pos
+        distance = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        reach = self.speed[:n] * dt
+        arrived = distance <= reach
+        if arrived.any():
+            pos += delta * (reach / np.where(arrived, 1.0, distance))[:, None]
+            pos[arrived] = target[arrived]
+            # Enemies that reached one end of their path head to the other
+            other = self.other[:n]
+            target[arrived], other[arrived] = other[arrived], target[arrived]
+        else:
+            pos += delta * (reach / distance)[:, None]
+
+        rad = self.rad[:n]
+        rad += self.WAVE_SPEED
+        rad[rad >= 2 * math.pi] = 0
+        sizes = self.original_size[:n] + np.sin(rad) * self.BOUNCE
+
+        index = self.index
+        for enemy, xy, size in zip(self.enemies, pos.tolist(), sizes.tolist()):
+            enemy.prev_pos.update(enemy.pos)
+            enemy.pos.update(xy)
+            enemy.rect.midbottom = xy
+            enemy.size = size
+            if index is not None:
+                index.update(enemy)
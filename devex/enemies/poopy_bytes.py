@@ -1,14 +1,14 @@
-import random
 import string
 
 import pygame
 
+from devex.assets import assets
 from devex.enemies.base import Enemy
-from devex.utils import load_scale_3
+from devex.utils import rng
 
 
 class PoopyBytes(Enemy):
-    IMAGE = load_scale_3("assets/bytes.png")
+    IMAGE = assets.lazy("assets/bytes.png", "scale_by", 3)
     SPEED = 45
     ATTACK_SPEED = 80
     DAMAGE = 10
@@ -16,23 +16,19 @@ class PoopyBytes(Enemy):
     def __init__(
         self, broken_platform_size: int, tile_rect: pygame.Rect, origin: tuple[int, int]
     ) -> None:
+        super().__init__(int, "purple", PoopyBytes.IMAGE, PoopyBytes.SPEED)
+        self.reset(broken_platform_size, tile_rect, origin)
+
+    def reset(
+        self, broken_platform_size: int, tile_rect: pygame.Rect, origin: tuple[int, int]
+    ):
         iso_pos = (
-            random.randrange(2, broken_platform_size - 2) + origin[0],
-            random.randrange(2, broken_platform_size - 2) + origin[1],
+            rng.randrange(2, broken_platform_size - 2) + origin[0],
+            rng.randrange(2, broken_platform_size - 2) + origin[1],
         )
-        super().__init__(
-            int,
-            "purple",
-            PoopyBytes.IMAGE,
-            iso_pos,
-            broken_platform_size,
-            tile_rect,
-            PoopyBytes.SPEED,
-            origin,
-        )
-
-        list_str = list(string.ascii_lowercase[: random.randrange(4, 8)])
-        random.shuffle(list_str)
+        self.spawn(iso_pos, broken_platform_size, tile_rect, origin)
+        list_str = list(string.ascii_lowercase[: rng.randrange(4, 8)])
+        rng.shuffle(list_str)
         list_str = "".join(list_str)
         self.value = f'b"{list_str}"'
         self.set_font_surf()
@@ -52,12 +48,14 @@ class PoopyBytes(Enemy):
             self.shared.ss.add(0.3, 0.5)
             self.alive = False
 
-    def update(self):
+    def move(self):
         if self.start_condition():
             self.attack_player()
         else:
-            self.move()
+            super().move()
 
-        self.morph_image()
-        self.take_damage()
-        self.highlight_red()
+    def update(self):
+        # Once hit it chases the player instead of patrolling
+        if self.start_condition():
+            self.leave_patrol()
+        super().update()
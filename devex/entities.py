@@ -0,0 +1,125 @@
+"""
+Entity collections with cheap removal.
+
+Game objects die in the middle of the loop that updates them. An `EntityList`
+removes them in O(1) by leaving a tombstone in their slot, and compacts the
+tombstones away in one pass once no loop is walking the list, so entities can be
+added and removed while it is iterated.
+"""
+
+import typing as t
+
+T = t.TypeVar("T")
+
+
+class EntityList(t.Generic[T]):
+    """
+    Entities in the order they were added. `add` returns a handle that stays
+    valid until the entity is removed, `items` pairs each entity with its handle.
+    Entities added during an iteration are not visited by it.
+    """
+
+    # Compacts once this fraction of the slots are tombstones
+    MAX_DEAD_FRACTION = 0.25
+
+    def __init__(self, entities: t.Iterable[T] = ()) -> None:
+        self.slots: list[T | None] = []
+        self.handles: list[int] = []
+        # Handle to the index of its slot
+        self.where: dict[int, int] = {}
+        self.next_handle = 0
+        self.n_dead = 0
+        self.iterating = 0
+        self.extend(entities)
+
+    def __len__(self) -> int:
+        return len(self.slots) - self.n_dead
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> t.Iterator[T]:
+        for _, entity in self.items():
+            yield entity
+
+    def __getitem__(self, handle: int) -> T:
+        return self.slots[self.where[handle]]
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self.where
+
+    def add(self, entity: T) -> int:
+        handle = self.next_handle
+        self.next_handle += 1
+        self.where[handle] = len(self.slots)
+        self.slots.append(entity)
+        self.handles.append(handle)
+        return handle
+
+    def extend(self, entities: t.Iterable[T]):
+        for entity in entities:
+            self.add(entity)
+
+    def remove(self, handle: int) -> T:
+        i = self.where.pop(handle)
+        entity = self.slots[i]
+        self.slots[i] = None
+        self.n_dead += 1
+        if not self.iterating:
+            self.compact_if_sparse()
+        return entity
+
+    def clear(self):
+        self.where.clear()
+        if self.iterating:
+            self.slots[:] = [None] * len(self.slots)
+            self.n_dead = len(self.slots)
+            return
+        self.slots.clear()
+        self.handles.clear()
+        self.n_dead = 0
+
+    def items(self) -> t.Iterator[tuple[int, T]]:
+        slots, handles = self.slots, self.handles
+        self.iterating += 1
+        try:
+            for i in range(len(slots)):
+                entity = slots[i]
+                if entity is not None:
+                    yield handles[i], entity
+        finally:
+            self.iterating -= 1
+            if not self.iterating:
+                self.compact_if_sparse()
+
+    def compact_if_sparse(self):
+        if self.n_dead > len(self.slots) * self.MAX_DEAD_FRACTION:
+            self.compact()
+
+    def compact(self):
+        """Drops the tombstones, keeping the order of the entities"""
+
+        if self.iterating:
+            raise RuntimeError("EntityList compacted while being iterated")
+        live = [
+            (handle, entity)
+            for handle, entity in zip(self.handles, self.slots)
+            if entity is not None
+        ]
+        self.handles = [handle for handle, _ in live]
+        self.slots = [entity for _, entity in live]
+        self.where = {handle: i for i, handle in enumerate(self.handles)}
+        self.n_dead = 0
+
+    def sort(self, key: t.Callable[[T], t.Any]):
+        self.compact()
+        order = sorted(range(len(self.slots)), key=lambda i: key(self.slots[i]))
+        self.slots = [self.slots[i] for i in order]
+        self.handles = [self.handles[i] for i in order]
+        self.where = {handle: i for i, handle in enumerate(self.handles)}
+
+    def last(self) -> T:
+        for i in range(len(self.slots) - 1, -1, -1):
+            if self.slots[i] is not None:
+                return self.slots[i]
+        raise IndexError("last of an empty EntityList")
@@ -1,48 +1,154 @@
 import asyncio
+import os
 
 import pygame
 
+from .assets import assets
+from .dirty import presenter
+from .instrument import InstrumentOverlay, instruments
+from .profiler import SpikeProfiler
 from .shared import Shared
+from .sprite_pack import PACK_PATH
+from .trace import tracer
+from .utils import sim_clock
 
 
 class Game:
-    def __init__(self) -> None:
+    TICK_RATE = 60
+    FPS_CAP = 144
+    # Frame time is clamped to this many ticks so a long hitch can't spiral
+    MAX_STEPS = 5
+
+    def __init__(
+        self,
+        tick_rate: int = TICK_RATE,
+        fps_cap: int = FPS_CAP,
+        vsync: bool = False,
+        instrument: bool = False,
+        spike_budget: float | None = None,
+        trace: str | None = None,
+        dirty_rects: bool = False,
+    ) -> None:
+        """
+        fps_cap: Upper bound on rendered frames per second, 0 for no cap.
+        vsync: Requests vsync, the display is then made SCALED.
+        instrument: Times the hot paths and shows them in an overlay (F3).
+        spike_budget: Dumps a stack profile of frames over this many ms.
+        trace: Records a Chrome trace of the session to this path.
+        dirty_rects: Only updates the parts of the display that changed.
+        """
+
+        # Started first so every asset load is recorded
+        if trace is not None:
+            tracer.start(trace)
+
         pygame.init()
         self.shared = Shared()
+        self.step = 1 / tick_rate
+        self.fps_cap = fps_cap
+        self.vsync = vsync
+        self.accumulator = 0.0
+        self.events: list[pygame.event.Event] = []
         self.win_init()
+        assets.open_pack(PACK_PATH)
 
         from .states import StateManager
 
         self.state_manager = StateManager()
+        self.overlay = None
+        self.profiler = None
+        self.presenter = None
+        # The counting canvas is copied whole, so it would dirty every frame
+        if dirty_rects and not (instrument or spike_budget is not None):
+            self.presenter = presenter
+            self.presenter.enable(self.shared)
+        if instrument or spike_budget is not None:
+            instruments.enable(self.shared)
+        if instrument:
+            self.overlay = InstrumentOverlay()
+        if spike_budget is not None:
+            self.profiler = SpikeProfiler(spike_budget)
+            self.profiler.start()
 
     def win_init(self):
-        self.shared.screen = pygame.display.set_mode(
-            self.shared.SCRECT.size, pygame.NOFRAME
-        )
+        flags = pygame.NOFRAME
+        # pygame only honors vsync on SCALED or OPENGL displays
+        if self.vsync:
+            flags |= pygame.SCALED
+        try:
+            self.shared.screen = pygame.display.set_mode(
+                self.shared.SCRECT.size, flags, vsync=self.vsync
+            )
+        except pygame.error:
+            self.shared.screen = pygame.display.set_mode(
+                self.shared.SCRECT.size, pygame.NOFRAME
+            )
         self.clock = pygame.time.Clock()
 
     def _update(self):
-        self.shared.events = pygame.event.get()
+        """Advances the simulation by exactly one tick"""
+
+        self.shared.events = self.events
+        self.events = []
         self.shared.mouse_press = pygame.mouse.get_pressed()
-        self.shared.dt = self.clock.tick() / 1000
-        self.shared.dt = min(self.shared.dt, 0.1)
+        self.shared.dt = self.step
+        sim_clock.advance(self.step)
 
-        self.state_manager.update()
+        with tracer.span("update", "loop"):
+            self.state_manager.update()
 
     def _draw(self):
-        self.shared.screen.fill("black")
-        self.state_manager.draw()
+        with tracer.span("draw", "loop"):
+            if self.presenter is not None:
+                self.presenter.begin()
+            else:
+                self.shared.screen.fill("black")
+            self.state_manager.draw()
+            instruments.present()
+            if self.overlay is not None:
+                self.overlay.draw(instruments.display)
+
+        with tracer.span("display.flip", "loop"):
+            if self.presenter is not None:
+                self.presenter.present()
+            else:
+                pygame.display.flip()
 
-        pygame.display.flip()
+    def _frame(self):
+        instruments.begin_frame()
+        with tracer.span("clock.tick", "loop"):
+            frame_time = self.clock.tick(self.fps_cap) / 1000
+        self.accumulator += min(frame_time, self.MAX_STEPS * self.step)
+
+        # Events are held until the next tick so none are lost or repeated
+        self.events.extend(pygame.event.get())
+        if self.overlay is not None:
+            self.overlay.update(self.events)
+        while self.accumulator >= self.step:
+            self._update()
+            self.accumulator -= self.step
+
+        # Camera, player, enemies and projectiles are drawn between their last
+        # two ticks. Lights, swords and effects snap at the tick rate.
+        self.shared.alpha = self.accumulator / self.step
+        self._draw()
+        instruments.end_frame()
 
     async def run(self):
         while True:
-            self._update()
-            self._draw()
+            self._frame()
 
             await asyncio.sleep(0)
 
 
 def main():
-    game = Game()
+    spike_budget = os.environ.get("DEVEX_SPIKE_BUDGET")
+    game = Game(
+        fps_cap=int(os.environ.get("DEVEX_FPS_CAP", Game.FPS_CAP)),
+        vsync=bool(os.environ.get("DEVEX_VSYNC")),
+        instrument=bool(os.environ.get("DEVEX_INSTRUMENT")),
+        spike_budget=None if spike_budget is None else float(spike_budget),
+        trace=os.environ.get("DEVEX_TRACE"),
+        dirty_rects=bool(os.environ.get("DEVEX_DIRTY_RECTS")),
+    )
     asyncio.run(game.run())
@@ -3,9 +3,10 @@ import time
 
 import pygame
 
+from .dirty import presenter
 from .shared import Shared
 from .state_enums import State
-from .utils import Time, get_font, render_at
+from .utils import Time, get_font, render_at, set_cursor
 from .widgets import Widgets
 
 
@@ -19,6 +20,7 @@ class PreviewLastGame:
             self.current_pic = next(self.pics)
         except:
             self.current_pic = pygame.Surface(Shared.SCRECT.size)
+        self.gray_pic = pygame.transform.grayscale(self.current_pic)
         self.timer = Time(5.0)
 
     def update(self):
@@ -27,16 +29,18 @@ class PreviewLastGame:
                 self.current_pic = next(self.pics)
             except:
                 self.current_pic = pygame.Surface(Shared.SCRECT.size)
+            self.gray_pic = pygame.transform.grayscale(self.current_pic)
 
     def draw(self):
-        self.shared.screen.blit(pygame.transform.grayscale(self.current_pic), (0, 0))
+        with presenter.untracked(self.current_pic):
+            self.shared.screen.blit(self.gray_pic, (0, 0))
 
 
 class GameOverState:
     REQUIRED_FIELDS = ["screen", "start_time", "gameplay_pics"]
 
     def __init__(self) -> None:
-        pygame.mouse.set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         self.next_state = None
         self.shared = Shared()
         self.clean_shared_data()
@@ -4,12 +4,18 @@ import pygame
 
 from .camera import Camera
 from .cursor import Cursor
+from .enemies.falling_sword import DeathAnimation
+from .entities import EntityList
+from .lighting import LightMap
 from .platform import PlatformManager
 from .player import Player
+from .player_attacks import Fireball, SpiralFireball
+from .pool import pools
+from .render import Layer, RenderQueue
 from .shared import Shared
 from .ss_manager import ScreenShakeManager
 from .state_enums import State
-from .utils import Time
+from .utils import PlayItOnceAnimation, Time
 from .widgets import MessageLogWidget, Widgets
 
 
@@ -32,24 +38,37 @@ class GameState:
         self.plat = PlatformManager()
         self.player = Player(self.origin)
         self.shared.player = self.player
-        self.shared.overlay = self.shared.screen.copy()
-        self.shared.overlay.fill("black")
-        self.shared.overlay.set_alpha(150)
-        self.shared.provisional_chunk = self.shared.screen.copy()
-        self.shared.play_it_once_anims = []
+        self.shared.lightmap = LightMap()
+        self.shared.render = RenderQueue()
+        self.shared.play_it_once_anims = EntityList()
         self.shared.cursor = Cursor()
+        self.warm_pools()
 
         # Info for game over/victory state
         self.shared.start_time = time.time()
         self.shared.gameplay_pics: list[pygame.Surface] = []
         self.pic_timer = Time(30.0)
 
+    def warm_pools(self):
+        """
+        Pre-allocates what combat spawns. Enemies are not warmed, constructing
+        them rolls the world's random numbers. Their pools fill as they die,
+        before a cleared platform regenerates them.
+        """
+
+        pools.warm(Fireball, 24, 0.0, (0, 0))
+        pools.warm(SpiralFireball, 12, 0.0)
+        pools.warm(PlayItOnceAnimation, 24, Fireball.EXPLOSION_FRAMES, 0.08, (0, 0))
+        pools.warm(DeathAnimation, 8, (0, 0))
+
     def update_anims(self):
-        for anim in self.shared.play_it_once_anims[:]:
+        anims = self.shared.play_it_once_anims
+        for handle, anim in anims.items():
             anim.update()
 
             if anim.done:
-                self.shared.play_it_once_anims.remove(anim)
+                anims.remove(handle)
+                pools.release(anim)
 
     def update(self):
         self.shared.camera.attach_to_player()
@@ -68,34 +87,34 @@ class GameState:
         self.on_victory()
 
     def draw_before_overlay(self):
-        self.shared.overlay.fill("black")
+        self.shared.lightmap.clear()
         self.plat.draw()
 
     def draw_on_overlay(self):
         self.player.draw()
         self.plat.draw_torches()
         self.plat.draw_programs()
+        self.plat.draw_lights()
+        self.shared.render.flush()
         if self.shared.final_boss is None:
-            self.shared.screen.blit(
-                self.shared.overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MIN
-            )
+            self.shared.lightmap.apply(self.shared.screen)
 
     def draw_after_overlay(self):
+        self.shared.render.flush()
         self.player.health_bar.draw()
         self.player.energy_bar.draw()
         self.player.q_attack.draw_front()
         self.player.w_attack.draw_front()
         self.player.e_attack.draw_front()
         self.draw_once_anims()
+        self.shared.render.flush()
 
     def draw_once_anims(self):
         for anim in self.shared.play_it_once_anims:
             if hasattr(anim, "draw"):
                 anim.draw()
                 continue
-            self.shared.screen.blit(
-                anim.current_frame, self.shared.camera.transform(anim.pos)
-            )
+            self.shared.render.submit(Layer.EFFECTS, anim.current_frame, anim.pos)
 
     def draw_final_boss(self):
         if self.shared.final_boss is not None and self.plat.done:
@@ -119,6 +138,7 @@ class GameState:
                 self.shared.gameplay_pics.pop(0)
 
     def draw(self):
+        self.shared.camera.update_viewport()
         self.draw_before_overlay()
         if self.plat.done:
             self.draw_on_overlay()
@@ -0,0 +1,126 @@
+"""
+Runs the game without a window or audio, stepping ticks as fast as possible.
+
+    python -m devex.headless --ticks 3600 --seed 1
+
+Import this module before anything else from devex, the SDL drivers have to be
+picked before the screen size is read.
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from .game import Game
+from .instrument import instruments
+from .pool import pools
+from .state_enums import State
+from .utils import rng
+
+
+class HeadlessGame(Game):
+    """Game on the SDL dummy drivers where the same seed plays out the same way"""
+
+    def __init__(
+        self,
+        seed: int | None = 0,
+        tick_rate: int = Game.TICK_RATE,
+        instrument: bool = False,
+        spike_budget: float | None = None,
+        trace: str | None = None,
+        dirty_rects: bool = False,
+    ) -> None:
+        rng.seed(seed)
+        super().__init__(
+            tick_rate,
+            fps_cap=0,
+            instrument=instrument,
+            spike_budget=spike_budget,
+            trace=trace,
+            dirty_rects=dirty_rects,
+        )
+
+    def win_init(self):
+        self.shared.screen = pygame.display.set_mode(self.shared.SCRECT.size)
+        self.clock = pygame.time.Clock()
+
+    def start(self, state: State = State.GAME):
+        if state in (State.GAME_OVER, State.VICTORY):
+            # The end screens show a finished game, start them after a blank one
+            self.shared.start_time = time.time()
+            self.shared.gameplay_pics = [pygame.Surface(self.shared.SCRECT.size)]
+        self.state_manager.state_enum = state
+
+    def advance(self, ticks: int, draw: bool = True):
+        """Steps the given number of ticks back to back, with no frame pacing"""
+
+        for _ in range(ticks):
+            instruments.begin_frame()
+            self.events.extend(pygame.event.get())
+            self._update()
+            if draw:
+                self._draw()
+            instruments.end_frame()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-draw", action="store_true")
+    parser.add_argument("--instrument", action="store_true")
+    parser.add_argument("--spike-budget", type=float, help="ms, dumps to profiles/")
+    parser.add_argument("--trace", help="write a Chrome trace to this path")
+    parser.add_argument("--dirty-rects", action="store_true")
+    parser.add_argument(
+        "--state", choices=[state.name for state in State], default=State.GAME.name
+    )
+    args = parser.parse_args()
+
+    game = HeadlessGame(
+        args.seed,
+        instrument=args.instrument,
+        spike_budget=args.spike_budget,
+        trace=args.trace,
+        dirty_rects=args.dirty_rects,
+    )
+    game.start(State[args.state])
+    start = time.perf_counter()
+    game.advance(args.ticks, draw=not args.no_draw)
+    elapsed = time.perf_counter() - start
+
+    plat = getattr(game.shared, "plat", None)
+    print(
+        f"{args.ticks} ticks in {elapsed:.2f}s "
+        f"({args.ticks / elapsed:.0f} ticks/s), "
+        f"{0 if plat is None else len(plat.enemy_index)} enemies alive"
+    )
+
+    for name, (hits, misses, free) in pools.stats().items():
+        print(f"  {name:<24}{hits:6} pool hits {misses:6} misses {free:4} free")
+
+    if game.presenter is not None:
+        print(
+            f"{game.presenter.n_full} full flips, "
+            f"{game.presenter.n_partial} partial updates"
+        )
+
+    if game.profiler is not None:
+        print(f"{game.profiler.n_dumps} spikes dumped to {game.profiler.out_dir}")
+
+    if args.instrument:
+        frame_ms, scopes, counters = instruments.averages(instruments.HISTORY)
+        print(f"\nlast {len(instruments.frames)} ticks, {frame_ms:.2f} ms per tick")
+        for name, ms in sorted(scopes.items(), key=lambda item: -item[1]):
+            print(f"  {name:<32}{ms:8.3f} ms")
+        for name, value in sorted(counters.items()):
+            print(f"  {name:<32}{value:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
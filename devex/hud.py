@@ -0,0 +1,54 @@
+"""
+Retained HUD elements.
+
+Each keeps the surface it last rendered and only redraws it when what it shows
+changes, so a steady HUD costs a few blits of cached surfaces per frame.
+"""
+
+import typing as t
+
+import pygame
+
+from .text import text_cache
+
+
+class Bar:
+    """Rounded bar filled from the left, redrawn when its pixel width changes"""
+
+    def __init__(self, size: t.Sequence[int], color, border_radius: int = 7) -> None:
+        self.size = size
+        self.color = color
+        self.border_radius = border_radius
+        self.surf = pygame.Surface(size, pygame.SRCALPHA)
+        self.width: int | None = None
+
+    def render(self, fraction: float) -> pygame.Surface:
+        width = int(max(0.0, min(fraction, 1.0)) * self.size[0])
+        if width == self.width:
+            return self.surf
+
+        self.width = width
+        self.surf.fill((0, 0, 0, 0))
+        pygame.draw.rect(
+            self.surf,
+            self.color,
+            pygame.Rect(0, 0, width, self.size[1]),
+            border_radius=self.border_radius,
+        )
+        return self.surf
+
+
+class Label:
+    """Antialiased text, re-rendered when the text changes"""
+
+    def __init__(self, font: pygame.font.Font, color) -> None:
+        self.font = font
+        self.color = color
+        self.text: str | None = None
+        self.surf: pygame.Surface | None = None
+
+    def render(self, text: str) -> pygame.Surface:
+        if text != self.text:
+            self.text = text
+            self.surf = text_cache.render(self.font, text, True, self.color)
+        return self.surf
@@ -0,0 +1,308 @@
+"""
+Opt-in timing scopes and per-frame counters for the hot paths.
+
+Nothing is patched until `instruments.enable()` is called, so while disabled
+the only cost is a flag check at the start and end of every frame.
+"""
+
+import collections
+import functools
+import importlib
+import time
+import typing as t
+
+import pygame
+
+from .utils import get_font
+
+# (module, class, method) of the hot paths, timed as "Class.method"
+SCOPES = (
+    ("devex.states", "StateManager", "update"),
+    ("devex.states", "StateManager", "draw"),
+    ("devex.platform", "PlatformManager", "update"),
+    ("devex.platform", "PlatformManager", "draw"),
+    ("devex.platform", "PlatformManager", "create_new_plat"),
+    ("devex.platform", "BrokenPlatform", "update_enemies"),
+    ("devex.enemies.final_tuple", "FinalBoss", "update"),
+    ("devex.enemies.final_tuple", "FinalBoss", "throw_fireballs"),
+    ("devex.enemies.final_tuple", "FinalBoss", "spread_fireballs"),
+    ("devex.player", "Player", "update"),
+    ("devex.widgets", "Widgets", "update"),
+    ("devex.widgets", "Widgets", "draw"),
+    ("devex.widgets", "InventoryWidget", "construct"),
+    ("devex.gamestate", "GameState", "draw_on_overlay"),
+)
+COUNTED_TRANSFORMS = ("scale", "smoothscale", "scale_by", "rotate", "rotozoom")
+
+BaseSurface = pygame.Surface
+
+
+class SurfaceMeta(type):
+    """Keeps `isinstance(surf, pygame.Surface)` true for every surface while patched"""
+
+    def __instancecheck__(cls, obj) -> bool:
+        return isinstance(obj, BaseSurface)
+
+    def __subclasscheck__(cls, subclass) -> bool:
+        return issubclass(subclass, BaseSurface)
+
+
+class CountedSurface(BaseSurface, metaclass=SurfaceMeta):
+    """Stands in for `pygame.Surface` while enabled, counting allocations and blits"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        instruments.count("surfaces")
+
+    def blit(self, *args, **kwargs):
+        instruments.count("blits")
+        return super().blit(*args, **kwargs)
+
+    def blits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        instruments.count("blits", len(blit_sequence))
+        return super().blits(blit_sequence, *args, **kwargs)
+
+    def fblits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        instruments.count("blits", len(blit_sequence))
+        return super().fblits(blit_sequence, *args, **kwargs)
+
+
+class FrameStats:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.start = time.perf_counter()
+        self.end_time = self.start
+        self.duration = 0.0
+        # Inclusive milliseconds per scope, summed over every call this frame
+        self.scopes: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+    def end(self):
+        self.end_time = time.perf_counter()
+        self.duration = (self.end_time - self.start) * 1000
+
+    def as_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "duration_ms": self.duration,
+            "scopes_ms": self.scopes,
+            "counters": self.counters,
+        }
+
+
+class Scope:
+    """Context manager form of a timing scope, for code that isn't a method"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        instruments.add_time(self.name, time.perf_counter() - self.start)
+
+
+class NullScope:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class Instruments:
+    HISTORY = 120
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.frames: collections.deque[FrameStats] = collections.deque(
+            maxlen=self.HISTORY
+        )
+        self.current: FrameStats | None = None
+        self.n_frames = 0
+        self.patched: list[tuple[t.Any, str, t.Any]] = []
+        self.null_scope = NullScope()
+        # Called with every finished frame
+        self.frame_listeners: list[t.Callable[[FrameStats], None]] = []
+
+    def patch(self, owner, attr: str, replacement):
+        self.patched.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, replacement)
+
+    def timed(self, name: str, func: t.Callable) -> t.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add_time(name, time.perf_counter() - start)
+
+        return wrapper
+
+    def counted(self, name: str, func: t.Callable) -> t.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.count(name)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def enable(self, shared):
+        """Wraps the hot paths, counts through pygame and draws into a canvas"""
+
+        if self.enabled:
+            return
+        self.enabled = True
+
+        for module_name, class_name, method in SCOPES:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            self.patch(
+                cls, method, self.timed(f"{class_name}.{method}", getattr(cls, method))
+            )
+        for name in COUNTED_TRANSFORMS:
+            self.patch(
+                pygame.transform,
+                name,
+                self.counted(f"transform.{name}", getattr(pygame.transform, name)),
+            )
+        self.patch(pygame, "Surface", CountedSurface)
+
+        # Blits onto the display surface can't be intercepted, so frames are
+        # drawn into a counted canvas that is copied to the display on present
+        self.shared = shared
+        self.display = shared.screen
+        shared.screen = CountedSurface(self.display.get_size())
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        for owner, attr, original in reversed(self.patched):
+            setattr(owner, attr, original)
+        self.patched.clear()
+        self.shared.screen = self.display
+
+    def scope(self, name: str) -> Scope | NullScope:
+        if not self.enabled:
+            return self.null_scope
+        return Scope(name)
+
+    def add_time(self, name: str, seconds: float):
+        if self.current is None:
+            return
+        scopes = self.current.scopes
+        scopes[name] = scopes.get(name, 0.0) + seconds * 1000
+
+    def count(self, name: str, n: int = 1):
+        if self.current is None:
+            return
+        counters = self.current.counters
+        counters[name] = counters.get(name, 0) + n
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = FrameStats(self.n_frames)
+        self.n_frames += 1
+
+    def end_frame(self):
+        if self.current is None:
+            return
+        self.count_entities()
+        self.current.end()
+        self.frames.append(self.current)
+        frame, self.current = self.current, None
+        for listener in self.frame_listeners:
+            listener(frame)
+
+    def count_entities(self):
+        counters = self.current.counters
+        plat = getattr(self.shared, "plat", None)
+        if plat is not None:
+            counters["platforms"] = len(plat.platforms)
+            counters["enemies"] = len(plat.enemy_index)
+        player = getattr(self.shared, "player", None)
+        if player is not None:
+            counters["fireballs"] = len(player.fireball_manager.fireballs) + len(
+                player.e_attack.fireballs
+            )
+        camera = getattr(self.shared, "camera", None)
+        if camera is not None:
+            counters["culled"] = camera.culled
+
+    def averages(self, n_frames: int = 60) -> tuple[float, dict, dict]:
+        """Mean frame time, scope times and counters over the last frames"""
+
+        frames = list(self.frames)[-n_frames:]
+        if not frames:
+            return 0.0, {}, {}
+
+        scopes = collections.Counter()
+        counters = collections.Counter()
+        for frame in frames:
+            scopes.update(frame.scopes)
+            counters.update(frame.counters)
+
+        n = len(frames)
+        return (
+            sum(frame.duration for frame in frames) / n,
+            {name: total / n for name, total in scopes.items()},
+            {name: total / n for name, total in counters.items()},
+        )
+
+    def present(self):
+        """Copies the canvas to the display, call before flipping"""
+
+        if self.enabled:
+            self.display.blit(self.shared.screen, (0, 0))
+
+
+class InstrumentOverlay:
+    """Rolling averages drawn over the top left of the display, F3 toggles"""
+
+    FONT_PATH = "assets/Hack/Hack Regular Nerd Font Complete Mono.ttf"
+
+    def __init__(self) -> None:
+        self.font = get_font(self.FONT_PATH, 14)
+        self.visible = True
+        self.surf: pygame.Surface | None = None
+        self.refresh_every = 15
+
+    def update(self, events: t.Iterable[pygame.event.Event]):
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.visible = not self.visible
+
+    def render(self):
+        frame_ms, scopes, counters = instruments.averages()
+        lines = [f"frame {frame_ms:6.2f} ms"]
+        lines += [
+            f"{name:<32}{ms:6.2f} ms"
+            for name, ms in sorted(scopes.items(), key=lambda item: -item[1])
+        ]
+        lines += [f"{name:<32}{value:8.1f}" for name, value in sorted(counters.items())]
+
+        line_height = self.font.get_linesize()
+        self.surf = BaseSurface((360, line_height * len(lines) + 10), pygame.SRCALPHA)
+        self.surf.fill((0, 0, 0, 170))
+        for n, line in enumerate(lines):
+            self.surf.blit(
+                self.font.render(line, True, "white"), (5, 5 + n * line_height)
+            )
+
+    def draw(self, display: pygame.Surface):
+        if not self.visible:
+            return
+        # Re-rendered every few frames, the text would be unreadable otherwise
+        if self.surf is None or instruments.n_frames % self.refresh_every == 0:
+            self.render()
+        display.blit(self.surf, (0, 0))
+
+
+instruments = Instruments()
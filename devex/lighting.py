@@ -0,0 +1,175 @@
+import math
+import typing as t
+
+import numpy as np
+import pygame
+
+from .dirty import presenter
+from .shared import Shared
+from .utils import scale_cache
+
+
+class LightMap:
+    """Accumulates lights at a fraction of the screen resolution.
+
+    The lightmap is upscaled once per frame and combined with the screen using
+    `BLEND_RGBA_MIN`, so everything outside of a light stays dark.
+    """
+
+    SCALE = 0.25
+    # Side in lightmap pixels of the tiles compared to find what changed
+    DIRTY_TILE = 8
+
+    def __init__(self, scale: float = SCALE) -> None:
+        self.shared = Shared()
+        self.scale = scale
+        self.surf = pygame.Surface(
+            (
+                math.ceil(self.shared.SCREEN_WIDTH * scale),
+                math.ceil(self.shared.SCREEN_HEIGHT * scale),
+            )
+        )
+        self.full_surf = pygame.Surface(self.shared.SCRECT.size)
+        self.static_layers: dict[t.Any, tuple] = {}
+        self.previous_pixels: np.ndarray | None = None
+
+    def clear(self):
+        self.surf.fill("black")
+
+    def scaled(self, img: pygame.Surface, size: t.Sequence) -> pygame.Surface:
+        return scale_cache.scale(img, (size[0] * self.scale, size[1] * self.scale))
+
+    def add(self, img: pygame.Surface, rect: pygame.Rect):
+        """Adds a light covering the given rect in world space"""
+
+        if not self.shared.camera.visible(rect):
+            return
+        x, y = self.shared.camera.transform(rect.topleft)
+        self.surf.blit(
+            self.scaled(img, rect.size),
+            (x * self.scale, y * self.scale),
+            special_flags=pygame.BLEND_RGB_MAX,
+        )
+
+    def add_many(
+        self,
+        img: pygame.Surface,
+        left: np.ndarray,
+        top: np.ndarray,
+        width: np.ndarray,
+        height: np.ndarray,
+    ):
+        """Adds lights of one image at once, given arrays of their world rects"""
+
+        offset_x, offset_y = self.shared.camera.render_offset
+        x = (left - offset_x) * self.scale
+        y = (top - offset_y) * self.scale
+        # Truncated like the sizes `scaled` asks the cache for
+        width = (width * self.scale).astype(int)
+        height = (height * self.scale).astype(int)
+        surf_width, surf_height = self.surf.get_size()
+        visible = (x + width > 0) & (x < surf_width) & (y + height > 0)
+        visible &= y < surf_height
+        self.shared.camera.culled += len(visible) - int(np.count_nonzero(visible))
+
+        surfs = {}
+        blits = []
+        for size, pos in zip(
+            zip(width[visible].tolist(), height[visible].tolist()),
+            zip(x[visible].tolist(), y[visible].tolist()),
+        ):
+            surf = surfs.get(size)
+            if surf is None:
+                surf = surfs[size] = scale_cache.scale(img, size)
+            blits.append((surf, pos))
+        self.surf.fblits(blits, pygame.BLEND_RGB_MAX)
+
+    def bake(
+        self, lights: t.Sequence[tuple[pygame.Surface, pygame.Rect]]
+    ) -> tuple[pygame.Surface, pygame.Rect]:
+        world_rect = lights[0][1].unionall([rect for _, rect in lights[1:]])
+        surf = pygame.Surface(
+            (
+                math.ceil(world_rect.width * self.scale),
+                math.ceil(world_rect.height * self.scale),
+            )
+        )
+        surf.fill("black")
+        for img, rect in lights:
+            surf.blit(
+                self.scaled(img, rect.size),
+                (
+                    (rect.x - world_rect.x) * self.scale,
+                    (rect.y - world_rect.y) * self.scale,
+                ),
+                special_flags=pygame.BLEND_RGB_MAX,
+            )
+
+        return surf, world_rect
+
+    def add_static(
+        self, owner: t.Any, lights: t.Sequence[tuple[pygame.Surface, pygame.Rect]]
+    ):
+        """Adds lights that never move, given their rects in world space.
+
+        They are baked into one layer per owner, which is reused between frames
+        until the lights of that owner change.
+        """
+
+        if not lights:
+            self.static_layers.pop(owner, None)
+            return
+
+        key = tuple((id(img), tuple(rect)) for img, rect in lights)
+        layer = self.static_layers.get(owner)
+        if layer is None or layer[0] != key:
+            layer = key, *self.bake(lights)
+            self.static_layers[owner] = layer
+
+        _, surf, world_rect = layer
+        if not self.shared.camera.visible(world_rect):
+            return
+        x, y = self.shared.camera.transform(world_rect.topleft)
+        self.surf.blit(
+            surf,
+            (x * self.scale, y * self.scale),
+            special_flags=pygame.BLEND_RGB_MAX,
+        )
+
+    def changed_rects(self) -> list[pygame.Rect]:
+        """Screen rects of the tiles that differ from the previous lightmap"""
+
+        pixels = pygame.surfarray.array2d(self.surf)
+        previous, self.previous_pixels = self.previous_pixels, pixels
+        if previous is None or previous.shape != pixels.shape:
+            return [self.shared.SCRECT.copy()]
+
+        tile = self.DIRTY_TILE
+        width, height = pixels.shape
+        cols, rows = math.ceil(width / tile), math.ceil(height / tile)
+        changed = np.zeros((cols * tile, rows * tile), dtype=bool)
+        changed[:width, :height] = pixels != previous
+        tiles = changed.reshape(cols, tile, rows, tile).any(axis=(1, 3))
+
+        # Smoothscale bleeds a lightmap pixel into its neighbours
+        size = tile / self.scale
+        bleed = 2 / self.scale
+        rects = []
+        for row in range(rows):
+            # One rect per run of changed tiles in the row
+            edges = np.flatnonzero(np.diff(tiles[:, row], prepend=0, append=0))
+            for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+                rect = pygame.Rect(start * size, row * size, (end - start) * size, size)
+                rects.append(rect.inflate(bleed * 2, bleed * 2))
+        return rects
+
+    def apply(self, surface: pygame.Surface):
+        pygame.transform.smoothscale(
+            self.surf, self.full_surf.get_size(), self.full_surf
+        )
+        # Only the tiles that changed are presented, the rest of the screen
+        # keeps the previous frame's lighting
+        with presenter.untracked(self):
+            surface.blit(self.full_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        if presenter.enabled:
+            presenter.mark(self.changed_rects())
@@ -2,21 +2,22 @@ import itertools
 
 import pygame
 
+from .assets import assets
+from .dirty import presenter
 from .shared import Shared
 from .state_enums import State
-from .utils import SinWave, get_font, render_at, scale_by
+from .utils import SinWave, get_font, render_at, scale_by, set_cursor
 from .widgets import Widgets
 
 
 class BackgroundRender:
+    PROVS = assets.lazy_frames(
+        ("assets/prov.png", "assets/prov_2.png"), alpha=False, group="menu"
+    )
+
     def __init__(self) -> None:
         self.shared = Shared()
-        self.original_provs = itertools.cycle(
-            (
-                pygame.image.load("assets/prov.png").convert(),
-                pygame.image.load("assets/prov_2.png").convert(),
-            )
-        )
+        self.original_provs = itertools.cycle(self.PROVS)
         self.original_prov = next(self.original_provs)
         self.prov = self.original_prov.copy()
         self.zoom = 1
@@ -24,26 +25,35 @@ class BackgroundRender:
         self.alpha = 1
         self.alpha_rate = 25
         self.sign = 1
+        self.key = None
 
     def update(self):
-        self.zoom = (self.alpha / 255) / 2
         self.alpha += (self.alpha_rate * self.shared.dt) * self.sign
         if self.alpha >= 255 or self.alpha <= 0:
             self.sign *= -1
             self.original_prov = next(self.original_provs)
 
-        if self.zoom > 1.5:
-            self.zoom = 1
+        # The zoom follows the whole alpha, so the background is only rescaled
+        # and presented again when that changes
+        alpha = int(self.alpha)
+        key = self.original_prov, alpha
+        if key == self.key:
+            return
+        self.key = key
+        self.zoom = (alpha / 255) / 2
         self.prov = scale_by(self.original_prov, 1 + self.zoom)
-        self.prov.set_alpha(self.alpha)
+        self.prov.set_alpha(alpha)
 
     def draw(self):
-        render_at(self.shared.screen, self.prov, "center")
+        with presenter.untracked(self.key):
+            render_at(self.shared.screen, self.prov, "center")
 
 
 class DashBoardRender:
+    IMAGE = assets.lazy("assets/dashboard.png", group="menu")
+
     def __init__(self) -> None:
-        self.image = pygame.image.load("assets/dashboard.png").convert_alpha()
+        self.image = self.IMAGE
         self.shared = Shared()
         self.y = 0
         self.wave = SinWave(0.07)
@@ -67,13 +77,19 @@ class MenuState:
     REQUIRED_FIELDS = ["screen"]
 
     def __init__(self) -> None:
-        pygame.mouse.set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         self.next_state = None
         self.shared = Shared()
         self.clean_shared_data()
         self.shared.widgets = Widgets(style="gameover")
         self.bg = BackgroundRender()
         self.dash = DashBoardRender()
+        # The game's sprites load in the background while the menu is shown
+        self.loaded, self.to_load = 0, 0
+        assets.prefetch("game", self.on_prefetch)
+
+    def on_prefetch(self, loaded: int, total: int):
+        self.loaded, self.to_load = loaded, total
 
     def clean_shared_data(self):
         for field in dir(self.shared):
@@ -100,7 +116,18 @@ class MenuState:
         self.bg.update()
         self.dash.update()
 
+    def draw_progress(self):
+        if self.loaded == self.to_load:
+            return
+        width = self.shared.SCRECT.width * self.loaded / self.to_load
+        pygame.draw.rect(
+            self.shared.screen,
+            "yellow",
+            (0, self.shared.SCRECT.height - 4, width, 4),
+        )
+
     def draw(self):
         self.bg.draw()
         self.dash.draw()
+        self.draw_progress()
         self.shared.widgets.draw()
@@ -1,8 +1,12 @@
-import random
+from __future__ import annotations
+
+import math
+import typing as t
 from enum import Enum, auto
 
 import pygame
 
+from .assets import assets
 from .bloom import Bloom
 from .enemies import (
     BeeList,
@@ -10,17 +14,30 @@ from .enemies import (
     Enemy,
     FinalBoss,
     HumanStr,
+    Patrol,
     PoopyBytes,
     PotatoInt,
     ShroomDict,
 )
+from .entities import EntityList
+from .pool import pools
 from .program import Code
+from .render import Layer
 from .shared import Shared
-from .utils import Animation, Time, get_font, iso_to_screen, load_scale_3
+from .spatial import SpatialIndex
+from .trace import tracer
+from .utils import (
+    Animation,
+    Time,
+    get_font,
+    iso_to_screen,
+    rng,
+    screen_to_iso,
+)
 
 
 class Block:
-    img = load_scale_3("assets/brick_block_1.png")
+    img = assets.lazy("assets/brick_block_1.png", "scale_by", 3)
 
     def __init__(self, iso_pos) -> None:
         self.iso_pos = iso_pos
@@ -29,7 +46,7 @@ class Block:
         self.screen_pos = iso_to_screen(iso_pos, self.rect)
         self.pos = pygame.Vector2(self.screen_pos[0], self.screen_pos[1] + 150)
         self.rect.topleft = self.pos - (0, 150)
-        self.start_timer = Time(random.uniform(0, 3))
+        self.start_timer = Time(rng.uniform(0, 3))
         self.done = False
         self.done_waiting = False
         self.speed = 500
@@ -40,6 +57,8 @@ class Block:
         self.done_waiting = True
 
         if self.pos == self.screen_pos:
+            if not self.done:
+                self.shared.plat.tile_map.add(self)
             self.done = True
             return
 
@@ -49,7 +68,46 @@ class Block:
     def draw(self):
         if not self.done_waiting:
             return
-        self.shared.screen.blit(self.img, self.shared.camera.transform(self.pos))
+        # Every block of a platform shares a layer so they overlap in row order,
+        # the platform is backdrop only once it has baked its floor
+        self.shared.render.submit(Layer.FLOOR, self.img, self.pos)
+
+
+class TileMap:
+    """Occupancy of settled blocks keyed by their isometric coordinate"""
+
+    def __init__(self) -> None:
+        self.tile_rect = Block.img.get_rect()
+        self.tiles: dict[tuple[int, int], Block] = {}
+
+    def add(self, block: Block):
+        self.tiles[block.iso_pos] = block
+
+    def rebuild(self, platforms: list[BrokenPlatform]):
+        self.tiles.clear()
+        for platform in platforms:
+            for row in platform.blocks:
+                for block in row:
+                    if block.done:
+                        self.add(block)
+
+    def iso_at(self, pos: t.Sequence) -> tuple[int, int]:
+        """Isometric coordinate of the tile top face containing a world point"""
+
+        x, y = screen_to_iso(
+            (
+                pos[0] - (self.tile_rect.width / 2),
+                pos[1] - (self.tile_rect.height / 4),
+            ),
+            self.tile_rect,
+        )
+        return math.floor(x + 0.5), math.floor(y + 0.5)
+
+    def get(self, pos: t.Sequence) -> Block | None:
+        return self.tiles.get(self.iso_at(pos))
+
+    def walkable(self, pos: t.Sequence) -> bool:
+        return self.iso_at(pos) in self.tiles
 
 
 class TorchSide(Enum):
@@ -60,7 +118,9 @@ class TorchSide(Enum):
 
 
 class Torch:
-    FRAMES = tuple(load_scale_3(f"assets/torch-{i}.png") for i in range(1, 4))
+    FRAMES = assets.lazy_frames(
+        (f"assets/torch-{i}.png" for i in range(1, 4)), "scale_by", 3, atlas="sprites"
+    )
     FONT = get_font("assets/Hack/Hack Regular Nerd Font Complete Mono.ttf", 16)
     BRIDGE_GAP = 5
 
@@ -76,6 +136,8 @@ class Torch:
             self.iso_coord, pygame.Rect(0, 0, 32 * 3, 32 * 3)
         )
         self.rect = self.anim.current_frame.get_rect(midbottom=self.screen_coord)
+        self.light_rect = self.bloom.rect.copy()
+        self.light_rect.center = self.rect.center
         self.create_surf = Torch.FONT.render("[C] CREATE", True, "purple", "white")
         self.create_surf_rect = self.create_surf.get_rect(midbottom=self.rect.midtop)
         self.near = False
@@ -144,20 +206,15 @@ class Torch:
 
     def update(self):
         self.anim.update()
-        self.bloom.update(self.shared.camera.transform(self.rect.center))
 
         self.check_near()
         self.on_create_chunk()
 
     def draw(self):
-        self.shared.screen.blit(
-            self.anim.current_frame, self.shared.camera.transform(self.rect)
-        )
-        self.bloom.draw(self.shared.overlay)
-
+        self.shared.render.submit(Layer.TORCHES, self.anim.current_frame, self.rect)
         if self.near:
-            self.shared.screen.blit(
-                self.create_surf, self.shared.camera.transform(self.create_surf_rect)
+            self.shared.render.submit(
+                Layer.PROMPTS, self.create_surf, self.create_surf_rect
             )
 
 
@@ -165,11 +222,16 @@ class BrokenPlatform:
     """A platform with a random spec"""
 
     MAX_PLATFORMS = 14
+    BAKE_FLOOR = True
 
+    @tracer.traced("platform", "BrokenPlatform")
     def __init__(self, side: int, origin: tuple[int, int]) -> None:
         self.origin = origin
         self.side = side
         self.shared = Shared()
+        self.floor: pygame.Surface | None = None
+        self.floor_rect = pygame.Rect(0, 0, 0, 0)
+        self.floor_block_count = 0
         self.generate_base()
         self.chip_extra_sides()
         self.get_rect()
@@ -184,12 +246,12 @@ class BrokenPlatform:
         )
 
     def generate_code(self):
-        self.programs = []
+        self.programs: EntityList[Code] = EntityList()
         if len(self.shared.plat.platforms) >= self.MAX_PLATFORMS:
             return
-        for _ in range(random.randrange(3)):
-            block = random.choice(self.blocks[random.randrange(self.side)])
-            self.programs.append(Code(block.rect.midbottom))
+        for _ in range(rng.randrange(3)):
+            block = rng.choice(self.blocks[rng.randrange(self.side)])
+            self.programs.add(Code(block.rect.midbottom))
 
     def generate_torches(self) -> None:
         self.torches = []
@@ -207,7 +269,11 @@ class BrokenPlatform:
             self.side, self.blocks[1][1].rect, self.origin
         )
         for platform in self.shared.plat.platforms:
-            platform.enemies = []
+            for enemy in platform.enemies:
+                self.shared.plat.enemy_index.remove(enemy)
+                enemy.leave_patrol()
+                pools.release(enemy)
+            platform.enemies.clear()
 
     def available_enemies(self):
         enemies = (PotatoInt, HumanStr, PoopyBytes, BeeList, CentiSet, ShroomDict)
@@ -239,15 +305,18 @@ class BrokenPlatform:
     #     return (PotatoInt, HumanStr, PoopyBytes, BeeList, CentiSet, ShroomDict)
 
     def generate_enemies(self):
-        self.enemies: list[Enemy] = []
+        self.enemies: EntityList[Enemy] = EntityList()
+        self.patrolling = False
         if len(self.shared.plat.platforms) >= self.MAX_PLATFORMS:
             return
         n_enemies = int(self.side / 2.5)
         for _ in range(n_enemies):
-            enemy_type = random.choice(self.available_enemies())
-            self.enemies.append(
-                enemy_type(self.side, self.blocks[1][1].rect, self.origin)
+            enemy_type = rng.choice(self.available_enemies())
+            enemy = pools.acquire(
+                enemy_type, self.side, self.blocks[1][1].rect, self.origin
             )
+            self.enemies.add(enemy)
+            self.shared.plat.enemy_index.update(enemy)
 
     def generate_base(self):
         self.blocks = []
@@ -260,16 +329,44 @@ class BrokenPlatform:
     def chip_extra_sides(self):
         for y, row in tuple(enumerate(self.blocks)):
             for x, block in tuple(enumerate(row)):
-                if random.random() > 0.5 or (x == 0 and y == 0):
+                if rng.random() > 0.5 or (x == 0 and y == 0):
                     continue
                 if 0 in (x, y) or (self.side - 1) in (x, y):
                     self.blocks[y].remove(block)
 
+    def count_blocks(self) -> int:
+        return sum(len(row) for row in self.blocks)
+
+    def bake_floor(self):
+        """Renders the settled blocks once into a single cached surface"""
+
+        rects = [block.rect for row in self.blocks for block in row]
+        self.floor_rect = rects[0].unionall(rects[1:])
+        self.floor = pygame.Surface(self.floor_rect.size, pygame.SRCALPHA)
+        for row in self.blocks:
+            for block in row:
+                self.floor.blit(
+                    block.img, block.rect.move(-self.floor_rect.x, -self.floor_rect.y)
+                )
+        self.floor_block_count = len(rects)
+
+    def invalidate_floor(self):
+        self.floor = None
+
     def get_done(self) -> bool:
+        if self.floor is not None:
+            if self.count_blocks() == self.floor_block_count:
+                return True
+            self.invalidate_floor()
+            self.shared.plat.tile_map.rebuild(self.shared.plat.platforms)
+
         for row in self.blocks:
             for block in row:
                 if not block.done:
                     return False
+
+        if self.BAKE_FLOOR:
+            self.bake_floor()
         return True
 
     def update_blocks(self):
@@ -277,23 +374,35 @@ class BrokenPlatform:
             for block in row:
                 block.update()
 
+    def start_patrol(self):
+        """Enemies start walking once the platform has settled"""
+
+        for enemy in self.enemies:
+            self.shared.plat.patrol.add(enemy)
+        self.patrolling = True
+
     def update_enemies(self):
-        for enemy in self.enemies[:]:
+        if not self.patrolling:
+            self.start_patrol()
+        for handle, enemy in self.enemies.items():
             enemy.update()
 
             if not enemy.alive:
-                self.enemies.remove(enemy)
+                self.enemies.remove(handle)
+                enemy.leave_patrol()
+                self.shared.plat.enemy_index.remove(enemy)
+                pools.release(enemy)
 
     def update_torches(self):
         for torch in self.torches:
             torch.update()
 
     def update_programs(self):
-        for program in self.programs[:]:
+        for handle, program in self.programs.items():
             program.update()
 
             if not program.alive:
-                self.programs.remove(program)
+                self.programs.remove(handle)
 
     def on_regen(self):
         if self.enemies:
@@ -309,7 +418,8 @@ class BrokenPlatform:
             self.generate_code()
 
     def update(self):
-        self.update_blocks()
+        if self.floor is None:
+            self.update_blocks()
         if self.done:
             self.update_torches()
             self.update_enemies()
@@ -328,6 +438,10 @@ class BrokenPlatform:
         self.rect.center = self.blocks[0][0].pos
 
     def draw_blocks(self):
+        if self.floor is not None:
+            self.shared.render.submit(Layer.BACKDROP, self.floor, self.floor_rect)
+            return
+
         for row in self.blocks:
             for block in row:
                 block.draw()
@@ -344,19 +458,28 @@ class BrokenPlatform:
         for program in self.programs:
             program.draw()
 
+    def draw_lights(self):
+        lights = [(torch.bloom.image, torch.light_rect) for torch in self.torches]
+        lights += [
+            (program.bloom.image, program.light_rect) for program in self.programs
+        ]
+        self.shared.lightmap.add_static(self, lights)
+
 
 class PlatformManager:
     def __init__(self) -> None:
         self.shared = Shared(plat=self)
+        self.tile_map = TileMap()
+        self.enemy_index = SpatialIndex()
+        # Moves the enemies of every settled platform in one step
+        self.patrol = Patrol(self.enemy_index)
         self.platforms: list[BrokenPlatform] = []
         self.gen_base()
         self.shared.current_chunks = [self.platforms[0]]
         self.done = False
 
     def gen_base(self):
-        self.platforms.append(
-            BrokenPlatform(side=random.randrange(8, 13), origin=(0, 0))
-        )
+        self.platforms.append(BrokenPlatform(side=rng.randrange(8, 13), origin=(0, 0)))
 
     def update_platforms(self):
         self.shared.current_chunks = []
@@ -367,8 +490,9 @@ class PlatformManager:
 
         self.done = all(platform.done for platform in self.platforms)
 
+    @tracer.traced("platform")
     def create_new_plat(self, torch: Torch, platform: BrokenPlatform):
-        side = random.randrange(7, 10)
+        side = rng.randrange(7, 10)
         new_plat = BrokenPlatform(
             side,
             origin=torch.new_plat_iso_coord,
@@ -388,6 +512,8 @@ class PlatformManager:
                     return
 
     def update(self):
+        self.enemy_index.clear_cache()
+        self.patrol.step(self.shared.dt)
         self.update_platforms()
         self.update_torches()
 
@@ -399,10 +525,13 @@ class PlatformManager:
         for platform in self.platforms:
             platform.draw_programs()
 
+    def draw_lights(self):
+        for platform in self.platforms:
+            platform.draw_lights()
+
     def draw(self):
         for platform in self.platforms:
             platform.draw_blocks()
-        self.shared.provisional_chunk = self.shared.screen.copy()
 
         for platform in self.platforms:
             if platform.done:
@@ -2,31 +2,51 @@ import typing as t
 
 import pygame
 
+from .assets import assets
 from .bars import EnergyBar, HealthBar
 from .bloom import Bloom
 from .player_attacks import EAttack, FireballManager, QAttack, WAttack
+from .render import Layer
 from .shared import Shared
-from .utils import Animation, aura_load, load_scale_3
+from .spatial import SpatialHash
+from .utils import Animation, render_offset
 
 
 class Player:
     MAX_HEALTH = 180
     MAX_ENERGY = 100
-    FRAMES = tuple(aura_load(f"assets/boost-aura-{n}.png") for n in range(1, 4))
+    FRAMES = assets.lazy_frames(
+        (f"assets/boost-aura-{n}.png" for n in range(1, 4)),
+        "aura",
+        100,
+        atlas="sprites",
+    )
+    ANIM_FRAMES = assets.lazy_frames(
+        (f"assets/player-anim-{n}.png" for n in range(1, 7)),
+        "scale_by",
+        3,
+        atlas="sprites",
+    )
+    BIRB_FRAMES = assets.lazy_frames(
+        (f"assets/player-birb-{n}.png" for n in range(1, 3)),
+        "scale_by",
+        3,
+        atlas="sprites",
+    )
 
     def __init__(self, origin: pygame.Vector2) -> None:
         self.shared = Shared()
         self.pos = origin.copy()
-        self.frames = [load_scale_3(f"assets/player-anim-{n}.png") for n in range(1, 7)]
-        self.birby_frames = [
-            load_scale_3(f"assets/player-birb-{n}.png") for n in range(1, 3)
-        ]
+        self.prev_pos = origin.copy()
+        self.frames = list(self.ANIM_FRAMES)
+        self.birby_frames = list(self.BIRB_FRAMES)
         self.rect = self.frames[0].get_rect(midbottom=self.pos)
         self.idle_anim = Animation(self.frames, 0.3)
         self.bloom = Bloom(2, wave_speed=0.02, expansion_factor=70, v2=False)
         self.birb_anim = Animation(self.birby_frames, 0.3)
         self.anim = self.idle_anim
         self.fireball_manager = FireballManager()
+        self.fireball_grid = SpatialHash()
         self.health = self.MAX_HEALTH
         self.mana = 0
         self.health_bar = HealthBar()
@@ -59,6 +79,7 @@ class Player:
             self.mana_target_vector.x = self.MAX_ENERGY
 
     def follow_target(self):
+        self.prev_pos.update(self.pos)
         if self.shared.cursor.player_target is not None:
             self.pos.move_towards_ip(
                 self.shared.cursor.player_target, 150 * self.shared.dt
@@ -67,22 +88,24 @@ class Player:
         self.rect.midbottom = self.pos
 
     def update_bloom(self):
-        self.bloom.update(self.shared.camera.transform(self.rect.center))
+        self.bloom.update(self.rect.center)
 
     def on_fly(self):
-        if (
-            self.shared.provisional_chunk.get_at(
-                tuple(map(int, self.shared.camera.transform(self.rect.midbottom)))
-            )
-            != self.shared.cursor.surface_color
-        ):
-            self.anim = self.birb_anim
-        else:
+        if self.shared.plat.tile_map.walkable(self.rect.midbottom):
             self.anim = self.idle_anim
+        else:
+            self.anim = self.birb_anim
 
     def on_shoot(self):
         self.fireball_manager.update()
 
+    def update_fireball_grid(self):
+        self.fireball_grid.rebuild(
+            self.fireball_manager.fireballs,
+            self.e_attack.fireballs,
+            n_queries=len(self.shared.plat.enemy_index),
+        )
+
     def update_boost_timer(self):
         if self.boost_timer is not None and self.boost_timer.tick():
             self.boost_timer = None
@@ -129,12 +152,14 @@ class Player:
         self.q_attack.update()
         self.w_attack.update()
         self.e_attack.update()
+        self.update_fireball_grid()
 
     def draw(self):
-        self.shared.screen.blit(
-            self.anim.current_frame, self.shared.camera.transform(self.rect)
+        offset = render_offset(self.prev_pos, self.pos, self.shared.alpha)
+        self.shared.render.submit(
+            Layer.PLAYER, self.anim.current_frame, self.rect.topleft + offset
         )
-        self.bloom.draw(self.shared.overlay)
+        self.bloom.draw(self.shared.lightmap)
         self.fireball_manager.draw()
 
         self.q_attack.draw()
@@ -142,7 +167,8 @@ class Player:
         self.e_attack.draw()
 
         if not self.e_attack.active and self.on_boost:
-            self.shared.screen.blit(
+            self.shared.render.submit(
+                Layer.AURAS,
                 self.anim_boost.current_frame,
-                self.shared.camera.transform(self.boost_rect),
+                self.boost_rect.topleft + offset,
             )
@@ -2,30 +2,48 @@ from __future__ import annotations
 
 import itertools
 import math
-import time
 import typing as t
 
 import pygame
 
+from .assets import assets
 from .bloom import Bloom
 from .cursor import CursorState
+from .entities import EntityList
+from .hud import Label
+from .pool import pools
+from .render import Layer
 from .shared import Shared
 from .utils import (
     Animation,
     Projectile,
     Time,
     TimeOnce,
-    aura_load,
     get_font,
-    load_scale_3,
+    render_offset,
+    rotation_cache,
+    sim_clock,
 )
 
 
+# The player's projectiles stay objects rather than a `ProjectileBatch`. Only a
+# few dozen are ever alive: a fireball per click, one hot ball per Q attack and
+# the fireballs it bursts into, and the E attack's orbiting ring. Each follows
+# its own path and carries a bloom light. Enemies find them through the
+# player's `fireball_grid`, and fireballs are recycled through `pools`.
 class Fireball(Projectile):
     INITIAL_SPEED = 600
-    FRAMES = tuple(load_scale_3(f"assets/fireball-anim-{n}.png") for n in range(1, 4))
-    EXPLOSION_FRAMES = tuple(
-        load_scale_3(f"assets/explosion-{n}.png") for n in range(1, 8)
+    FRAMES = assets.lazy_frames(
+        (f"assets/fireball-anim-{n}.png" for n in range(1, 4)),
+        "scale_by",
+        3,
+        atlas="sprites",
+    )
+    EXPLOSION_FRAMES = assets.lazy_frames(
+        (f"assets/explosion-{n}.png" for n in range(1, 8)),
+        "scale_by",
+        3,
+        atlas="sprites",
     )
 
     def __init__(
@@ -40,35 +58,67 @@ class Fireball(Projectile):
 
         super().__init__(radians, speed)
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.deceleration = 200
         self.damage = damage
 
         self.bloom = Bloom(0.3, wave_speed=0.01, expansion_factor=10)
-        self.frames = tuple(
-            pygame.transform.rotate(frame, math.degrees(-self.radians))
-            for frame in self.FRAMES
-        )
+        self.frames = self.rotated_frames()
         self.anim = Animation(self.frames, 0.2)
         self.rect = self.FRAMES[0].get_rect()
         self.alive = True
         self.shared = Shared()
 
+    def reset(
+        self,
+        radians: float,
+        pos: t.Sequence,
+        damage: int = 60,
+        speed: None | float = None,
+    ):
+        """Fires a pooled fireball again, keeping its bloom and animation"""
+
+        if speed is None:
+            speed = self.INITIAL_SPEED
+
+        self.radians = radians
+        self.speed = speed
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.deceleration = 200
+        self.damage = damage
+
+        self.bloom.reset()
+        self.frames = self.rotated_frames()
+        self.anim.restart(self.frames, 0.2)
+        self.alive = True
+
+    def rotated_frames(self) -> tuple[pygame.Surface, ...]:
+        return tuple(
+            rotation_cache.rotate(frame, math.degrees(-self.radians))
+            for frame in self.FRAMES
+        )
+
     def update(self):
+        self.prev_pos.update(self.pos)
         self.get_delta_velocity(self.shared.dt)
         self.pos += self.dv
         self.speed -= self.deceleration * self.shared.dt
         self.rect.center = self.pos
         self.anim.update()
-        self.bloom.update(self.shared.camera.transform(self.pos))
+        self.bloom.update(self.pos)
 
         if self.speed < 100:
             self.alive = False
 
     def draw(self):
-        self.shared.screen.blit(
-            self.anim.current_frame, self.shared.camera.transform(self.rect)
+        self.bloom.draw(self.shared.lightmap)
+        offset = render_offset(self.prev_pos, self.pos, self.shared.alpha)
+        self.shared.render.submit(
+            Layer.PLAYER_PROJECTILES,
+            self.anim.current_frame,
+            self.rect.topleft + offset,
         )
-        self.bloom.draw(self.shared.overlay)
 
 
 class FireballManager:
@@ -92,7 +142,8 @@ class FireballManager:
                 and self.creatable
             ):
                 self.fireballs.add(
-                    Fireball(
+                    pools.acquire(
+                        Fireball,
                         self.shared.cursor.radians_between_player,
                         self.shared.player.pos,
                     )
@@ -104,6 +155,7 @@ class FireballManager:
         for fireball in set(self.fireballs):
             if not fireball.alive:
                 self.fireballs.remove(fireball)
+                pools.release(fireball)
 
     def update(self):
         self.on_create()
@@ -119,9 +171,14 @@ class FireballManager:
 
 class HotBall(Projectile):
     INITIAL_SPEED = 400
-    FRAMES = tuple(load_scale_3(f"assets/hotball-{n}.png") for n in range(1, 6))
-    EXPLOSION_FRAMES = tuple(
-        load_scale_3(f"assets/explosion-{n}.png") for n in range(1, 8)
+    FRAMES = assets.lazy_frames(
+        (f"assets/hotball-{n}.png" for n in range(1, 6)), "scale_by", 3, atlas="sprites"
+    )
+    EXPLOSION_FRAMES = assets.lazy_frames(
+        (f"assets/explosion-{n}.png" for n in range(1, 8)),
+        "scale_by",
+        3,
+        atlas="sprites",
     )
     RANGE = 500
     INITIAL_MAX_FIREBALLS = 10
@@ -131,13 +188,14 @@ class HotBall(Projectile):
         super().__init__(radians, HotBall.INITIAL_SPEED)
         self.shared = Shared()
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.deceleration = 200
         self.damage = 60
         self.target = self.shared.cursor.trans_pos.copy()
 
         self.bloom = Bloom(0.3, wave_speed=0.01, expansion_factor=10)
         self.frames = tuple(
-            pygame.transform.rotate(frame, math.degrees(-self.radians))
+            rotation_cache.rotate(frame, math.degrees(-self.radians))
             for frame in HotBall.FRAMES
         )
         self.anim = Animation(self.frames, 0.2)
@@ -146,7 +204,8 @@ class HotBall(Projectile):
 
     def project(self):
         self.anim.update()
-        self.bloom.update(self.shared.camera.transform(self.pos))
+        self.bloom.update(self.pos)
+        self.prev_pos.update(self.pos)
         self.pos.move_towards_ip(self.target, self.speed * self.shared.dt)
         self.rect.center = self.pos
 
@@ -154,17 +213,20 @@ class HotBall(Projectile):
         if self.pos == self.target:
             self.alive = False
             self.shared.ss.add(2.0, 3.0)
-            self.shared.play_it_once_anims.append(OnBoomAnimation(self.pos))
+            self.shared.play_it_once_anims.add(OnBoomAnimation(self.pos))
 
     def update(self):
         self.project()
         self.on_boom()
 
     def draw(self):
-        self.shared.screen.blit(
-            self.anim.current_frame, self.shared.camera.transform(self.rect)
+        self.bloom.draw(self.shared.lightmap)
+        offset = render_offset(self.prev_pos, self.pos, self.shared.alpha)
+        self.shared.render.submit(
+            Layer.PLAYER_PROJECTILES,
+            self.anim.current_frame,
+            self.rect.topleft + offset,
         )
-        self.bloom.draw(self.shared.overlay)
 
 
 class OnBoomAnimation:
@@ -195,7 +257,7 @@ class OnBoomAnimation:
 
 
 class LevelUpButton:
-    IMAGE = pygame.image.load("assets/lvl-up.png").convert_alpha()
+    IMAGE = assets.lazy("assets/lvl-up.png")
 
     def __init__(self, attack_info: AttackInfo) -> None:
         self.ai = attack_info
@@ -246,20 +308,13 @@ class LevelUpButton:
 
 
 class AttackInfo:
-    IMAGES = {
-        pygame.K_q: [
-            pygame.image.load("assets/q_attack.png").convert_alpha(),
-            pygame.image.load("assets/q_attack_cooldown.png").convert_alpha(),
-        ],
-        pygame.K_w: [
-            pygame.image.load("assets/w_attack.png").convert_alpha(),
-            pygame.image.load("assets/w_attack_cooldown.png").convert_alpha(),
-        ],
-        pygame.K_e: [
-            pygame.image.load("assets/e_attack.png").convert_alpha(),
-            pygame.image.load("assets/e_attack_cooldown.png").convert_alpha(),
-        ],
-    }
+    IMAGES = assets.lazy_map(
+        {
+            pygame.K_q: ("assets/q_attack.png", "assets/q_attack_cooldown.png"),
+            pygame.K_w: ("assets/w_attack.png", "assets/w_attack_cooldown.png"),
+            pygame.K_e: ("assets/e_attack.png", "assets/e_attack_cooldown.png"),
+        }
+    )
     FONT = get_font("assets/Hack/Hack Regular Nerd Font Complete Mono.ttf", 32)
     LEVEL_FONT = get_font("assets/Hack/Hack Regular Nerd Font Complete Mono.ttf", 16)
 
@@ -288,6 +343,8 @@ class AttackInfo:
         self.logo_surf = self.IMAGES.get(attack_key)[0]
         self.logo_rect = self.logo_surf.get_rect(topleft=self.pos)
         self.lvl_up_btn = LevelUpButton(self)
+        self.level_label = Label(self.LEVEL_FONT, "green")
+        self.cooldown_label = Label(self.FONT, "white")
 
     def get_pos(self):
         logo_size = 100
@@ -339,7 +396,7 @@ class AttackInfo:
             text = "Lvl: MAX"
         else:
             text = f"Lvl: {self.level}"
-        level_surf = self.LEVEL_FONT.render(text, True, "green")
+        level_surf = self.level_label.render(text)
         level_rect = level_surf.get_rect()
         level_rect.center = (
             self.logo_rect.centerx,
@@ -350,13 +407,13 @@ class AttackInfo:
 
     def render_cooldown(self):
         self.logo_surf = self.IMAGES.get(self.attack_key)[1]
-        font_text = time.perf_counter() - self.cooldown.start
+        font_text = sim_clock.now - self.cooldown.start
         font_text = self.cooldown.time_to_pass - font_text
         if font_text > 1:
             font_text = f"{font_text:.0f}"
         else:
             font_text = f"{font_text:.1f}"
-        font_surf = self.FONT.render(font_text, True, "white")
+        font_surf = self.cooldown_label.render(font_text)
         font_rect = font_surf.get_rect(center=self.logo_rect.center)
 
         self.shared.screen.blit(font_surf, font_rect)
@@ -386,7 +443,8 @@ class QAttack:
     def add_fireball(self, enemy):
         self.attack_info.used = False
         self.shared.player.fireball_manager.fireballs.add(
-            Fireball(
+            pools.acquire(
+                Fireball,
                 math.atan2(
                     enemy.pos.y - self.hotball.pos.y,
                     enemy.pos.x - self.hotball.pos.x,
@@ -395,29 +453,15 @@ class QAttack:
             )
         )
 
-    def blast_surrounding_enemies(self, added=0):
-        for plat in self.shared.current_chunks:
-            for enemy in plat.enemies:
-                if enemy.pos.distance_to(self.hotball.pos) <= HotBall.RANGE:
-                    if added > HotBall.MAX_FIREBALLS:
-                        self.active = False
-                        self.hotball = None
-                        return
-                    self.add_fireball(enemy)
-                    added += 1
-
-        if (
-            self.shared.final_boss is not None
-            and self.shared.final_boss.pos.distance_to(self.hotball.pos)
-            <= HotBall.RANGE
-        ):
-            self.add_fireball(self.shared.final_boss)
-            added += 1
-
-        if added == 0:
+    def blast_surrounding_enemies(self):
+        targets = self.shared.plat.enemy_index.k_nearest(
+            self.hotball.pos, HotBall.MAX_FIREBALLS, max_radius=HotBall.RANGE
+        )
+        if not targets:
             return
-        if added < HotBall.MAX_FIREBALLS:
-            self.blast_surrounding_enemies(added)
+
+        for enemy in itertools.islice(itertools.cycle(targets), HotBall.MAX_FIREBALLS):
+            self.add_fireball(enemy)
 
     def on_active(self):
         if self.hotball is None:
@@ -465,8 +509,13 @@ class QAttack:
 class WAttack:
     """Immunity for x seconds"""
 
-    FRAMES = tuple(aura_load(f"assets/immunity-aura-{n}.png") for n in range(1, 4))
-    SHIELD = load_scale_3("assets/shield.png")
+    FRAMES = assets.lazy_frames(
+        (f"assets/immunity-aura-{n}.png" for n in range(1, 4)),
+        "aura",
+        100,
+        atlas="sprites",
+    )
+    SHIELD = assets.lazy("assets/shield.png", "scale_by", 3)
 
     def __init__(self) -> None:
         self.shared = Shared()
@@ -521,33 +570,43 @@ class WAttack:
 
     def draw(self):
         if self.active:
-            self.shared.screen.blit(
-                self.anim.current_frame,
-                self.shared.camera.transform(self.rect),
-            )
-            self.shared.screen.blit(
-                self.SHIELD, self.shared.camera.transform(self.shield_rect)
-            )
+            self.shared.render.submit(Layer.AURAS, self.anim.current_frame, self.rect)
+            self.shared.render.submit(Layer.AURAS, self.SHIELD, self.shield_rect)
 
     def draw_front(self):
         self.attack_info.draw()
 
 
 class SpiralFireball(Fireball):
-    FRAMES = tuple(load_scale_3(f"assets/spiralball-anim-{n}.png") for n in range(1, 5))
+    FRAMES = assets.lazy_frames(
+        (f"assets/spiralball-anim-{n}.png" for n in range(1, 5)),
+        "scale_by",
+        3,
+        atlas="sprites",
+    )
 
     def __init__(self, radians: float | int) -> None:
         super().__init__(radians, pygame.Vector2())
         self.angular_velocity = 0.07
+        # Not interpolated from where it was created until it joins the orbit
+        self.orbiting = False
+
+    def reset(self, radians: float | int):
+        super().reset(radians, (0, 0))
+        self.orbiting = False
 
     def update(self, radius):
         self.radians += 0.02
+        self.prev_pos.update(self.pos)
         self.pos.x = self.shared.player.rect.centerx + radius * math.cos(self.radians)
         self.pos.y = self.shared.player.rect.centery + radius * math.sin(self.radians)
+        if not self.orbiting:
+            self.prev_pos.update(self.pos)
+            self.orbiting = True
 
         self.rect.center = self.pos
         self.anim.update()
-        self.bloom.update(self.shared.camera.transform(self.pos))
+        self.bloom.update(self.pos)
 
 
 class EAttack:
@@ -561,27 +620,29 @@ class EAttack:
         self.active = False
         self.attack_info = AttackInfo(7.0, attack_key=pygame.K_e, mana_cost=40)
         self.cooldown = TimeOnce(6.0)
-        self.fireballs: list[SpiralFireball] = []
+        self.fireballs: EntityList[SpiralFireball] = EntityList()
         self.n_balls = self.STARTER_BALLS
         self.radius = 200
 
     def gen_fireballs(self):
         for n in range(self.n_balls):
             radians = 2 * math.pi * n / self.n_balls
-            self.fireballs.append(SpiralFireball(radians))
+            self.fireballs.add(pools.acquire(SpiralFireball, radians))
 
     def on_active(self):
         if self.cooldown.tick():
             self.active = False
             self.attack_info.used = False
+            pools.release_all(self.fireballs)
             self.fireballs.clear()
             return
 
         self.update_radius()
-        for fireball in self.fireballs[:]:
+        for handle, fireball in self.fireballs.items():
             fireball.update(self.radius)
             if not fireball.alive:
-                self.fireballs.remove(fireball)
+                self.fireballs.remove(handle)
+                pools.release(fireball)
 
     def on_deactive(self):
         if self.attack_info.used:
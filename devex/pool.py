@@ -0,0 +1,94 @@
+"""
+Recycling pools for short-lived game objects.
+
+Objects are taken with `pools.acquire(cls, *args)`, which hands back a released
+instance of `cls` after calling its `reset(*args)`, or constructs a new one when
+none is free. `pools.release(obj)` gives an object back once nothing refers to
+it anymore; objects of types without a pool are simply dropped.
+"""
+
+import typing as t
+
+
+class Pool:
+    """Free instances of one type, reset with the constructor's arguments"""
+
+    def __init__(self, cls: type, max_free: int = 128) -> None:
+        self.cls = cls
+        self.max_free = max_free
+        self.free: list = []
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            self.hits += 1
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+
+        self.misses += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def warm(self, n: int, *args, **kwargs):
+        """Constructs instances up front so the first `n` acquires hit"""
+
+        while len(self.free) < min(n, self.max_free):
+            self.free.append(self.cls(*args, **kwargs))
+
+
+class Pools:
+    def __init__(self) -> None:
+        self.pools: dict[type, Pool] = {}
+
+    def __getitem__(self, cls: type) -> Pool:
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.pools[cls] = Pool(cls)
+        return pool
+
+    def acquire(self, cls: type, *args, **kwargs):
+        return self[cls].acquire(*args, **kwargs)
+
+    def release(self, obj):
+        pool = self.pools.get(type(obj))
+        if pool is not None:
+            pool.release(obj)
+
+    def release_all(self, objs: t.Iterable):
+        for obj in objs:
+            self.release(obj)
+
+    def warm(self, cls: type, n: int, *args, **kwargs):
+        self[cls].warm(n, *args, **kwargs)
+
+    def clear(self):
+        """Drops the free instances, keeping the statistics"""
+
+        for pool in self.pools.values():
+            pool.free.clear()
+
+    def stats(self) -> dict[str, tuple[int, int, int]]:
+        """(hits, misses, free) per pooled type"""
+
+        return {
+            cls.__name__: (pool.hits, pool.misses, len(pool))
+            for cls, pool in self.pools.items()
+        }
+
+
+pools = Pools()
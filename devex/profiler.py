@@ -0,0 +1,136 @@
+"""
+Spike-triggered sampling profiler.
+
+A background thread samples the main thread's Python stack every millisecond
+into a ring buffer. When a frame goes over budget, the timing scopes of that
+frame and the frames around it are written to disk with the stacks sampled
+while they ran, so a hitch can be inspected without profiling the whole session.
+"""
+
+import collections
+import json
+import os
+import sys
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from .instrument import FrameStats, instruments
+
+
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id: int, interval: float, max_samples: int) -> None:
+        super().__init__(name="stack-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: collections.deque[
+            tuple[float, tuple[str, ...]]
+        ] = collections.deque(maxlen=max_samples)
+        self.stopped = threading.Event()
+
+    @staticmethod
+    def describe(frame) -> tuple[str, ...]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({Path(code.co_filename).name})")
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples.append((time.perf_counter(), self.describe(frame)))
+
+    def between(self, start: float, end: float) -> list[tuple[str, ...]]:
+        return [stack for when, stack in list(self.samples) if start <= when <= end]
+
+
+class SpikeProfiler:
+    BUDGET_MS = 25.0
+    FRAMES_BEFORE = 5
+    FRAMES_AFTER = 5
+    MAX_DUMPS = 20
+
+    def __init__(
+        self,
+        budget_ms: float = BUDGET_MS,
+        out_dir: str | os.PathLike = "profiles",
+        interval: float = 0.001,
+    ) -> None:
+        self.budget_ms = budget_ms
+        self.out_dir = Path(out_dir)
+        self.interval = interval
+        self.sampler = StackSampler(
+            threading.get_ident(), interval, max_samples=int(30 / interval)
+        )
+        self.recent: collections.deque[FrameStats] = collections.deque(
+            maxlen=self.FRAMES_BEFORE + 1 + self.FRAMES_AFTER
+        )
+        self.spike: FrameStats | None = None
+        self.frames_left = 0
+        self.n_dumps = 0
+        self.switch_interval = sys.getswitchinterval()
+
+    def start(self):
+        # The sampler can only run when the main thread lets go of the GIL
+        sys.setswitchinterval(self.interval)
+        instruments.frame_listeners.append(self.on_frame)
+        self.sampler.start()
+
+    def stop(self):
+        self.sampler.stopped.set()
+        instruments.frame_listeners.remove(self.on_frame)
+        sys.setswitchinterval(self.switch_interval)
+
+    def on_frame(self, frame: FrameStats):
+        self.recent.append(frame)
+        if self.spike is not None:
+            self.frames_left -= 1
+            if self.frames_left <= 0:
+                self.dump()
+        elif frame.duration > self.budget_ms and self.n_dumps < self.MAX_DUMPS:
+            self.spike = frame
+            self.frames_left = self.FRAMES_AFTER
+            if self.frames_left <= 0:
+                self.dump()
+
+    def dump(self) -> Path:
+        frames = list(self.recent)
+        stacks = collections.Counter(
+            self.sampler.between(frames[0].start, frames[-1].end_time)
+        )
+        spike_stacks = collections.Counter(
+            self.sampler.between(self.spike.start, self.spike.end_time)
+        )
+
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        path = self.out_dir / f"spike-{self.spike.index}.json"
+        report = {
+            "budget_ms": self.budget_ms,
+            "spike": self.spike.as_dict(),
+            "frames": [frame.as_dict() for frame in frames],
+            "sample_interval_ms": self.interval * 1000,
+            "spike_stacks": self.folded(spike_stacks),
+            "window_stacks": self.folded(stacks),
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        # Collapsed stacks, readable by flamegraph.pl and speedscope
+        with open(path.with_suffix(".folded"), "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+        self.spike = None
+        self.n_dumps += 1
+        return path
+
+    @staticmethod
+    def folded(stacks: t.Counter) -> list[dict]:
+        return [
+            {"stack": ";".join(stack), "samples": count}
+            for stack, count in stacks.most_common()
+        ]
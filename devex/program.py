@@ -1,28 +1,29 @@
-import random
-
 import pygame
 
 from . import game_funcs
+from .assets import assets
 from .bloom import Bloom
+from .render import Layer
 from .shared import Shared
-from .utils import get_font, scale_by
+from .utils import get_font, rng
 
 
 class Code:
     FUNCS = list(m for m in dir(game_funcs) if not m.startswith("__"))
     FUNCS.remove("sources")
-    IMAGE = pygame.image.load("assets/code.png").convert_alpha()
-    IMAGE = scale_by(IMAGE, 0.025)
+    IMAGE = assets.lazy("assets/code.png", "scale_by", 0.025)
     FONT = get_font("assets/Hack/Hack Regular Nerd Font Complete Mono.ttf", 16)
 
     def __init__(self, pos) -> None:
-        self.func = getattr(game_funcs, random.choice(Code.FUNCS))
+        self.func = getattr(game_funcs, rng.choice(Code.FUNCS))
         self.get_source()
         self.parameter_data = self.func.__annotations__
         self.pos = pygame.Vector2(pos)
         self.shared = Shared()
         self.rect = self.IMAGE.get_rect(midbottom=self.pos)
         self.bloom = Bloom(0.4, wave_speed=0.01, expansion_factor=10)
+        self.light_rect = self.bloom.rect.copy()
+        self.light_rect.center = self.rect.center
         self.pickup_surf = Code.FONT.render("[F] PICKUP", True, "purple", "white")
         self.pickup_rect = self.pickup_surf.get_rect(midbottom=self.rect.midtop)
         self.near = False
@@ -46,18 +47,13 @@ class Code:
                     self.alive = False
 
     def update(self):
-        self.bloom.update(self.shared.camera.transform(self.rect.center))
         self.check_near()
         self.on_pickup()
 
     def draw(self):
-        self.shared.screen.blit(self.IMAGE, self.shared.camera.transform(self.rect))
-        self.bloom.draw(self.shared.overlay)
-
+        self.shared.render.submit(Layer.PROGRAMS, self.IMAGE, self.rect)
         if self.near:
-            self.shared.screen.blit(
-                self.pickup_surf, self.shared.camera.transform(self.pickup_rect)
-            )
+            self.shared.render.submit(Layer.PROMPTS, self.pickup_surf, self.pickup_rect)
 
 
 if __name__ == "__main__":
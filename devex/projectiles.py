@@ -0,0 +1,216 @@
+"""
+Projectiles stored as arrays.
+
+A `ProjectileBatch` keeps every live projectile of one kind in parallel NumPy
+arrays, so moving, aging, expiring and hit-testing them are a few array
+operations per tick however many there are. Only projectiles that end up on
+screen are touched one by one, to pick their sprite, and they are submitted to
+the render queue in one go.
+"""
+
+import itertools
+import typing as t
+
+import numpy as np
+import pygame
+
+from .render import Layer
+from .shared import Shared
+from .utils import rotation_cache
+
+
+class ProjectileBatch:
+    """
+    Projectiles fly straight at their own speed and expire past `RANGE`, below
+    `MIN_SPEED` or once faded below `MIN_ALPHA`. Their hitbox is the size of
+    their unrotated sprite.
+    """
+
+    LAYER = Layer.ENEMY_PROJECTILES
+    DECELERATION = 0.0
+    RANGE = np.inf
+    MIN_SPEED = -np.inf
+    # Degrees per second the sprites turn
+    SPIN = 0.0
+    # Alpha lost per second
+    FADE = 0.0
+    MIN_ALPHA = -np.inf
+    # (intensity, duration) of the screen shake when the player is hit
+    HIT_SHAKE: tuple[float, float] | None = None
+
+    FIELDS = (
+        "x",
+        "y",
+        # Position at the start of the tick, drawn positions are interpolated
+        "prev_x",
+        "prev_y",
+        "radians",
+        "speed",
+        "damage",
+        "travelled",
+        "alpha",
+        "age",
+        "ticks",
+        "half_width",
+        "half_height",
+    )
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.shared = Shared()
+        self.n = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        # What each projectile looks like, see `sprite`
+        self.sprites: list = []
+
+    def __len__(self) -> int:
+        return self.n
+
+    def grow(self):
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(len(old) * 2)
+            new[: self.n] = old[: self.n]
+            setattr(self, name, new)
+
+    def spawn(
+        self,
+        pos: t.Sequence,
+        radians: float,
+        speed: float,
+        damage: float,
+        sprite,
+        size: t.Sequence[int],
+    ):
+        if self.n == len(self.x):
+            self.grow()
+        i = self.n
+        self.x[i], self.y[i] = pos
+        self.prev_x[i], self.prev_y[i] = pos
+        self.radians[i] = radians
+        self.speed[i] = speed
+        self.damage[i] = damage
+        self.travelled[i] = self.age[i] = self.ticks[i] = 0.0
+        self.alpha[i] = 255.0
+        self.half_width[i] = size[0] / 2
+        self.half_height[i] = size[1] / 2
+        self.sprites.append(sprite)
+        self.n += 1
+
+    def clear(self):
+        self.n = 0
+        self.sprites.clear()
+
+    def step(self, dt: float):
+        n = self.n
+        speed = self.speed[:n]
+        distance = speed * dt
+        radians = self.radians[:n]
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += np.cos(radians) * distance
+        self.y[:n] += np.sin(radians) * distance
+        self.travelled[:n] += np.abs(distance)
+        self.age[:n] += dt
+        self.ticks[:n] += 1
+        if self.DECELERATION:
+            speed -= self.DECELERATION * dt
+        if self.FADE:
+            self.alpha[:n] -= self.FADE * dt
+
+    def expired(self) -> np.ndarray:
+        n = self.n
+        return (
+            (self.travelled[:n] > self.RANGE)
+            | (self.speed[:n] < self.MIN_SPEED)
+            | (self.alpha[:n] < self.MIN_ALPHA)
+        )
+
+    def overlapping(self, rect: pygame.Rect) -> np.ndarray:
+        n = self.n
+        x, y = self.x[:n], self.y[:n]
+        half_width, half_height = self.half_width[:n], self.half_height[:n]
+        return (
+            (x - half_width < rect.right)
+            & (x + half_width > rect.left)
+            & (y - half_height < rect.bottom)
+            & (y + half_height > rect.top)
+        )
+
+    def remove(self, mask: np.ndarray):
+        if not mask.any():
+            return
+        keep = ~mask
+        n = self.n
+        k = int(np.count_nonzero(keep))
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:k] = array[:n][keep]
+        self.sprites = list(itertools.compress(self.sprites, keep))
+        self.n = k
+
+    def on_hit(self, damage: float):
+        self.shared.player.modify_health(-damage)
+        if self.HIT_SHAKE is not None:
+            self.shared.ss.add(*self.HIT_SHAKE)
+
+    def update(self):
+        if not self.n:
+            return
+        self.step(self.shared.dt)
+        hits = self.overlapping(self.shared.player.rect)
+        for damage in self.damage[: self.n][hits]:
+            self.on_hit(float(damage))
+        self.remove(hits | self.expired())
+
+    def on_screen(self) -> np.ndarray:
+        """Indices of the projectiles that may be visible"""
+
+        n = self.n
+        offset_x, offset_y = self.shared.camera.render_offset
+        width, height = self.shared.SCRECT.size
+        # Rotated sprites reach past their hitbox
+        reach = np.maximum(self.half_width[:n], self.half_height[:n]) * 1.5
+        x = self.x[:n] - offset_x
+        y = self.y[:n] - offset_y
+        return np.flatnonzero(
+            (x + reach > 0)
+            & (x - reach < width)
+            & (y + reach > 0)
+            & (y - reach < height)
+        )
+
+    def sprites_at(self, indices: np.ndarray) -> list[pygame.Surface]:
+        sprites = self.sprites
+        if not self.SPIN:
+            return [sprites[i] for i in indices.tolist()]
+        angles = (self.age[indices] * self.SPIN).tolist()
+        return [
+            rotation_cache.rotate(sprites[i], angle)
+            for i, angle in zip(indices.tolist(), angles)
+        ]
+
+    def render_positions(self, indices: np.ndarray) -> tuple[list, list]:
+        """Centers between the last two ticks, at the frame's interpolation alpha"""
+
+        alpha = self.shared.alpha
+        prev_x, prev_y = self.prev_x[indices], self.prev_y[indices]
+        x = prev_x + (self.x[indices] - prev_x) * alpha
+        y = prev_y + (self.y[indices] - prev_y) * alpha
+        return x.tolist(), y.tolist()
+
+    def draw_sprites(self, indices: np.ndarray):
+        self.shared.render.submit_many(
+            self.LAYER,
+            (
+                (surf, x - surf.get_width() // 2, y - surf.get_height() // 2)
+                for surf, x, y in zip(
+                    self.sprites_at(indices), *self.render_positions(indices)
+                )
+            ),
+        )
+
+    def draw(self):
+        if not self.n:
+            return
+        self.draw_sprites(self.on_screen())
@@ -0,0 +1,143 @@
+"""
+Deferred drawing of world-space sprites.
+
+Entities submit their sprites to `shared.render` with a layer instead of
+blitting them. On flush the camera offset is applied and off-screen sprites are
+culled in one pass, then everything is sorted by layer and drawn with
+`Surface.fblits`, or `Surface.blits` where an area is needed. Within a layer
+sprites are drawn in the order they were submitted, so overlaps are stable.
+The backdrop layer is drawn untracked for the dirty-rect presenter, it only
+dirties the screen when its sprites or their positions change.
+"""
+
+import typing as t
+from enum import IntEnum, auto
+from operator import itemgetter
+
+import pygame
+
+from .assets import assets
+from .dirty import presenter
+from .shared import Shared
+
+
+class Layer(IntEnum):
+    # World art that looks the same every frame, like floors
+    BACKDROP = auto()
+    FLOOR = auto()
+    ENEMIES = auto()
+    ENEMY_PROJECTILES = auto()
+    LABELS = auto()
+    PLAYER = auto()
+    PLAYER_PROJECTILES = auto()
+    AURAS = auto()
+    TORCHES = auto()
+    PROGRAMS = auto()
+    PROMPTS = auto()
+    EFFECTS = auto()
+
+
+class RenderQueue:
+    def __init__(self) -> None:
+        self.shared = Shared()
+        # (layer, source, x, y, area, special flags)
+        self.commands: list[tuple] = []
+
+    def submit(
+        self,
+        layer: Layer,
+        surf: pygame.Surface,
+        pos: t.Sequence,
+        area: pygame.Rect | None = None,
+        flags: int = 0,
+    ):
+        """
+        pos: World-space topleft, a rect works as well.
+        area: Part of the surface to draw, all of it by default.
+        """
+
+        # Atlas sprites are drawn from their page, so they batch together
+        if area is None:
+            surf, area = assets.region(surf)
+        self.commands.append((layer, surf, pos[0], pos[1], area, flags))
+
+    def submit_many(
+        self, layer: Layer, sprites: t.Iterable[tuple[pygame.Surface, float, float]]
+    ):
+        """
+        Submits whole surfaces that aren't atlas frames, like rotated sprites.
+
+        sprites: (surface, world x, world y) with the topleft at x, y.
+        """
+
+        self.commands.extend((layer, surf, x, y, None, 0) for surf, x, y in sprites)
+
+    def flush(self, target: pygame.Surface | None = None):
+        """Draws everything submitted since the last flush"""
+
+        if not self.commands:
+            return
+        commands, self.commands = self.commands, []
+        # Stable, so submission order breaks ties within a layer
+        commands.sort(key=itemgetter(0))
+        if target is None:
+            target = self.shared.screen
+
+        offset_x, offset_y = self.shared.camera.render_offset
+        split = next(
+            (i for i, command in enumerate(commands) if command[0] != Layer.BACKDROP),
+            len(commands),
+        )
+        backdrop = None
+        if presenter.enabled:
+            backdrop = tuple(
+                (surf, x - offset_x, y - offset_y)
+                for _, surf, x, y, _, _ in commands[:split]
+            )
+        with presenter.untracked(backdrop):
+            culled = self.draw_commands(target, commands[:split])
+        culled += self.draw_commands(target, commands[split:])
+        self.shared.camera.culled += culled
+
+    def draw_commands(self, target: pygame.Surface, commands: list[tuple]) -> int:
+        """Draws sorted commands, returns how many were culled"""
+
+        offset_x, offset_y = self.shared.camera.render_offset
+        screen_width, screen_height = self.shared.SCRECT.size
+        run: list[tuple] = []
+        run_kind = None
+        culled = 0
+        for _, surf, x, y, area, flags in commands:
+            x -= offset_x
+            y -= offset_y
+            width, height = surf.get_size() if area is None else area.size
+            if (
+                x >= screen_width
+                or y >= screen_height
+                or x + width <= 0
+                or y + height <= 0
+            ):
+                culled += 1
+                continue
+
+            kind = flags, area is None
+            if kind != run_kind:
+                self.draw_run(target, run, run_kind)
+                run = []
+                run_kind = kind
+            if area is None:
+                run.append((surf, (x, y)))
+            else:
+                run.append((surf, (x, y), area, flags))
+        self.draw_run(target, run, run_kind)
+        return culled
+
+    @staticmethod
+    def draw_run(target: pygame.Surface, run: list[tuple], kind):
+        if not run:
+            return
+        flags, whole = kind
+        if whole:
+            target.fblits(run, flags)
+        else:
+            target.blits(run, False)
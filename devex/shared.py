@@ -1,4 +1,5 @@
 import ctypes
+import os
 import platform
 import subprocess
 import sys
@@ -7,17 +8,25 @@ from typing import Self
 import pygame
 
 
+HEADLESS_SIZE = 1280, 720
+
+
 def get_screen_size_linux():
     cmd = ["xrandr"]
     cmd2 = ["grep", "*"]
-    p = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    try:
+        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return HEADLESS_SIZE
     p2 = subprocess.Popen(cmd2, stdin=p.stdout, stdout=subprocess.PIPE)
     p.stdout.close()
     resolution_string, junk = p2.communicate()
-    resolution = resolution_string.split()[0]
+    if not resolution_string:
+        return HEADLESS_SIZE
+    resolution = resolution_string.split()[0].decode()
     width, height = resolution.split("x")
 
-    return width, height
+    return int(width), int(height)
 
 
 def get_screen_size_win():
@@ -35,7 +44,9 @@ class Shared:
     _inst = None
 
     # Constants
-    if sys.platform == "win32":
+    if os.environ.get("SDL_VIDEODRIVER") == "dummy":
+        SCREEN_WIDTH, SCREEN_HEIGHT = HEADLESS_SIZE
+    elif sys.platform == "win32":
         SCREEN_WIDTH, SCREEN_HEIGHT = get_screen_size_win()
     elif "linux" in sys.platform:
         SCREEN_WIDTH, SCREEN_HEIGHT = get_screen_size_linux()
@@ -47,10 +58,11 @@ class Shared:
     SCRECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
 
     screen: pygame.Surface
-    overlay: pygame.Surface
 
     events: list[pygame.event.Event]
     dt: float
+    # How far rendering is between the previous and the current simulation tick
+    alpha: float = 1.0
 
     def __new__(cls: type[Self], *args, **kwargs) -> Self:
         if Shared._inst is None:
@@ -0,0 +1,262 @@
+import typing as t
+
+import pygame
+
+
+class SpatialHash:
+    """Uniform grid broadphase over objects with a `rect` attribute"""
+
+    # Bucketing only pays off once many rects query many objects, below that
+    # `Rect.collidelistall` over every rect is faster, see benchmarks.broadphase
+    MIN_QUERIES = 150
+    MIN_PAIRS = 50_000
+
+    def __init__(self, cell_size: int = 128) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list] = {}
+        self.objects: list = []
+        self.rects: list[pygame.Rect] = []
+        self.bucketed = True
+
+    def cell_range(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        size = self.cell_size
+        return [
+            (x, y)
+            for x in range(rect.left // size, (rect.right - 1) // size + 1)
+            for y in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        ]
+
+    def clear(self):
+        self.cells.clear()
+        self.objects = []
+        self.rects = []
+
+    def insert(self, obj, rect: pygame.Rect | None = None):
+        if rect is None:
+            rect = obj.rect
+        size = self.cell_size
+        cells = self.cells
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        # Most objects are smaller than a cell and fit in one
+        if left == right and top == bottom:
+            bucket = cells.get((left, top))
+            if bucket is None:
+                cells[left, top] = [obj]
+            else:
+                bucket.append(obj)
+            return
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                bucket = cells.get((x, y))
+                if bucket is None:
+                    cells[x, y] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def rebuild(self, *groups: t.Iterable, n_queries: int | None = None):
+        """
+        n_queries: How many rects will be checked against the objects before the
+            next rebuild. Few queries skip the grid, see `colliding`.
+        """
+
+        self.clear()
+        self.objects = [obj for group in groups for obj in group]
+        self.bucketed = n_queries is None or (
+            n_queries >= self.MIN_QUERIES
+            and n_queries * len(self.objects) >= self.MIN_PAIRS
+        )
+        if not self.bucketed:
+            self.rects = [obj.rect for obj in self.objects]
+            return
+        for obj in self.objects:
+            self.insert(obj)
+
+    def colliding(self, rect: pygame.Rect) -> list:
+        """Objects from the last rebuild whose rect overlaps the given one"""
+
+        if not self.bucketed:
+            hits = rect.collidelistall(self.rects)
+            if not hits:
+                return hits
+            return [self.objects[i] for i in hits]
+        return [obj for obj in self.query(rect) if obj.rect.colliderect(rect)]
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Objects sharing at least one cell with the rect, without duplicates"""
+
+        if not self.bucketed:
+            return self.objects
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        if left == right and top == bottom:
+            return self.cells.get((left, top), [])
+
+        found = []
+        seen = set()
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                for obj in self.cells.get((x, y), ()):
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
+
+    def candidate_pairs(self, others: t.Iterable) -> t.Iterator[tuple]:
+        """Yields (other, obj) pairs that are close enough to need an exact check"""
+
+        for other in others:
+            for obj in self.query(other.rect):
+                yield other, obj
+
+    def colliding_pairs(self, others: t.Iterable) -> t.Iterator[tuple]:
+        for other, obj in self.candidate_pairs(others):
+            if other.rect.colliderect(obj.rect):
+                yield other, obj
+
+
+class SpatialIndex:
+    """Incrementally updated grid over objects with a `rect` and a `pos`"""
+
+    def __init__(self, cell_size: int = 256) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set] = {}
+        self.bounds: dict[t.Any, tuple[int, int, int, int]] = {}
+        self.cache: dict[tuple, set] = {}
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.bounds
+
+    @staticmethod
+    def cells_in(bounds: tuple[int, int, int, int]) -> t.Iterator[tuple[int, int]]:
+        left, top, right, bottom = bounds
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                yield x, y
+
+    def get_bounds(self, obj) -> tuple[int, int, int, int]:
+        """Cell bounds covering both the rect and the position of an object"""
+
+        size = self.cell_size
+        rect = obj.rect
+        x, y = obj.pos
+        return (
+            int(min(rect.left, x)) // size,
+            int(min(rect.top, y)) // size,
+            int(max(rect.right - 1, x)) // size,
+            int(max(rect.bottom - 1, y)) // size,
+        )
+
+    def update(self, obj):
+        """Inserts the object, or moves it if it changed cells since last time"""
+
+        # Its position may have moved in or out of a cached radius
+        self.clear_cache()
+        bounds = self.get_bounds(obj)
+        old_bounds = self.bounds.get(obj)
+        if bounds == old_bounds:
+            return
+        if old_bounds is not None:
+            self.remove(obj)
+
+        self.bounds[obj] = bounds
+        for cell in self.cells_in(bounds):
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = {obj}
+            else:
+                bucket.add(obj)
+
+    def remove(self, obj):
+        bounds = self.bounds.pop(obj, None)
+        if bounds is None:
+            return
+        self.clear_cache()
+        for cell in self.cells_in(bounds):
+            bucket = self.cells[cell]
+            bucket.discard(obj)
+            if not bucket:
+                del self.cells[cell]
+
+    def clear_cache(self):
+        if self.cache:
+            self.cache.clear()
+
+    def candidates(self, center: t.Sequence, radius: float) -> set:
+        size = self.cell_size
+        left = int(center[0] - radius) // size
+        top = int(center[1] - radius) // size
+        right = int(center[0] + radius) // size
+        bottom = int(center[1] + radius) // size
+
+        found = set()
+        if (right - left + 1) * (bottom - top + 1) > len(self.cells):
+            for (x, y), bucket in self.cells.items():
+                if left <= x <= right and top <= y <= bottom:
+                    found |= bucket
+            return found
+
+        for cell in self.cells_in((left, top, right, bottom)):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                found |= bucket
+        return found
+
+    def query_point(self, point: t.Sequence) -> list:
+        """Objects whose rect contains the point"""
+
+        cell = int(point[0]) // self.cell_size, int(point[1]) // self.cell_size
+        return [obj for obj in self.cells.get(cell, ()) if obj.rect.collidepoint(point)]
+
+    def query_radius(self, center: t.Sequence, radius: float) -> list:
+        """Objects whose position is closer than the radius"""
+
+        radius_sq = radius * radius
+        return [
+            obj
+            for obj in self.candidates(center, radius)
+            if obj.pos.distance_squared_to(center) < radius_sq
+        ]
+
+    def near(self, center: t.Sequence, radius: float) -> set:
+        """Same as `query_radius`, cached until an object is updated or removed"""
+
+        key = center[0], center[1], radius
+        found = self.cache.get(key)
+        if found is None:
+            found = set(self.query_radius(center, radius))
+            self.cache[key] = found
+        return found
+
+    def k_nearest(
+        self, center: t.Sequence, k: int, max_radius: float | None = None
+    ) -> list:
+        """Up to k objects sorted by distance, optionally capped by a radius"""
+
+        if k <= 0 or not self.bounds:
+            return []
+
+        radius = self.cell_size
+        while True:
+            if max_radius is not None and radius >= max_radius:
+                radius = max_radius
+            found = self.candidates(center, radius)
+            by_distance = sorted(
+                (obj.pos.distance_squared_to(center), id(obj), obj) for obj in found
+            )
+            in_radius = [obj for dist, _, obj in by_distance if dist <= radius**2]
+            if (
+                len(in_radius) >= k
+                or radius == max_radius
+                or len(found) == len(self.bounds)
+            ):
+                break
+            radius *= 2
+
+        if max_radius is None:
+            return [obj for _, _, obj in by_distance[:k]]
+        return in_radius[:k]
@@ -0,0 +1,161 @@
+"""
+Pre-scaled, pre-converted sprites baked into one memory-mapped file.
+
+The pack starts with a magic number and a JSON index, followed by the BGRA
+pixels of every sprite. Surfaces are made with `pygame.image.frombuffer` over a
+copy-on-write mapping of the file, so opening the pack decodes and copies
+nothing. Sprites whose source file changed since the bake are left out and
+decoded as usual. Sources are only read and hashed when their size matches the
+bake but their modification time does not.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import typing as t
+
+import pygame
+
+PACK_PATH = "assets/sprites.pack"
+
+Key = tuple[str, bool, tuple]
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def source_record(path: str) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": file_hash(path)}
+
+
+def is_stale(path: str, record: dict) -> bool:
+    """Whether a source changed since it was recorded"""
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return True
+    if stat.st_size != record["size"]:
+        return True
+    if stat.st_mtime_ns == record["mtime_ns"]:
+        return False
+    # Touched, for example by a checkout, the contents decide
+    return file_hash(path) != record["sha1"]
+
+
+class SpritePack:
+    MAGIC = b"DVXPACK2"
+    HEADER = struct.Struct("<8sI")
+    ALIGN = 64
+    FORMAT = "BGRA"
+
+    def __init__(self, path: str = PACK_PATH) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            # Private mapping, so drawing onto a packed surface never hits the file
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.map)
+
+        magic, index_size = self.HEADER.unpack_from(self.map)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a sprite pack")
+        index = json.loads(bytes(self.view[self.HEADER.size :][:index_size]))
+        self.data_start = self.align(self.HEADER.size + index_size)
+
+        changed = {
+            source
+            for source, record in index["sources"].items()
+            if is_stale(source, record)
+        }
+        self.entries: dict[Key, dict] = {}
+        self.n_stale = 0
+        for entry in index["entries"]:
+            if entry["path"] in changed:
+                self.n_stale += 1
+                continue
+            self.entries[self.make_key(entry)] = entry
+
+    @classmethod
+    def align(cls, size: int) -> int:
+        return size + -size % cls.ALIGN
+
+    @staticmethod
+    def make_key(entry: dict) -> Key:
+        return entry["path"], True, tuple(entry["transform"])
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def surface(self, key: Key) -> pygame.Surface | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        width, height = entry["size"]
+        start = self.data_start + entry["offset"]
+        surf = pygame.image.frombuffer(
+            self.view[start : start + width * height * 4], (width, height), self.FORMAT
+        )
+        if entry.get("alpha") is not None:
+            surf.set_alpha(entry["alpha"])
+        return surf
+
+    @classmethod
+    def bake(
+        cls,
+        keys: t.Iterable[Key],
+        decode: t.Callable[[Key], pygame.Surface],
+        path: str = PACK_PATH,
+    ) -> int:
+        """
+        Writes the decoded surfaces of the keys to a new pack, returning the
+        number of sprites. Only per-pixel alpha surfaces can be packed.
+        """
+
+        entries = []
+        blobs = []
+        offset = 0
+        for key in sorted(keys, key=repr):
+            source, alpha, transform = key
+            if not alpha:
+                continue
+            surf = decode(key)
+            entry = {
+                "path": source,
+                "transform": list(transform),
+                "size": list(surf.get_size()),
+                "offset": offset,
+            }
+            if surf.get_alpha() not in (None, 255):
+                entry["alpha"] = surf.get_alpha()
+            blob = pygame.image.tobytes(surf, cls.FORMAT)
+            offset += cls.align(len(blob))
+            entries.append(entry)
+            blobs.append(blob)
+
+        sources = {entry["path"] for entry in entries}
+        index = json.dumps(
+            {
+                "sources": {
+                    source: source_record(source) for source in sorted(sources)
+                },
+                "entries": entries,
+            }
+        ).encode()
+        with open(path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, len(index)))
+            f.write(index)
+            f.write(bytes(cls.align(f.tell()) - f.tell()))
+            for blob in blobs:
+                f.write(blob)
+                f.write(bytes(cls.align(len(blob)) - len(blob)))
+
+        return len(entries)
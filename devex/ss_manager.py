@@ -1,9 +1,8 @@
-import random
-import time
 from dataclasses import dataclass
 
+from .entities import EntityList
 from .shared import Shared
-from .utils import Time
+from .utils import rng, sim_clock
 
 
 @dataclass
@@ -12,27 +11,27 @@ class ScreenShake:
     magnitude: float
 
     def __post_init__(self):
-        self.start = time.time()
+        self.start = sim_clock.now
 
     def create_offset(self):
         self.offset = (
-            random.uniform(-1, 1) * self.magnitude,
-            random.uniform(-1, 1) * self.magnitude,
+            rng.uniform(-1, 1) * self.magnitude,
+            rng.uniform(-1, 1) * self.magnitude,
         )
 
 
 class ScreenShakeManager:
     def __init__(self) -> None:
         self.shared = Shared(ss=self)
-        self.shakes: list[ScreenShake] = []
+        self.shakes: EntityList[ScreenShake] = EntityList()
 
     def add(self, time: float, magnitude: float):
-        self.shakes.append(ScreenShake(time, magnitude))
+        self.shakes.add(ScreenShake(time, magnitude))
 
     def filter_shakes(self):
-        for shake in self.shakes[:]:
-            if time.time() - shake.start > shake.time:
-                self.shakes.remove(shake)
+        for handle, shake in self.shakes.items():
+            if sim_clock.now - shake.start > shake.time:
+                self.shakes.remove(handle)
 
     def order_shakes(self):
         self.shakes.sort(key=lambda shake: shake.magnitude)
@@ -41,8 +40,9 @@ class ScreenShakeManager:
         if not self.shakes:
             return
 
-        self.shakes[-1].create_offset()
-        self.shared.camera.offset += self.shakes[-1].offset
+        shake = self.shakes.last()
+        shake.create_offset()
+        self.shared.camera.offset += shake.offset
 
     def update(self):
         self.filter_shakes()
@@ -6,6 +6,7 @@ from .gameoverstate import GameOverState
 from .gamestate import GameState
 from .menustate import MenuState
 from .state_enums import State
+from .trace import tracer
 from .tutorialstate import TutorialState
 from .victorystate import VictoryState
 
@@ -23,8 +24,7 @@ class StateLike(t.Protocol):
 class StateManager:
     def __init__(self) -> None:
         self.__state_enum = State.MENU
-        pygame.mixer.music.load("assets/Ringside - Dyalla.mp3")
-        pygame.mixer.music.play(-1, fade_ms=5000)
+        self.play_music("assets/Ringside - Dyalla.mp3", -1, fade_ms=5000)
         self.state_dict: dict[State, StateLike] = {
             State.MENU: MenuState,
             State.TUTORIAL: TutorialState,
@@ -34,29 +34,45 @@ class StateManager:
         }
         self.state_obj: StateLike = self.state_dict.get(self.state_enum)()
 
+    @staticmethod
+    def play_music(path: str, loops: int = 0, fade_ms: int = 0):
+        """Plays a track, carrying on silently if it or the audio device is missing"""
+
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        except (pygame.error, FileNotFoundError):
+            pass
+
     @property
     def state_enum(self) -> State:
         return self.__state_enum
 
     @state_enum.setter
+    @tracer.traced("state", "StateManager.state_enum")
     def state_enum(self, next_state: State) -> None:
+        tracer.instant(
+            f"{self.__state_enum.name} -> {next_state.name}",
+            "state",
+            previous=self.__state_enum.name,
+            next=next_state.name,
+        )
         self.__state_enum = next_state
         self.state_obj: StateLike = self.state_dict.get(self.__state_enum)()
 
         if next_state == State.MENU:
-            pygame.mixer.music.load("assets/Ringside - Dyalla.mp3")
-            pygame.mixer.music.play(-1, fade_ms=5000)
+            self.play_music("assets/Ringside - Dyalla.mp3", -1, fade_ms=5000)
         elif next_state == State.GAME:
-            pygame.mixer.music.load("assets/Soulicious - Dyalla.mp3")
-            pygame.mixer.music.play(-1, fade_ms=5000)
+            self.play_music("assets/Soulicious - Dyalla.mp3", -1, fade_ms=5000)
         elif next_state == State.GAME_OVER:
-            pygame.mixer.music.load("assets/Goddess of the Sea - Jimena Contreras.mp3")
-            pygame.mixer.music.play(-1, fade_ms=5000)
+            self.play_music(
+                "assets/Goddess of the Sea - Jimena Contreras.mp3", -1, fade_ms=5000
+            )
         elif next_state == State.VICTORY:
-            pygame.mixer.music.load("assets/Put It - TrackTribe.mp3")
-            pygame.mixer.music.play(-1)
+            self.play_music("assets/Put It - TrackTribe.mp3", -1)
         elif next_state == State.TUTORIAL:
-            pygame.mixer.music.stop()
+            if pygame.mixer.get_init():
+                pygame.mixer.music.stop()
 
     def update(self):
         self.state_obj.update()
@@ -0,0 +1,113 @@
+"""
+Cached text rendering.
+
+`text_cache.render` stands in for `Font.render`. Rendered strings are kept in a
+bounded LRU, and short strings made only of `GlyphAtlas.CHARSET` characters,
+like timers and counts, are composed from glyphs rasterized once per font and
+color instead of being rasterized whole. Only transparent text in monospace
+fonts is composed: the glyphs of proportional fonts are kerned, and `Font.render`
+blends text onto a background into an 8-bit surface, so neither would match.
+"""
+
+import string
+import typing as t
+
+import pygame
+
+from .utils import SurfaceCache
+
+
+def color_key(color) -> t.Hashable:
+    if color is None or isinstance(color, (str, tuple)):
+        return color
+    return tuple(color)
+
+
+class GlyphAtlas:
+    """
+    Antialiased glyphs of one font and color, side by side on one strip.
+    Composed text matches `Font.render` only when `monospace` is set.
+    """
+
+    CHARSET = string.digits + " .,:+-/%x"
+
+    def __init__(self, font: pygame.font.Font, color) -> None:
+        self.font = font
+        self.height = font.get_height()
+        # Glyph to its subsurface of the strip and how far it moves the pen
+        self.glyphs: dict[str, tuple[pygame.Surface, int]] = {}
+
+        surfs = [font.render(char, True, color) for char in self.CHARSET]
+        metrics = font.metrics(self.CHARSET)
+        width = sum(surf.get_width() for surf in surfs)
+        self.strip = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        x = 0
+        for char, surf, metric in zip(self.CHARSET, surfs, metrics):
+            area = self.strip.blit(surf, (x, 0))
+            advance = metric[4] if metric is not None else surf.get_width()
+            self.glyphs[char] = self.strip.subsurface(area), advance
+            x += surf.get_width()
+        self.monospace = len({advance for _, advance in self.glyphs.values()}) == 1
+
+    def covers(self, text: str) -> bool:
+        return all(char in self.glyphs for char in text)
+
+    def compose(self, text: str) -> pygame.Surface:
+        width = sum(self.glyphs[char][1] for char in text)
+        surf = pygame.Surface((width, self.height), pygame.SRCALPHA)
+
+        blits = []
+        x = 0
+        for char in text:
+            glyph, advance = self.glyphs[char]
+            blits.append((glyph, (x, 0)))
+            x += advance
+        surf.fblits(blits)
+        return surf
+
+
+class TextCache(SurfaceCache):
+    """Rendered strings keyed by (font, text, antialias, color, background).
+
+    Returned surfaces are shared, copy them before mutating.
+    """
+
+    # Longer strings are rarely numbers, rasterizing them whole is as fast
+    MAX_GLYPH_TEXT = 12
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024) -> None:
+        super().__init__(max_bytes)
+        self.atlases: dict[tuple, GlyphAtlas] = {}
+
+    def clear(self):
+        super().clear()
+        self.atlases.clear()
+
+    def atlas(self, font: pygame.font.Font, color) -> GlyphAtlas:
+        key = font, color_key(color)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color,
+        bg=None,
+    ) -> pygame.Surface:
+        key = font, text, antialias, color_key(color), color_key(bg)
+        surf = self.lookup(key)
+        if surf is not None:
+            return surf
+
+        if antialias and bg is None and text and len(text) <= self.MAX_GLYPH_TEXT:
+            atlas = self.atlas(font, color)
+            if atlas.monospace and atlas.covers(text):
+                return self.store(key, atlas.compose(text))
+        return self.store(key, font.render(text, antialias, color, bg))
+
+
+text_cache = TextCache()
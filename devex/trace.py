@@ -0,0 +1,156 @@
+"""
+Timeline recording in the Chrome trace-event format.
+
+The written JSON opens in https://ui.perfetto.dev or chrome://tracing. Spans
+are recorded per thread, so work moved off the main thread shows up on its own
+track.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import typing as t
+
+import pygame
+
+
+class Span:
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: dict) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = self.tracer.now()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.cat, self.start, self.args)
+
+
+class NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class Tracer:
+    # Roughly 200 MB of JSON, recording stops past this
+    MAX_EVENTS = 1_000_000
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.path: str | None = None
+        self.events: list[dict] = []
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.null_span = NullSpan()
+        self.image_load = pygame.image.load
+
+    def now(self) -> float:
+        """Microseconds since the tracer was created"""
+
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+    def start(self, path: str):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.path = path
+
+        # Looked up on the module at every call, so this catches every asset
+        @functools.wraps(self.image_load)
+        def image_load(file, *args, **kwargs):
+            with self.span("image.load", "asset", path=str(file)):
+                return self.image_load(file, *args, **kwargs)
+
+        pygame.image.load = image_load
+        atexit.register(self.save)
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        pygame.image.load = self.image_load
+        self.save()
+        atexit.unregister(self.save)
+
+    def add(self, event: dict):
+        if len(self.events) >= self.MAX_EVENTS:
+            return
+        event["pid"] = self.pid
+        event["tid"] = threading.get_ident()
+        self.events.append(event)
+
+    def complete(self, name: str, cat: str, start: float, args: dict | None = None):
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start}
+        event["dur"] = self.now() - start
+        if args:
+            event["args"] = args
+        self.add(event)
+
+    def instant(self, name: str, cat: str, **args):
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": cat, "ph": "i", "s": "g", "ts": self.now()}
+        if args:
+            event["args"] = args
+        self.add(event)
+
+    def span(self, name: str, cat: str, **args) -> Span | NullSpan:
+        if not self.enabled:
+            return self.null_span
+        return Span(self, name, cat, args)
+
+    def traced(self, cat: str, name: str | None = None) -> t.Callable:
+        """Decorator recording every call of a function as a span"""
+
+        def decorator(func: t.Callable) -> t.Callable:
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = self.now()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.complete(label, cat, start)
+
+            return wrapper
+
+        return decorator
+
+    def thread_names(self) -> list[dict]:
+        return [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": thread.ident,
+                "args": {"name": thread.name},
+            }
+            for thread in threading.enumerate()
+        ]
+
+    def save(self):
+        if self.path is None:
+            return
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "traceEvents": self.thread_names() + self.events,
+                    "displayTimeUnit": "ms",
+                },
+                f,
+            )
+
+
+tracer = Tracer()
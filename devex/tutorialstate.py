@@ -2,9 +2,10 @@ from pathlib import Path
 
 import pygame
 
+from .dirty import presenter
 from .shared import Shared
 from .state_enums import State
-from .utils import get_font, render_at
+from .utils import get_font, render_at, set_cursor
 from .widgets import Widgets
 
 
@@ -85,7 +86,8 @@ ENTER - Main Menu
         self.current_pic = self.pics[self.pic_index]
 
     def draw(self):
-        render_at(self.shared.screen, self.current_pic, "center")
+        with presenter.untracked(self.current_pic):
+            render_at(self.shared.screen, self.current_pic, "center")
         render_at(self.shared.screen, self.page_surf, "midtop")
         render_at(self.shared.screen, self.info_surf, "topright")
 
@@ -94,7 +96,7 @@ class TutorialState:
     REQUIRED_FIELDS = ["screen"]
 
     def __init__(self) -> None:
-        pygame.mouse.set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         self.next_state = None
         self.shared = Shared()
         self.clean_shared_data()
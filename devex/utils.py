@@ -1,22 +1,49 @@
 import itertools
 import math
-import time
+import random
 import typing as t
+from collections import OrderedDict
 from functools import lru_cache
 
 import pygame
 
+# Seed this to reproduce the same world and enemy behavior
+rng = random.Random()
+
+
+class SimClock:
+    """Simulation time, advanced by the game loop one fixed tick at a time"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def advance(self, dt: float):
+        self.now += dt
+
+
+sim_clock = SimClock()
+
+
+def set_cursor(*args):
+    """`pygame.mouse.set_cursor` that tolerates drivers without cursors"""
+
+    try:
+        pygame.mouse.set_cursor(*args)
+    except pygame.error:
+        pass
+
 
 class Projectile:
     def __init__(self, radians: float, speed: float) -> None:
         self.radians = radians
         self.speed = speed
+        self.dv = pygame.Vector2()
 
     def get_delta_velocity(self, dt: float):
         self.dx = math.cos(self.radians) * self.speed * dt
         self.dy = math.sin(self.radians) * self.speed * dt
 
-        self.dv = pygame.Vector2(self.dx, self.dy)
+        self.dv.update(self.dx, self.dy)
 
 
 class SinWave:
@@ -39,14 +66,14 @@ class Time:
 
     def __init__(self, time_to_pass: float):
         self.time_to_pass = time_to_pass
-        self.start = time.perf_counter()
+        self.start = sim_clock.now
 
     def reset(self):
-        self.start = time.perf_counter()
+        self.start = sim_clock.now
 
     def tick(self) -> bool:
-        if time.perf_counter() - self.start > self.time_to_pass:
-            self.start = time.perf_counter()
+        if sim_clock.now - self.start > self.time_to_pass:
+            self.start = sim_clock.now
             return True
         return False
 
@@ -58,13 +85,13 @@ class TimeOnce:
 
     def __init__(self, time_to_pass: float):
         self.time_to_pass = time_to_pass
-        self.start = time.perf_counter()
+        self.start = sim_clock.now
 
     def reset(self):
-        self.start = time.perf_counter()
+        self.start = sim_clock.now
 
     def tick(self) -> bool:
-        if time.perf_counter() - self.start > self.time_to_pass:
+        if sim_clock.now - self.start > self.time_to_pass:
             return True
         return False
 
@@ -77,6 +104,12 @@ class Animation:
         self.timer = Time(time_between_frames)
         self.current_frame = next(self.frames)
 
+    def restart(self, frames: t.Sequence[pygame.Surface], time_between_frames: float):
+        self.frames = itertools.cycle(frames)
+        self.timer.time_to_pass = time_between_frames
+        self.timer.reset()
+        self.current_frame = next(self.frames)
+
     def get_next_frame(self):
         self.current_frame = next(self.frames)
 
@@ -98,6 +131,20 @@ class PlayItOnceAnimation(Animation):
         self.index = 0
         self.done = False
 
+    def reset(
+        self,
+        frames: t.Sequence[pygame.Surface],
+        time_between_frames: float,
+        pos: t.Sequence,
+    ):
+        """Plays a pooled animation again"""
+
+        self.n_frames = len(frames)
+        self.pos = pos
+        self.restart(frames, time_between_frames)
+        self.index = 0
+        self.done = False
+
     def get_next_frame(self):
         if self.done:
             return
@@ -107,11 +154,19 @@ class PlayItOnceAnimation(Animation):
             self.done = True
 
 
-@lru_cache
+@lru_cache(maxsize=32)
 def get_font(file_name: str | None, size: t.Sequence) -> pygame.font.Font:
     return pygame.font.Font(file_name, size)
 
 
+def render_offset(
+    prev_pos: pygame.Vector2, pos: pygame.Vector2, alpha: float
+) -> pygame.Vector2:
+    """Offset from the current position to the one interpolated by `alpha`"""
+
+    return prev_pos.lerp(pos, alpha) - pos
+
+
 def circle_surf(radius: float, color) -> pygame.Surface:
     surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
     pygame.draw.circle(surf, color, (radius, radius), radius)
@@ -154,6 +209,16 @@ def iso_to_screen(iso_pos: t.Sequence, tile_rect: pygame.Rect) -> t.Sequence:
     return screen_x, screen_y
 
 
+def screen_to_iso(screen_pos: t.Sequence, tile_rect: pygame.Rect) -> t.Sequence:
+    """Converts screen space to isometric position, inverse of `iso_to_screen`"""
+
+    x, y = screen_pos
+    x_minus_y = x / (tile_rect.width / 2)
+    x_plus_y = y / (tile_rect.height / 4)
+
+    return (x_plus_y + x_minus_y) / 2, (x_plus_y - x_minus_y) / 2
+
+
 def load_scale_3(file_path: str) -> pygame.Surface:
     img = pygame.image.load(file_path).convert_alpha()
     return pygame.transform.scale(img, (img.get_width() * 3, img.get_height() * 3))
@@ -169,3 +234,106 @@ def scale_add(img: pygame.Surface, term: float | int) -> pygame.Surface:
     return pygame.transform.scale(
         img, (img.get_width() + term, img.get_height() + term)
     )
+
+
+class SurfaceCache:
+    """Bounded LRU of derived surfaces, capped by the memory of their pixels.
+
+    Returned surfaces are shared, copy them before mutating.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.surfs: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def clear(self):
+        self.surfs.clear()
+        self.n_bytes = 0
+
+    def lookup(self, key: tuple) -> pygame.Surface | None:
+        surf = self.surfs.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.surfs.move_to_end(key)
+        return surf
+
+    def store(self, key: tuple, surf: pygame.Surface) -> pygame.Surface:
+        self.surfs[key] = surf
+        self.n_bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        while self.n_bytes > self.max_bytes and len(self.surfs) > 1:
+            _, old = self.surfs.popitem(last=False)
+            self.n_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+
+        return surf
+
+
+class ScaleCache(SurfaceCache):
+    """Scaled surfaces keyed by (source surface, target size).
+
+    Target sizes are truncated to a multiple of `step` so that sizes driven by a
+    `SinWave` collapse into a small set of reusable surfaces.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__(max_bytes)
+
+    def scale(
+        self, img: pygame.Surface, size: t.Sequence, step: int = 1
+    ) -> pygame.Surface:
+        key = img, int(size[0] / step) * step, int(size[1] / step) * step
+        surf = self.lookup(key)
+        if surf is None:
+            surf = self.store(key, pygame.transform.scale(img, key[1:]))
+        return surf
+
+
+class RotationCache(SurfaceCache):
+    """Rotated surfaces keyed by (source surface, angle bucket)"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, step: int = 5) -> None:
+        super().__init__(max_bytes)
+        self.step = step
+
+    def rotate(self, img: pygame.Surface, degrees: float) -> pygame.Surface:
+        angle = (round(degrees / self.step) * self.step) % 360
+        key = img, angle
+        surf = self.lookup(key)
+        if surf is None:
+            surf = self.store(key, pygame.transform.rotate(img, angle))
+        return surf
+
+
+class AlphaCache(SurfaceCache):
+    """Copies of surfaces with a surface alpha, keyed by (source surface, alpha bucket)"""
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, step: int = 8) -> None:
+        super().__init__(max_bytes)
+        self.step = step
+
+    def with_alpha(self, img: pygame.Surface, alpha: float) -> pygame.Surface:
+        alpha = int(max(0, min(alpha, 255)) / self.step) * self.step
+        key = img, alpha
+        surf = self.lookup(key)
+        if surf is None:
+            surf = img.copy()
+            surf.set_alpha(alpha)
+            surf = self.store(key, surf)
+        return surf
+
+
+scale_cache = ScaleCache()
+rotation_cache = RotationCache()
+alpha_cache = AlphaCache()
@@ -3,9 +3,10 @@ import time
 
 import pygame
 
+from .dirty import presenter
 from .shared import Shared
 from .state_enums import State
-from .utils import Time, get_font, render_at
+from .utils import Time, get_font, render_at, set_cursor
 from .widgets import Widgets
 
 
@@ -23,17 +24,18 @@ class PreviewLastGame:
             self.current_pic = next(self.pics)
 
     def draw(self):
-        self.shared.screen.blit(
-            self.current_pic,
-            (0, 0),
-        )
+        with presenter.untracked(self.current_pic):
+            self.shared.screen.blit(
+                self.current_pic,
+                (0, 0),
+            )
 
 
 class VictoryState:
     REQUIRED_FIELDS = ["screen", "start_time", "gameplay_pics"]
 
     def __init__(self) -> None:
-        pygame.mouse.set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         self.next_state = None
         self.shared = Shared()
         self.clean_shared_data()
@@ -1,14 +1,17 @@
-import random
 from dataclasses import dataclass, field
 from typing import Any, Protocol, Sequence
 
 import pygame
 
+from .assets import assets
 from .camera import Camera
 from .cursor import CursorState
+from .dirty import presenter
 from .enemies import BeeList, CentiSet, HumanStr, PoopyBytes, PotatoInt, ShroomDict
 from .shared import Shared
-from .utils import get_font, load_scale_3, render_at
+from .text import text_cache
+from .trace import tracer
+from .utils import get_font, render_at, rng
 
 
 class Widget(Protocol):
@@ -261,7 +264,7 @@ class InventoryWidget:
     IDEAL_POS = 0, 0
     FONT = get_font("assets/Hack/Hack Bold Nerd Font Complete Mono.ttf", 16)
     ITEM_SPACING = 20
-    IMAGES = load_scale_3("assets/gold.png"), load_scale_3("assets/pyrite.png")
+    IMAGES = assets.lazy_frames(("assets/gold.png", "assets/pyrite.png"), "scale_by", 3)
 
     def __init__(self, pos) -> None:
         self.shared = Shared()
@@ -289,7 +292,9 @@ class InventoryWidget:
             surf.fill((40, 40, 40))
             if len(values) > 0:
                 surf.blit(enemy_t.IMAGE, (0, 0))
-                font_surf = self.FONT.render(str(len(values)), True, "yellow")
+                font_surf = text_cache.render(
+                    self.FONT, str(len(values)), True, "yellow"
+                )
                 render_at(surf, font_surf, "bottomright")
 
             x = (surf.get_width() + InventoryWidget.ITEM_SPACING) * index
@@ -313,8 +318,11 @@ class InventoryWidget:
             surf.fill((40, 40, 40))
 
             surf.blit(self.IMAGES[index], (0, 0))
-            font_surf = self.FONT.render(
-                (str(self.shared.gold), str(self.shared.pyrite))[index], True, "green"
+            font_surf = text_cache.render(
+                self.FONT,
+                (str(self.shared.gold), str(self.shared.pyrite))[index],
+                True,
+                "green",
             )
             render_at(surf, font_surf, "bottomright")
             x = (surf.get_width() + InventoryWidget.ITEM_SPACING) * index
@@ -373,7 +381,7 @@ class InventoryWidget:
                 self.construct()
 
     def draw(self):
-        self.shared.screen.blit(self.surf, self.pos)
+        presenter.blit_retained(self.shared.screen, self.surf, self.pos)
         self.conv_btn.draw()
 
 
@@ -414,7 +422,7 @@ class MessageLogWidget:
     def draw(self):
         self.surf.fill((60, 60, 60))
         self.bar.draw()
-        self.shared.screen.blit(self.surf, self.pos)
+        presenter.blit_retained(self.shared.screen, self.surf, self.pos)
 
 
 class OptionBox:
@@ -443,7 +451,9 @@ class OptionBox:
     def fill_color_blit(self, color, fcolor="white"):
         self.surf.fill(color)
         self.surf.blit(self.enemy_t.IMAGE.subsurface(pygame.Rect(0, 0, 48, 48)), (0, 0))
-        self.surf.blit(self.FONT.render(str(self.value), True, fcolor), (60, 0))
+        self.surf.blit(
+            text_cache.render(self.FONT, str(self.value), True, fcolor), (60, 0)
+        )
 
     def update(self, drect):
         self.rect.topleft = drect.topleft + self.pos - (self.rect.width, 0)
@@ -621,15 +631,16 @@ class ExecuteButton:
 
     def gen_gold(self):
         self.shared.current_program.func(**self.shared.selected_values)
-        gold_gained = random.randrange(1, 8)
+        gold_gained = rng.randrange(1, 8)
         self.shared.gold += gold_gained
         self.shared.messages.append(f"Gained {gold_gained} gold")
 
     def gen_pyrite(self):
-        gained = random.randrange(3, 15)
+        gained = rng.randrange(3, 15)
         self.shared.pyrite += gained
         self.shared.messages.append(f"Gained {gained} pyrite")
 
+    @tracer.traced("program")
     def on_execution(self):
         try:
             self.gen_gold()
@@ -723,7 +734,7 @@ class ProgramWidget:
         if self.arg_widget is not None:
             self.arg_widget.draw()
         self.scroll_bar.draw()
-        self.shared.screen.blit(self.surf, self.pos)
+        presenter.blit_retained(self.shared.screen, self.surf, self.pos)
 
 
 class MiniMapWidget:
@@ -764,7 +775,7 @@ class MiniMapWidget:
         for platform in self.shared.plat.platforms:
             self.render_platform(platform)
 
-        self.shared.screen.blit(self.surf, self.pos)
+        presenter.blit_retained(self.shared.screen, self.surf, self.pos)
 
 
 class ConvertButton: